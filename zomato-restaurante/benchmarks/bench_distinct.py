@@ -0,0 +1,111 @@
+"""
+Benchmark das contagens distintas aproximadas (fome_zero.sketch).
+
+Replica o zomato.csv em escalas crescentes e compara, para as consultas de
+contagem distinta das páginas (métricas da Main Page, restaurantes e
+cidades por país, restaurantes e culinárias por cidade), o motor exato com
+o modo aproximado por sketches HyperLogLog. Registra o custo único de
+montar os sketches, a memória deles, o tempo das consultas e os erros
+relativos médio e máximo observados, ao lado do erro padrão documentado.
+Em grupos pequenos (cidades com poucos restaurantes), um erro de uma unidade
+já é um erro relativo alto.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_distinct.py --scales 1 10 100 --engine pandas
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from common import DEFAULT_CSV, best_of, scale_dataset
+from fome_zero.filter_index import build_filter_index
+from fome_zero.query_engine import DuckDBEngine, PandasEngine
+from fome_zero.ranking import build_rank_index
+from fome_zero.sketch import (SKETCH_COLUMNS, SKETCH_GROUPS, SketchEngine, build_sketches,
+                              standard_error)
+from fome_zero.snapshot import SNAPSHOT_DIR, load_snapshot, load_snapshot_cube, source_fingerprint
+
+# Consultas de contagem distinta feitas pelas páginas
+QUERIES = [
+    ('count_distinct', ('country',)),
+    ('count_values', ('country', 'city')),
+    ('count_distinct', (['city', 'country'],)),
+    ('count_values', (['city', 'country'], 'cuisines'))
+]
+
+# =====================================================================
+# MEDIÇÃO
+# =====================================================================
+
+
+def run_queries(engine, countries):
+    results = [engine.metrics(countries)]
+    for method, args in QUERIES:
+        results.append(getattr(engine, method)(*args, countries))
+    return results
+
+
+def relative_errors(exact, approx):
+    """
+    Erros relativos das estimativas em relação às contagens exatas.
+    """
+    errors = [abs(approx[0][k] - v) / v for k, v in exact[0].items() if v]
+    for expected, estimated in zip(exact[1:], approx[1:]):
+        expected, estimated = expected.align(estimated, fill_value=0)
+        errors.extend((abs(estimated - expected) / expected.clip(lower=1)).tolist())
+    return np.array(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--engine', choices=['pandas', 'duckdb'], default='pandas')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df_base = pd.read_csv(args.csv)
+    bounds = ", ".join(f"{'/'.join(keys)} {standard_error(precision):.2%}"
+                       for keys, (precision, _) in SKETCH_GROUPS.items())
+    print(f"Erro padrão documentado: {bounds}")
+    print(f"{'escala':>7} {'linhas':>10} {'montagem':>9} {'memória':>9} "
+          f"{'exato':>9} {'aprox.':>9} {'erro médio':>11} {'erro máx.':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            csv_path = os.path.join(tmp, 'zomato.csv')
+            scale_dataset(df_base, scale).to_csv(csv_path, index=False)
+            fingerprint = source_fingerprint(csv_path)
+            df = load_snapshot(csv_path, fingerprint)
+            if args.engine == 'duckdb':
+                engine = DuckDBEngine(csv_path, fingerprint)
+            else:
+                cube = load_snapshot_cube(csv_path, fingerprint)
+                engine = PandasEngine(df, cube, build_filter_index(df), build_filter_index(cube),
+                                      build_rank_index(df))
+
+            countries = engine.countries()
+            t_build, sketches = best_of(lambda: build_sketches(df[SKETCH_COLUMNS]), 1)
+            sketch_bytes = sum(registers.nbytes for keys in SKETCH_GROUPS
+                               for registers in sketches[keys]['registers'].values())
+            approx_engine = SketchEngine(engine, sketches)
+
+            t_exact, exact = best_of(lambda: run_queries(engine, countries), args.repeat)
+            t_approx, approx = best_of(lambda: run_queries(approx_engine, countries), args.repeat)
+            errors = relative_errors(exact, approx)
+            print(f"{scale:>6}x {len(df):>10,} {t_build:>8.3f}s {sketch_bytes / 2**20:>7.2f}MB "
+                  f"{t_exact * 1000:>7.2f}ms {t_approx * 1000:>7.2f}ms "
+                  f"{errors.mean():>11.2%} {errors.max():>10.2%}")
+
+            if args.engine == 'duckdb':
+                engine.con.close()
+            shutil.rmtree(os.path.join(tmp, SNAPSHOT_DIR))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark da exportação em partes (fome_zero.export).
+
+Replica o zomato.csv na escala pedida, grava o snapshot e exporta todos os
+países em CSV e Parquet de duas formas:
+- em memória: filtra o DataFrame e gera o arquivo inteiro (to_csv /
+  to_parquet) antes de enviar o primeiro byte, como um st.download_button;
+- em partes: o gerador da exportação, lendo o snapshot por memory-map.
+Registra o tempo até o primeiro byte, o tempo total, o tamanho do arquivo e
+o maior bloco de bytes mantido na memória de uma vez (o arquivo inteiro no
+primeiro caso, a maior parte no segundo).
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_export.py --scale 100
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from common import DEFAULT_CSV, scale_dataset
+from fome_zero.export import ArrowFileSource, export_chunks
+from fome_zero.snapshot import get_snapshot_path, load_snapshot, source_fingerprint
+
+# =====================================================================
+# MEDIÇÃO
+# =====================================================================
+
+
+def in_memory(df, countries, fmt):
+    start = time.perf_counter()
+    rows = df[df['country'].isin(countries)]
+    if fmt == 'parquet':
+        buffer = io.BytesIO()
+        rows.to_parquet(buffer, index=False)
+        data = buffer.getvalue()
+    else:
+        data = rows.to_csv(index=False).encode('utf-8')
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed, len(data), len(data)
+
+
+def streamed(source, countries, fmt):
+    start = time.perf_counter()
+    first_byte, total, largest = None, 0, 0
+    for chunk in export_chunks(source.record_batches({'countries': countries}), fmt):
+        if chunk and first_byte is None:
+            first_byte = time.perf_counter() - start
+        total += len(chunk)
+        largest = max(largest, len(chunk))
+    return first_byte, time.perf_counter() - start, total, largest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scale', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'zomato.csv')
+        scale_dataset(pd.read_csv(args.csv), args.scale).to_csv(csv_path, index=False)
+        fingerprint = source_fingerprint(csv_path)
+        df = load_snapshot(csv_path, fingerprint)
+        source = ArrowFileSource(get_snapshot_path(csv_path, fingerprint))
+        countries = sorted(df['country'].unique())
+        print(f"{len(df):,} linhas, todos os países")
+        print(f"{'formato':>8} {'modo':>10} {'1º byte':>9} {'total':>9} "
+              f"{'arquivo':>10} {'maior bloco':>12}")
+
+        for fmt in ['csv', 'parquet']:
+            for mode, run in [('memória', lambda: in_memory(df, countries, fmt)),
+                              ('partes', lambda: streamed(source, countries, fmt))]:
+                first_byte, total, size, largest = run()
+                print(f"{fmt:>8} {mode:>10} {first_byte:>8.3f}s {total:>8.3f}s "
+                      f"{size / 2**20:>8.1f}MB {largest / 2**20:>10.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark do custo de importação na partida do dashboard.
+
+Compara o carregamento preguiçoso das páginas (fome_zero/views: o folium só
+é importado pela Main Page e o altair pelas páginas com gráficos) com o
+carregamento antecipado de antes, em que o dash.teste.py importava folium,
+MarkerCluster, altair, streamlit.components.v1 e inflection no topo de todo
+rerun. O modo "eager" reproduz isso importando esses módulos antes do app.
+
+Cada medição roda num processo novo (partida a frio do interpretador, com o
+snapshot dos dados já gravado) e registra:
+- import_s: importação das dependências de topo do app;
+- first_paint_s: importação mais a primeira execução completa da página
+  (AppTest), ou seja, o tempo até a primeira renderização;
+- os módulos pesados que ficaram carregados.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_imports.py --pages countries_page main_page --repeat 5
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import make_app_tree
+
+# Módulos importados no topo do dash.teste.py antes da divisão em páginas
+EAGER_MODULES = ['altair', 'folium', 'folium.plugins',
+                 'streamlit.components.v1', 'inflection']
+HEAVY_MODULES = ['folium', 'altair', 'inflection']
+PAGES = {
+    "main_page": "📊 Main Page",
+    "countries_page": "🌍 Countries",
+    "cities_page": "🏙️ Cities",
+    "cuisines_page": "🍜 Cuisines",
+    "nearby_page": "📍 Nearby",
+    "search_page": "🔎 Search"
+}
+
+# =====================================================================
+# MEDIÇÃO (EXECUTADA NO PROCESSO FILHO)
+# =====================================================================
+
+
+def worker(args):
+    """
+    Mede a importação e a primeira renderização de uma página num processo
+    novo e imprime o resultado em JSON.
+    """
+    start = time.perf_counter()
+    if args.mode == 'eager':
+        for name in EAGER_MODULES:
+            __import__(name)
+    import streamlit  # noqa: F401
+    from streamlit.testing.v1 import AppTest
+    sys.path.insert(0, os.path.dirname(args.script))
+    import fome_zero.views  # noqa: F401
+    import fome_zero.query_engine  # noqa: F401
+    import fome_zero.snapshot  # noqa: F401
+    import_s = time.perf_counter() - start
+
+    from streamlit import logger
+    logger.set_log_level('error')
+    os.chdir(os.path.dirname(os.path.dirname(args.script)))
+    at = AppTest.from_file(args.script, default_timeout=600)
+    at.session_state["sidebar_navigation_radio"] = PAGES[args.page]
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    first_paint_s = time.perf_counter() - start
+
+    print(json.dumps({
+        'mode': args.mode,
+        'page': args.page,
+        'import_s': round(import_s, 4),
+        'first_paint_s': round(first_paint_s, 4),
+        'loaded': [name for name in HEAVY_MODULES if name in sys.modules]
+    }))
+
+# =====================================================================
+# ORQUESTRAÇÃO (PROCESSO PRINCIPAL)
+# =====================================================================
+
+
+def run_worker(script, mode, page):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker',
+         '--mode', mode, '--pages', page, '--script', script],
+        capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', nargs='+', choices=PAGES,
+                        default=['countries_page', 'main_page'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='grava os resultados neste arquivo JSON')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=['lazy', 'eager'], help=argparse.SUPPRESS)
+    parser.add_argument('--script', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        args.page = args.pages[0]
+        worker(args)
+        return
+
+    results = []
+    print(f"{'página':<16} {'modo':>6} {'import (s)':>11} {'1ª renderização (s)':>20}  carregados")
+    with tempfile.TemporaryDirectory() as tmp:
+        script = make_app_tree(tmp, 1)
+        # Aquecimento: grava o snapshot antes de medir
+        run_worker(script, 'lazy', args.pages[0])
+        for page in args.pages:
+            for mode in ['eager', 'lazy']:
+                runs = [run_worker(script, mode, page) for _ in range(args.repeat)]
+                result = min(runs, key=lambda r: r['first_paint_s'])
+                result['import_s'] = min(r['import_s'] for r in runs)
+                results.append(result)
+                print(f"{page:<16} {mode:>6} {result['import_s']:>11.3f} "
+                      f"{result['first_paint_s']:>20.3f}  {', '.join(result['loaded'])}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
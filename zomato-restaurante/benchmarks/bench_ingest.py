@@ -0,0 +1,116 @@
+"""
+Benchmark da ingestão incremental de deltas (fome_zero.snapshot).
+
+Replica o zomato.csv em escalas crescentes, grava o snapshot da base e
+então um delta com `--delta-rows` linhas (metade atualiza restaurantes
+existentes pelo restaurant_id, metade são restaurantes novos). Mede:
+- completo: limpeza da base inteira e aplicação do delta, sem snapshot
+  anterior (o que acontecia ao substituir o CSV);
+- incremental: a partir do snapshot anterior, limpando só o delta e
+  atualizando outliers, cubo e índice de busca.
+Confere que as duas rotas geram o mesmo dataset e que o cubo e o índice
+incrementais são iguais aos montados do zero (build_cube e
+build_search_index) sobre o dataset mesclado, já que a rota completa também
+aplica o delta pelas funções incrementais.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_ingest.py --scales 1 10 100 --delta-rows 1000
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from common import DEFAULT_CSV, scale_dataset
+from fome_zero.cube import build_cube
+from fome_zero.search_index import build_search_index
+from fome_zero.snapshot import (DELTA_DIR, SNAPSHOT_DIR, load_search_index, load_snapshot,
+                                load_snapshot_cube, source_fingerprint)
+
+# =====================================================================
+# GERAÇÃO DOS DADOS E MEDIÇÃO
+# =====================================================================
+
+
+def make_delta(df_raw, n_rows, seed=0):
+    """
+    Delta sintético: metade das linhas atualiza restaurantes existentes
+    (nota e votos novos), metade são restaurantes com IDs novos.
+    """
+    rng = np.random.default_rng(seed)
+    updated = df_raw.sample(n_rows // 2, random_state=seed)
+    updated = updated.assign(**{
+        'Aggregate rating': rng.uniform(0, 5, len(updated)).round(1),
+        'Votes': rng.integers(0, 5000, len(updated))
+    })
+    added = df_raw.sample(n_rows - len(updated), random_state=seed + 1)
+    added = added.assign(**{
+        'Restaurant ID': df_raw['Restaurant ID'].max() + 1 + np.arange(len(added))
+    })
+    return pd.concat([updated, added], ignore_index=True)
+
+
+def load_version(csv_path):
+    """
+    Carrega o dataset, o cubo e o índice de busca da versão atual.
+    """
+    fingerprint = source_fingerprint(csv_path)
+    start = time.perf_counter()
+    df = load_snapshot(csv_path, fingerprint)
+    cube = load_snapshot_cube(csv_path, fingerprint)
+    index = load_search_index(csv_path, fingerprint)
+    return time.perf_counter() - start, (df, cube, index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--delta-rows', type=int, default=1000)
+    args = parser.parse_args()
+
+    df_base = pd.read_csv(args.csv)
+    print(f"{'escala':>7} {'linhas':>10} {'delta':>7} {'completo':>10} "
+          f"{'incremental':>12} {'ganho':>7}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            df_raw = scale_dataset(df_base, scale)
+            csv_path = os.path.join(tmp, 'zomato.csv')
+            df_raw.to_csv(csv_path, index=False)
+            delta_dir = os.path.join(tmp, DELTA_DIR, 'zomato')
+            snapshot_dir = os.path.join(tmp, SNAPSHOT_DIR)
+
+            # Snapshot da base, depois o delta chega
+            load_version(csv_path)
+            os.makedirs(delta_dir)
+            make_delta(df_raw, args.delta_rows, seed=scale).to_csv(
+                os.path.join(delta_dir, '0001.csv'), index=False)
+            t_incr, incremental = load_version(csv_path)
+
+            # Sem snapshot anterior: limpeza completa da base e do delta
+            shutil.rmtree(snapshot_dir)
+            t_full, full = load_version(csv_path)
+
+            # Referência independente: cubo e índice refeitos do zero
+            df, cube, index = incremental
+            pd.testing.assert_frame_equal(df, full[0])
+            pd.testing.assert_frame_equal(cube, build_cube(df))
+            reference = build_search_index(df)
+            assert index.keys() == reference.keys()
+            for key in reference:
+                assert np.array_equal(index[key], reference[key]), key
+
+            print(f"{scale:>6}x {len(df_raw):>10,} {args.delta_rows:>7,} {t_full:>9.3f}s "
+                  f"{t_incr:>11.3f}s {t_full / t_incr:>6.1f}x")
+            shutil.rmtree(snapshot_dir)
+            shutil.rmtree(os.path.join(tmp, DELTA_DIR))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark headless de todas as páginas do dashboard.
+
+Para cada escala sintética do zomato.csv (1x = ~7,5 mil linhas), mede:
+- load_and_preprocess_data a frio (CSV + limpeza) e o carregamento a quente
+  pelo snapshot Arrow;
+- a primeira execução do app (caches vazios) e cada uma das seis páginas
+  a quente (main_page, countries_page, cities_page, cuisines_page,
+  nearby_page, search_page), via AppTest;
+- a construção do mapa Folium em cada modo da Main Page.
+
+Os resultados vão para um JSON, que pode ser comparado com uma execução
+anterior via --compare.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_pages.py --scales 1 10 100 1000 --output bench.json
+    python benchmarks/bench_pages.py --scales 1 10 --compare bench.json
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from common import DEFAULT_CSV, make_app_tree
+from fome_zero.data import load_and_preprocess_data
+from fome_zero.snapshot import load_snapshot, source_fingerprint
+
+PAGES = {
+    "main_page": "📊 Main Page",
+    "countries_page": "🌍 Countries",
+    "cities_page": "🏙️ Cities",
+    "cuisines_page": "🍜 Cuisines",
+    "nearby_page": "📍 Nearby",
+    "search_page": "🔎 Search"
+}
+MAP_MODES = {
+    "map_clusters": "Clusters (nível de detalhe)",
+    "map_sample": "Amostra limitada",
+    "map_full": "Todos os marcadores"
+}
+
+# =====================================================================
+# MEDIÇÕES
+# =====================================================================
+
+
+def timed(func):
+    """
+    Executa `func` e retorna o tempo decorrido em segundos.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_app(at):
+    """
+    Executa o AppTest e falha se o script levantar alguma exceção.
+    """
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def bench_scale(root, scale, repeat, full_map_max_scale):
+    """
+    Mede todas as etapas para uma escala e retorna a lista de resultados.
+    """
+    script = make_app_tree(root, scale)
+    csv_path = os.path.join(os.path.dirname(script), 'database', 'zomato.csv')
+    rows = scale * len(pd.read_csv(DEFAULT_CSV))
+    results = []
+
+    def record(metric, seconds):
+        results.append({'scale': scale, 'rows': rows, 'metric': metric,
+                        'seconds': round(seconds, 4)})
+
+    # Carregamento: pipeline completo e snapshot (a frio e a quente)
+    record('load_and_preprocess_data_cold',
+           timed(lambda: load_and_preprocess_data(csv_path)))
+    fingerprint = source_fingerprint(csv_path)
+    record('load_snapshot_cold', timed(lambda: load_snapshot(csv_path, fingerprint)))
+    record('load_snapshot_warm', min(
+        timed(lambda: load_snapshot(csv_path, fingerprint)) for _ in range(repeat)))
+
+    # Páginas: primeira execução com caches vazios e cada página a quente
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    os.chdir(root)
+    at = AppTest.from_file(script, default_timeout=3600)
+    record('app_first_run', timed(lambda: run_app(at)))
+    for metric, page in PAGES.items():
+        radio = at.sidebar.radio(key="sidebar_navigation_radio")
+        radio.set_value(page)
+        timings = []
+        for _ in range(repeat):
+            timings.append(timed(lambda: run_app(at)))
+        record(metric, min(timings))
+
+    # Mapa Folium: rerun da Main Page em cada modo
+    at.sidebar.radio(key="sidebar_navigation_radio").set_value(PAGES['main_page'])
+    run_app(at)
+    for metric, mode in MAP_MODES.items():
+        if metric == 'map_full' and scale > full_map_max_scale:
+            continue
+        at.sidebar.radio(key="map_mode").set_value(mode)
+        record(metric, timed(lambda: run_app(at)))
+    return results
+
+
+def compare(results, baseline_path):
+    """
+    Imprime a razão entre os tempos atuais e os de uma execução anterior.
+    """
+    with open(baseline_path) as f:
+        baseline = {(r['scale'], r['metric']): r['seconds']
+                    for r in json.load(f)['results']}
+    print(f"\n{'escala':>7} {'métrica':<32} {'antes':>9} {'agora':>9} {'razão':>7}")
+    for r in results:
+        before = baseline.get((r['scale'], r['metric']))
+        if before:
+            print(f"{r['scale']:>6}x {r['metric']:<32} {before:>8.3f}s "
+                  f"{r['seconds']:>8.3f}s {r['seconds'] / before:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--full-map-max-scale', type=int, default=1,
+                        help='maior escala em que o modo "Todos os marcadores" é medido')
+    parser.add_argument('--output', help='grava os resultados neste arquivo JSON')
+    parser.add_argument('--compare', help='JSON de uma execução anterior')
+    args = parser.parse_args()
+
+    from streamlit import logger
+    logger.set_log_level('error')
+
+    cwd = os.getcwd()
+    results = []
+    print(f"{'escala':>7} {'linhas':>12} {'métrica':<32} {'tempo':>9}")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            for r in bench_scale(tmp, scale, args.repeat, args.full_map_max_scale):
+                results.append(r)
+                print(f"{scale:>6}x {r['rows']:>12,} {r['metric']:<32} {r['seconds']:>8.3f}s")
+            os.chdir(cwd)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'streamlit': st.__version__,
+            'cpu_count': os.cpu_count(),
+            'engine': os.environ.get('FOME_ZERO_ENGINE', 'pandas')
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
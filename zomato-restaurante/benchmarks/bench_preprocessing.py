@@ -0,0 +1,89 @@
+"""
+Benchmark do pipeline de limpeza (fome_zero.data.preprocess_data).
+
+Replica o zomato.csv em escalas crescentes (1x = ~7,5 mil linhas), confere
+que a versão vetorizada gera exatamente o mesmo DataFrame da versão linha a
+linha original e mede o tempo de leitura do CSV e de cada pipeline.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_preprocessing.py --scales 1 10 100 140 300
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from common import DEFAULT_CSV, best_of, scale_dataset
+from fome_zero.data import (COLORS, COUNTRIES, preprocess_data,
+                            rename_columns)
+
+# =====================================================================
+# PIPELINE ORIGINAL (LINHA A LINHA), MANTIDO COMO REFERÊNCIA
+# =====================================================================
+
+
+def legacy_create_price_type(price_range):
+    if price_range == 1:
+        return 'cheap'
+    elif price_range == 2:
+        return 'normal'
+    elif price_range == 3:
+        return 'expensive'
+    else:
+        return 'gourmet'
+
+
+def legacy_preprocess_data(df):
+    df = rename_columns(df)
+    single_val_cols = [col for col in df.columns if df[col].nunique() == 1]
+    df.drop(columns=single_val_cols, inplace=True)
+    df['cuisines'] = df['cuisines'].fillna('unknown')
+    df['cuisines'] = df['cuisines'].apply(lambda x: x.split(',')[0].strip())
+    df.drop_duplicates(inplace=True)
+    df['country'] = df['country_code'].map(COUNTRIES)
+    df['price_type'] = df['price_range'].apply(legacy_create_price_type)
+    df['rating_color_name'] = df['rating_color'].map(COLORS)
+    custo = df['average_cost_for_two']
+    limite = custo.mean() + 2 * custo.std()
+    df = df[custo <= limite].copy()
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+# =====================================================================
+# GERAÇÃO DOS DADOS E MEDIÇÃO
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100, 140, 300])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df_base = pd.read_csv(args.csv)
+    print(f"{'escala':>7} {'linhas':>10} {'read_csv':>10} "
+          f"{'original':>10} {'vetorizado':>11} {'ganho':>7}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            df_scaled = scale_dataset(df_base, scale)
+            csv_path = os.path.join(tmp, f'zomato_{scale}x.csv')
+            df_scaled.to_csv(csv_path, index=False)
+
+            t_read, df_raw = best_of(lambda: pd.read_csv(csv_path), args.repeat)
+            t_old, df_old = best_of(
+                lambda: legacy_preprocess_data(df_raw.copy()), args.repeat)
+            t_new, df_new = best_of(
+                lambda: preprocess_data(df_raw.copy()), args.repeat)
+            pd.testing.assert_frame_equal(df_old, df_new)
+
+            print(f"{scale:>6}x {len(df_raw):>10,} {t_read:>9.3f}s "
+                  f"{t_old:>9.3f}s {t_new:>10.3f}s {t_old / t_new:>6.1f}x")
+            os.remove(csv_path)
+
+
+if __name__ == '__main__':
+    main()
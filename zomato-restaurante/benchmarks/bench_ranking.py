@@ -0,0 +1,80 @@
+"""
+Benchmark dos rankings de restaurantes (fome_zero.ranking).
+
+Replica o zomato.csv em escalas crescentes e compara, para o top N global
+e o top N por culinária de todos os países e culinárias:
+- ordenação: filtro pelos bitmaps e sort_values().head() (como a página de
+  culinárias calculava);
+- ranking: leitura das listas de ranking pré-calculadas por país × culinária.
+Registra também o custo único de montar as listas e confere que as duas
+rotas devolvem os mesmos restaurantes.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_ranking.py --scales 1 10 100 --n 10
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+
+import pandas as pd
+
+from common import DEFAULT_CSV, best_of, scale_dataset
+from fome_zero.data import preprocess_data
+from fome_zero.filter_index import build_filter_index, filter_rows, get_values
+from fome_zero.ranking import build_rank_index, top_positions, top_positions_per_group
+
+RANK_ORDER = ['aggregate_rating', 'votes', 'restaurant_id']
+
+# =====================================================================
+# MEDIÇÃO
+# =====================================================================
+
+
+def sorted_top(df, index, countries, cuisines, n):
+    rows = filter_rows(df, index, countries, cuisines)
+    return rows.sort_values(RANK_ORDER, ascending=[False, False, True]).head(n)
+
+
+def sorted_top_per_cuisine(df, index, countries, cuisines, n):
+    rows = filter_rows(df, index, countries, cuisines)
+    rows = rows.sort_values(['cuisines'] + RANK_ORDER, ascending=[True, False, False, True])
+    return rows.groupby('cuisines', sort=False).head(n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--n', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df_base = pd.read_csv(args.csv)
+    print(f"{'escala':>7} {'linhas':>10} {'montagem':>9} {'consulta':>12} "
+          f"{'ordenação':>10} {'ranking':>9} {'ganho':>7}")
+
+    for scale in args.scales:
+        df = preprocess_data(scale_dataset(df_base, scale))
+        filter_index = build_filter_index(df)
+        t_build, rank_index = best_of(lambda: build_rank_index(df), 1)
+        countries = get_values(filter_index, 'country')
+        cuisines = get_values(filter_index, 'cuisines')
+
+        queries = {
+            'top global': (
+                lambda: sorted_top(df, filter_index, countries, cuisines, args.n),
+                lambda: top_positions(rank_index, countries, cuisines, args.n)),
+            'por culinária': (
+                lambda: sorted_top_per_cuisine(df, filter_index, countries, cuisines, args.n),
+                lambda: top_positions_per_group(rank_index, countries, cuisines, args.n,
+                                                'cuisines'))
+        }
+        for name, (sort_query, rank_query) in queries.items():
+            t_sort, expected = best_of(sort_query, args.repeat)
+            t_rank, positions = best_of(rank_query, args.repeat)
+            assert df['restaurant_id'].iloc[positions].tolist() == expected['restaurant_id'].tolist()
+            print(f"{scale:>6}x {len(df):>10,} {t_build:>8.3f}s {name:>12} "
+                  f"{t_sort * 1000:>8.2f}ms {t_rank * 1000:>7.2f}ms {t_sort / t_rank:>6.0f}x")
+
+
+if __name__ == '__main__':
+    main()
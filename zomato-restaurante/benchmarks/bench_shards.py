@@ -0,0 +1,155 @@
+"""
+Benchmark da carga em paralelo de datasets em shards (fome_zero.data).
+
+Replica o zomato.csv na escala pedida, divide as linhas em `--shards`
+arquivos CSV (ou Parquet) numa pasta e mede a limpeza com 1, 2, 4, ...
+processos, até o número de núcleos. Registra o tempo, o ganho sobre 1
+processo e a eficiência (ganho / processos; 100% = escala linear), além do
+arquivo único com as mesmas linhas como referência. Confere que todas as
+configurações geram exatamente o mesmo DataFrame.
+
+Mede também o custo fixo do pool (iniciar os processos e importar o pandas
+em cada um, com dois shards de poucas linhas) e, a partir dele e da vazão
+da limpeza em sequência, estima o tamanho dos shards abaixo do qual o pool
+é uma perda com cada número de processos. Os resultados e o número de
+núcleos da máquina podem ser gravados em JSON com --output.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/bench_shards.py --scale 100 --shards 32 --output shards.json
+    python benchmarks/bench_shards.py --scale 100 --shards 32 --format parquet --workers 1 2 4 8
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import json
+import os
+import platform
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from common import DEFAULT_CSV, best_of, scale_dataset
+from fome_zero.data import load_and_preprocess_data, load_clean_rows
+
+# =====================================================================
+# GERAÇÃO DOS DADOS E MEDIÇÃO
+# =====================================================================
+
+
+def write_shards(df, folder, n_shards, fmt):
+    """
+    Divide as linhas em `n_shards` arquivos contíguos, na ordem original.
+    """
+    os.makedirs(folder)
+    for i, part in enumerate(np.array_split(np.arange(len(df)), n_shards)):
+        shard = df.iloc[part]
+        write_data(shard, os.path.join(folder, f'shard-{i:04d}.{fmt}'), fmt)
+
+
+def write_data(df, path, fmt):
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def pool_overhead(df_raw, folder, fmt, workers, repeat):
+    """
+    Tempo de limpar dois shards de poucas linhas com `workers` processos:
+    praticamente só o custo de iniciar o pool.
+    """
+    os.makedirs(folder)
+    sample = df_raw.sample(200, random_state=0)
+    for i, part in enumerate(np.array_split(np.arange(len(sample)), 2)):
+        write_data(sample.iloc[part], os.path.join(folder, f'shard-{i}.{fmt}'), fmt)
+    return best_of(lambda: load_clean_rows(folder, workers=workers), repeat)[0]
+
+
+def default_workers():
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+    return workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--scale', type=int, default=100)
+    parser.add_argument('--shards', type=int, default=32)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers())
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--output', help='grava os resultados neste arquivo JSON')
+    args = parser.parse_args()
+
+    df_raw = scale_dataset(pd.read_csv(args.csv), args.scale)
+    cores = os.cpu_count() or 1
+    print(f"{len(df_raw):,} linhas em {args.shards} shards {args.format}, {cores} núcleo(s)")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'shards')
+        write_shards(df_raw, folder, args.shards, args.format)
+        shard_bytes = sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
+        single_path = os.path.join(tmp, f'single.{args.format}')
+        write_data(df_raw, single_path, args.format)
+
+        t_single, expected = best_of(lambda: load_and_preprocess_data(single_path), args.repeat)
+        print(f"{'processos':>10} {'tempo':>9} {'ganho':>7} {'eficiência':>11} "
+              f"{'custo fixo':>11} {'mínimo p/ ganhar':>17}")
+        print(f"{'arquivo único':>10} {t_single:>8.3f}s")
+        results.append({'workers': 0, 'seconds': t_single})
+
+        # O ganho é sempre relativo à limpeza em sequência (1 processo).
+        # Com k processos, o pool compensa quando a parte poupada da limpeza
+        # em sequência, t1 * (1 - 1/k), passa do custo fixo do pool; a vazão
+        # em sequência converte esse tempo em tamanho dos shards
+        baseline = None
+        for workers in sorted(set([1] + args.workers)):
+            elapsed, df = best_of(
+                lambda: load_and_preprocess_data(folder, workers=workers), args.repeat)
+            pd.testing.assert_frame_equal(df, expected)
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            result = {'workers': workers, 'seconds': elapsed, 'speedup': speedup}
+            line = f"{workers:>10} {elapsed:>8.3f}s {speedup:>6.2f}x {speedup / workers:>10.0%}"
+            if workers > 1:
+                overhead = pool_overhead(df_raw, os.path.join(tmp, f'pool-{workers}'),
+                                         args.format, workers, args.repeat)
+                # Com mais processos que núcleos, só os núcleos dividem o trabalho
+                parallel = min(workers, cores)
+                if parallel > 1:
+                    min_bytes = overhead / (1 - 1 / parallel) * shard_bytes / baseline
+                    min_text = f"{min_bytes / 2**20:>14,.0f} MB"
+                else:
+                    min_bytes, min_text = None, f"{'nunca':>17}"
+                result.update(pool_seconds=overhead, min_bytes=min_bytes)
+                line += f" {overhead:>10.3f}s {min_text}"
+            results.append(result)
+            print(line)
+
+    if args.output:
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'pandas': pd.__version__,
+                'cpu_count': cores,
+                'rows': len(df_raw),
+                'shards': args.shards,
+                'format': args.format,
+                'bytes': shard_bytes
+            },
+            'results': results
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Funções compartilhadas pelos scripts de benchmark: geração de escalas
+sintéticas do zomato.csv e montagem de uma cópia do app apontando para elas.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import os
+import sys
+import time
+
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CSV = os.path.join(APP_DIR, 'database', 'zomato.csv')
+APP_SCRIPT = 'dash.teste.py'
+
+sys.path.insert(0, APP_DIR)
+
+
+def scale_dataset(df_base, scale):
+    """
+    Replica o dataset `scale` vezes, deslocando o 'Restaurant ID' de cada
+    cópia para que a deduplicação não desfaça a replicação.
+    """
+    offset = int(df_base['Restaurant ID'].max()) + 1
+    copies = []
+    for i in range(scale):
+        copy = df_base.copy()
+        copy['Restaurant ID'] = copy['Restaurant ID'] + i * offset
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def best_of(func, repeat):
+    """
+    Executa `func` `repeat` vezes e retorna o menor tempo e o último resultado.
+    """
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def make_app_tree(root, scale, csv_path=DEFAULT_CSV):
+    """
+    Monta em `root` a estrutura esperada pelo dash.teste.py (que lê
+    'zomato-restaurante/database/zomato.csv' relativo à pasta atual), com o
+    dataset replicado `scale` vezes. Retorna o caminho absoluto do script.
+    """
+    app_dir = os.path.join(root, 'zomato-restaurante')
+    os.makedirs(os.path.join(app_dir, 'database'), exist_ok=True)
+    for name in [APP_SCRIPT, 'fome_zero']:
+        target = os.path.join(app_dir, name)
+        if not os.path.exists(target):
+            os.symlink(os.path.join(APP_DIR, name), target)
+    df_scaled = scale_dataset(pd.read_csv(csv_path), scale)
+    df_scaled.to_csv(os.path.join(app_dir, 'database', 'zomato.csv'), index=False)
+    return os.path.join(app_dir, APP_SCRIPT)
+
+
+def get_rss_mb():
+    """
+    Memória residente atual do processo em MB (Linux), ou None se indisponível.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        return None
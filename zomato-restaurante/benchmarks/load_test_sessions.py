@@ -0,0 +1,132 @@
+"""
+Teste de carga com sessões simultâneas do dashboard.
+
+Compara o modo padrão (st.cache_data, uma cópia do dataset por rerun) com o
+modo compartilhado (FOME_ZERO_SHARED_DATA=1, uma instância por processo).
+Cada sessão simulada é uma thread que reexecuta o dash.teste.py em "bare
+mode" (sem servidor, widgets com valores padrão, ou seja, a Main Page), com
+os caches do Streamlit compartilhados entre as threads como num servidor
+real. O AppTest não serve aqui porque não suporta execuções simultâneas no
+mesmo processo. Cada combinação de modo e número de sessões roda num
+processo separado, para que a memória medida seja só daquele cenário.
+
+Uso (a partir da pasta zomato-restaurante):
+    python benchmarks/load_test_sessions.py --sessions 1 4 16 --scale 10
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import argparse
+import json
+import os
+import resource
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from common import get_rss_mb, make_app_tree
+
+MODES = {'cached': '0', 'shared': '1'}
+
+# =====================================================================
+# SESSÃO SIMULADA (EXECUTADA NO PROCESSO FILHO)
+# =====================================================================
+
+
+def run_session(script_path, reruns):
+    """
+    Reexecuta o script `reruns` vezes, retornando a latência (s) de cada rerun.
+    """
+    latencies = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        runpy.run_path(script_path, run_name='__main__')
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def worker(args):
+    """
+    Roda `args.sessions` sessões simultâneas e imprime o resultado em JSON.
+    """
+    root = os.path.dirname(os.path.dirname(args.script))
+    os.chdir(root)
+    sys.path.insert(0, os.path.dirname(args.script))
+    from streamlit import logger
+    logger.set_log_level('error')
+
+    # Aquecimento: constrói snapshot, cubo e índices antes de medir
+    run_session(args.script, 1)
+    rss_before = get_rss_mb()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        results = list(pool.map(lambda _: run_session(args.script, args.reruns),
+                                range(args.sessions)))
+    elapsed = time.perf_counter() - start
+    latencies = np.array([t for session in results for t in session]) * 1000
+
+    print(json.dumps({
+        'mode': args.mode,
+        'sessions': args.sessions,
+        'reruns': int(latencies.size),
+        'latency_ms_p50': round(float(np.percentile(latencies, 50)), 2),
+        'latency_ms_p95': round(float(np.percentile(latencies, 95)), 2),
+        'latency_ms_mean': round(float(latencies.mean()), 2),
+        'throughput_reruns_s': round(latencies.size / elapsed, 2),
+        'rss_mb_before': rss_before and round(rss_before, 1),
+        'rss_mb_after': get_rss_mb() and round(get_rss_mb(), 1),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }))
+
+# =====================================================================
+# ORQUESTRAÇÃO (PROCESSO PRINCIPAL)
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--reruns', type=int, default=8)
+    parser.add_argument('--output', help='grava os resultados neste arquivo JSON')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--script', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        args.sessions = args.sessions[0]
+        worker(args)
+        return
+
+    results = []
+    print(f"{'modo':>7} {'sessões':>8} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'reruns/s':>9} {'RSS pico MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        script = make_app_tree(tmp, args.scale)
+        for sessions in args.sessions:
+            for mode, flag in MODES.items():
+                env = dict(os.environ, FOME_ZERO_SHARED_DATA=flag)
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), '--worker',
+                     '--mode', mode, '--sessions', str(sessions),
+                     '--reruns', str(args.reruns), '--script', script],
+                    env=env, capture_output=True, text=True, check=True)
+                result = json.loads(out.stdout.strip().splitlines()[-1])
+                result['scale'] = args.scale
+                results.append(result)
+                print(f"{mode:>7} {sessions:>8} {result['latency_ms_p50']:>9.1f} "
+                      f"{result['latency_ms_p95']:>9.1f} "
+                      f"{result['throughput_reruns_s']:>9.1f} {result['peak_rss_mb']:>12.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
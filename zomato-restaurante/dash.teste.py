@@ -1,121 +1,278 @@
 # --- Importação das Bibliotecas Necessárias ---
-import inflection
+import os
+
 import streamlit as st
 import pandas as pd
-import altair as alt
-import folium
-from folium.plugins import MarkerCluster
-import streamlit.components.v1 as components
+
+from fome_zero.data import compact_dataframe, memory_report
+from fome_zero.export import ArrowFileSource, Exporter, ExportRegistry, mount_export_route
+from fome_zero.filter_index import build_filter_index
+from fome_zero.instrumentation import (InstrumentedEngine, MetricsRegistry,
+                                       RerunMetrics, start_metrics_server)
+from fome_zero.query_engine import DuckDBEngine, PandasEngine
+from fome_zero.ranking import build_rank_index
+from fome_zero.render_cache import RenderCache
+from fome_zero.search_index import SEARCH_RESULT_COLUMNS
+from fome_zero.sketch import SKETCH_COLUMNS, SKETCH_GROUPS, SketchEngine, build_sketches, standard_error
+from fome_zero.snapshot import (get_snapshot_path, load_search_index, load_snapshot,
+                                load_snapshot_cube, source_fingerprint)
+from fome_zero.spatial_index import SPATIAL_COLUMNS, build_spatial_index
+from fome_zero.views import PageContext, render_page
+
+# Origem dos dados (FOME_ZERO_DATA): o zomato.csv, outro arquivo CSV/Parquet,
+# uma pasta ou um padrão glob de shards (por exemplo, um arquivo por país ou
+# por mês). A partir de 128 MB, os shards são limpos em paralelo, um processo
+# por núcleo.
+DATA_SOURCE = os.environ.get('FOME_ZERO_DATA', 'zomato-restaurante/database/zomato.csv')
+
+# Modo compacto: tipos 'category' e inteiros reduzidos no DataFrame em memória
+# (FOME_ZERO_COMPACT=1) e, opcionalmente, strings Arrow no texto livre
+# (FOME_ZERO_ARROW_STRINGS=1). Os valores exibidos nas páginas não mudam.
+COMPACT_MODE = os.environ.get('FOME_ZERO_COMPACT', '0') == '1'
+ARROW_STRINGS = os.environ.get('FOME_ZERO_ARROW_STRINGS', '0') == '1'
+
+# Dataset compartilhado (FOME_ZERO_SHARED_DATA=1): uma única instância por
+# processo, via st.cache_resource, em vez de uma cópia por rerun de cada
+# sessão. O Copy-on-Write do pandas protege a instância compartilhada: cada
+# rerun recebe uma cópia rasa e qualquer escrita copia apenas a coluna alterada.
+SHARED_DATA = os.environ.get('FOME_ZERO_SHARED_DATA', '0') == '1'
+if SHARED_DATA:
+    pd.set_option('mode.copy_on_write', True)
+
+# Motor de consultas das páginas (FOME_ZERO_ENGINE): 'pandas' (em memória,
+# padrão) ou 'duckdb' (lê o arquivo direto, multi-core e fora da memória)
+QUERY_ENGINE = os.environ.get('FOME_ZERO_ENGINE', 'pandas')
+
+# Contagens distintas (FOME_ZERO_DISTINCT): 'exact' (padrão) ou 'approx', que
+# estima restaurantes, cidades e culinárias por sketches HyperLogLog por país
+# e por cidade (ver fome_zero.sketch). É o valor inicial do seletor da sidebar.
+DISTINCT_MODE = os.environ.get('FOME_ZERO_DISTINCT', 'exact')
+
+# Instrumentação (FOME_ZERO_METRICS=1): mede tempo, linhas processadas e bytes
+# enviados ao navegador em cada etapa do rerun e mostra um painel de debug na
+# sidebar. Os registros podem ser exportados em JSON lines
+# (FOME_ZERO_METRICS_JSONL), em texto do Prometheus (FOME_ZERO_METRICS_PROM)
+# e por um endpoint /metrics (FOME_ZERO_METRICS_PORT).
+METRICS_ENABLED = os.environ.get('FOME_ZERO_METRICS', '0') == '1'
+METRICS_JSONL = os.environ.get('FOME_ZERO_METRICS_JSONL')
+METRICS_PROM = os.environ.get('FOME_ZERO_METRICS_PROM')
+METRICS_PORT = os.environ.get('FOME_ZERO_METRICS_PORT')
+
+# Cache de renderização: HTML do mapa e especificações Vega-Lite já geradas,
+# por página, seleção de filtros e versão do dataset. Limitado em entradas
+# (FOME_ZERO_RENDER_CACHE_ENTRIES, 0 desliga) e em memória
+# (FOME_ZERO_RENDER_CACHE_MB); com FOME_ZERO_RENDER_CACHE_DIR, os itens
+# removidos da memória vão para o disco.
+RENDER_CACHE_ENTRIES = int(os.environ.get('FOME_ZERO_RENDER_CACHE_ENTRIES', '256'))
+RENDER_CACHE_MB = float(os.environ.get('FOME_ZERO_RENDER_CACHE_MB', '64'))
+RENDER_CACHE_DIR = os.environ.get('FOME_ZERO_RENDER_CACHE_DIR')
+
+# Ingestão incremental: intervalo (s) em que cada sessão confere se chegou um
+# delta novo em database/deltas/zomato/ (FOME_ZERO_DELTA_POLL, 0 desliga).
+# Ao chegar, o app roda de novo e processa apenas as linhas do delta.
+DELTA_POLL_SECONDS = float(os.environ.get('FOME_ZERO_DELTA_POLL', '5'))
 
 # =====================================================================
-# FUNÇÕES AUXILIARES DE PRÉ-PROCESSAMENTO E LÓGICA
+# CARREGAMENTO E LIMPEZA PRINCIPAL DOS DADOS
 # =====================================================================
 
 
-def rename_columns(dataframe):
+def read_data(file_path, fingerprint):
     """
-    Renomeia as colunas do DataFrame para o formato snake_case.
-    Exemplo: 'Restaurant ID' -> 'restaurant_id'.
+    Lê os dados limpos a partir do snapshot Arrow (ver fome_zero.snapshot),
+    aplicando o modo compacto quando habilitado.
     """
-    df = dataframe.copy()
+    df = load_snapshot(file_path, fingerprint)
+    if COMPACT_MODE:
+        df = compact_dataframe(df, arrow_strings=ARROW_STRINGS)
+    return df
 
-    # Funções auxiliares para transformação dos nomes
-    def title(x): return inflection.titleize(x)
-    def remove_sp(x): return x.replace(" ", "")
-    def undersc(x): return inflection.underscore(x)
 
-    # Aplica as transformações em sequência
-    cols_old = list(df.columns)
-    cols_old = list(map(title, cols_old))
-    cols_old = list(map(remove_sp, cols_old))
-    cols_new = list(map(undersc, cols_old))
+@st.cache_data  # Habilita o cache para otimizar o carregamento
+def load_data(file_path, fingerprint):
+    """
+    Carrega os dados limpos. A impressão digital do arquivo faz parte da chave
+    do cache, então edições no CSV invalidam o cache sem reiniciar o app.
+    """
+    return read_data(file_path, fingerprint)
 
-    df.columns = cols_new
-    return df
+
+@st.cache_resource(max_entries=1)
+def load_shared_data(file_path, fingerprint):
+    """
+    Carrega os dados limpos uma única vez por processo. A mesma instância é
+    usada por todas as sessões; apenas a versão mais recente fica em memória.
+    """
+    return read_data(file_path, fingerprint)
 
 
-def create_price_type(price_range):
+def get_data(file_path, fingerprint):
     """
-    Cria uma categoria de preço (string) com base no valor numérico de price_range.
+    Retorna o dataset da sessão: uma cópia rasa da instância compartilhada
+    (modo compartilhado) ou a cópia entregue pelo st.cache_data.
     """
-    if price_range == 1:
-        return 'cheap'
-    elif price_range == 2:
-        return 'normal'
-    elif price_range == 3:
-        return 'expensive'
-    else:
-        return 'gourmet'
+    if SHARED_DATA:
+        return load_shared_data(file_path, fingerprint).copy(deep=False)
+    return load_data(file_path, fingerprint)
 
 
-def get_rating_color(rating):
+@st.cache_data
+def load_memory_report(file_path, fingerprint):
     """
-    Retorna uma cor com base na nota de avaliação para usar nos marcadores do mapa Folium.
+    Uso de memória do dataset antes e depois do modo compacto.
     """
-    if rating >= 4.5:
-        return 'green'
-    elif rating >= 3.5:
-        return 'lightgreen'
-    elif rating >= 2.5:
-        return 'orange'
-    else:
-        return 'red'
+    return memory_report(load_snapshot(file_path, fingerprint),
+                         get_data(file_path, fingerprint))
 
-# =====================================================================
-# CARREGAMENTO E LIMPEZA PRINCIPAL DOS DADOS
-# =====================================================================
 
+@st.cache_data
+def load_cube(file_path, fingerprint):
+    """
+    Carrega o cubo de agregados (país × cidade × culinária) gravado com o
+    snapshot, atualizado incrementalmente a cada delta. Os gráficos das
+    páginas são consolidados a partir dele.
+    """
+    return load_snapshot_cube(file_path, fingerprint)
 
-@st.cache_data  # Habilita o cache para otimizar o carregamento
-def load_and_preprocess_data(file_path):
+
+@st.cache_resource(max_entries=1)  # Bitmaps somente leitura: compartilhados, sem cópia por rerun
+def load_filter_indexes(file_path, fingerprint):
     """
-    Carrega o arquivo CSV e aplica todas as etapas de limpeza e pré-processamento.
+    Monta os índices de bitmaps de país e culinária das linhas do dataset e
+    das células do cubo, usados pelo filtro compartilhado das páginas.
     """
-    df = pd.read_csv(file_path)
+    return (build_filter_index(get_data(file_path, fingerprint)),
+            build_filter_index(load_cube(file_path, fingerprint)))
 
-    # 1. Renomear colunas para o padrão snake_case
-    df = rename_columns(df)
 
-    # 2. Remover colunas com um único valor (não agregam informação)
-    single_val_cols = [col for col in df.columns if df[col].nunique() == 1]
-    df.drop(columns=single_val_cols, inplace=True)
+@st.cache_resource(max_entries=1)  # Somente leitura: compartilhadas entre as sessões
+def load_rank_index(file_path, fingerprint):
+    """
+    Ordena os restaurantes por nota, votos e ID uma única vez por versão do
+    arquivo e guarda as listas de ranking de cada país × culinária, usadas
+    nos tops de restaurantes das páginas.
+    """
+    return build_rank_index(get_data(file_path, fingerprint))
 
-    # 3. Tratar dados nulos em 'cuisines' e padronizar para o primeiro tipo
-    df['cuisines'] = df['cuisines'].fillna('unknown')
-    df['cuisines'] = df['cuisines'].apply(lambda x: x.split(',')[0].strip())
 
-    # 4. Remover registros duplicados
-    df.drop_duplicates(inplace=True)
+@st.cache_resource(max_entries=1)
+def load_duckdb_engine(file_path, fingerprint):
+    """
+    Abre (e, na primeira vez, monta) a base DuckDB da versão atual do arquivo.
+    """
+    return DuckDBEngine(file_path, fingerprint)
 
-    # 5. Mapear 'country_code' para o nome do país
-    COUNTRIES = {
-        1: "India", 14: "Australia", 30: "Brazil", 37: "Canada",
-        94: "Indonesia", 148: "New Zeland", 162: "Philippines",
-        166: "Qatar", 184: "Singapure", 189: "South Africa",
-        191: "Sri Lanka", 208: "Turkey", 214: "United Arab Emirates",
-        215: "England", 216: "United States of America"
-    }
-    df['country'] = df['country_code'].map(COUNTRIES)
 
-    # 6. Criar coluna 'price_type' com base na 'price_range'
-    df['price_type'] = df['price_range'].apply(create_price_type)
+def get_engine(file_path, fingerprint):
+    """
+    Motor de consultas usado pelas páginas para métricas, rankings e
+    agrupamentos.
+    """
+    if QUERY_ENGINE == 'duckdb':
+        return load_duckdb_engine(file_path, fingerprint)
+    raw_index, cube_index = load_filter_indexes(file_path, fingerprint)
+    return PandasEngine(get_data(file_path, fingerprint),
+                        load_cube(file_path, fingerprint),
+                        raw_index, cube_index,
+                        load_rank_index(file_path, fingerprint))
 
-    # 7. Mapear código de cor para nome da cor
-    COLORS = {
-        "3F7E00": "darkgreen", "5BA829": "green", "9ACD32": "lightgreen",
-        "CDD614": "orange", "FFBA00": "red", "CBCBC8": "darkred",
-        "FF7800": "darkred"
-    }
-    df['rating_color_name'] = df['rating_color'].map(COLORS)
 
-    # 8. Filtrar outliers de custo para não distorcer as médias
-    custo = df['average_cost_for_two']
-    limite = custo.mean() + 2 * custo.std()
-    df = df[custo <= limite].copy()
+@st.cache_resource(max_entries=1)  # Somente leitura: compartilhada entre as sessões
+def load_spatial_index(file_path, fingerprint):
+    """
+    Monta a grade espacial das coordenadas dos restaurantes uma única vez por
+    versão do arquivo, para as consultas de raio e retângulo da página Nearby.
+    """
+    engine = get_engine(file_path, fingerprint)
+    return build_spatial_index(engine.rows(engine.countries(), columns=SPATIAL_COLUMNS))
 
-    # 9. Resetar o índice do DataFrame final
-    df.reset_index(drop=True, inplace=True)
-    return df
+
+@st.cache_resource(max_entries=1)  # Somente leitura: compartilhados entre as sessões
+def load_sketches(file_path, fingerprint):
+    """
+    Monta os sketches HyperLogLog por país e por cidade uma única vez por
+    versão do arquivo, usados no modo de contagens aproximadas.
+    """
+    engine = get_engine(file_path, fingerprint)
+    return build_sketches(engine.rows(engine.countries(), columns=SKETCH_COLUMNS))
+
+
+@st.cache_resource(max_entries=1)  # Somente leitura: compartilhado entre as sessões
+def load_search(file_path, fingerprint):
+    """
+    Carrega o índice de busca gravado junto com o snapshot e as colunas
+    exibidas nos resultados (mais o restaurant_id, usado na exportação), na
+    mesma ordem de linhas do índice. Só essas colunas são lidas do snapshot.
+    """
+    return (load_search_index(file_path, fingerprint),
+            load_snapshot(file_path, fingerprint, columns=['restaurant_id'] + SEARCH_RESULT_COLUMNS))
+
+
+@st.cache_resource
+def load_export_route():
+    """
+    Monta a rota de downloads no servidor do Streamlit (a mesma origem da
+    página, então os links funcionam de qualquer máquina e atrás de proxy) e
+    retorna o registro das seleções, compartilhado por todas as sessões, e o
+    caminho base dos links (None sem servidor). Falha com RuntimeError numa
+    versão do Streamlit não suportada (ver find_streamlit_app).
+    """
+    registry = ExportRegistry()
+    return registry, mount_export_route(registry)
+
+
+@st.cache_resource(max_entries=1)  # Compartilhada entre as sessões, sem cópia dos dados
+def load_export_source(file_path, fingerprint):
+    """
+    Origem das linhas exportadas: a base DuckDB no motor DuckDB ou, no motor
+    pandas, o snapshot Arrow lido por memory-map, em vez da cópia do
+    DataFrame de cada sessão. None se o snapshot não pôde ser gravado.
+    """
+    if QUERY_ENGINE == 'duckdb':
+        return load_duckdb_engine(file_path, fingerprint)
+    path = get_snapshot_path(file_path, fingerprint)
+    return ArrowFileSource(path) if os.path.exists(path) else None
+
+
+@st.fragment(run_every=DELTA_POLL_SECONDS or None)
+def watch_source(file_path, fingerprint):
+    """
+    Roda de novo apenas este fragmento a cada DELTA_POLL_SECONDS e, quando a
+    impressão digital mudou (CSV editado ou delta novo), o app inteiro.
+    """
+    if source_fingerprint(file_path) != fingerprint:
+        st.rerun()
+
+# =====================================================================
+# INSTRUMENTAÇÃO
+# =====================================================================
+
+
+@st.cache_resource
+def load_metrics_registry():
+    """
+    Registro de métricas do processo, compartilhado por todas as sessões.
+    Inicia o endpoint /metrics quando FOME_ZERO_METRICS_PORT está definido.
+    """
+    registry = MetricsRegistry(jsonl_path=METRICS_JSONL, prometheus_path=METRICS_PROM)
+    if METRICS_PORT:
+        start_metrics_server(registry, int(METRICS_PORT))
+    return registry
+
+
+# =====================================================================
+# CACHE DE RENDERIZAÇÃO
+# =====================================================================
+
+
+@st.cache_resource
+def load_render_cache():
+    """
+    Cache LRU de renderização do processo, compartilhado por todas as sessões.
+    """
+    return RenderCache(max_entries=RENDER_CACHE_ENTRIES,
+                       max_bytes=int(RENDER_CACHE_MB * 2**20),
+                       spill_dir=RENDER_CACHE_DIR)
 
 # =====================================================================
 # CONFIGURAÇÃO INICIAL DA PÁGINA STREAMLIT
@@ -129,9 +286,21 @@ st.set_page_config(
 )
 
 # Carrega e processa os dados (usando o cache se disponível)
-# ATENÇÃO: O caminho do arquivo está fixo. Modifique se necessário.
-file_path = 'zomato-restaurante/database/zomato.csv'
-df_raw = load_and_preprocess_data(file_path)
+# ATENÇÃO: O caminho padrão é relativo à pasta raiz; use FOME_ZERO_DATA para mudá-lo.
+file_path = DATA_SOURCE
+rerun_metrics = RerunMetrics(METRICS_ENABLED)
+with rerun_metrics.stage('load', QUERY_ENGINE) as load_stage:
+    data_fingerprint = source_fingerprint(file_path)
+    engine = get_engine(file_path, data_fingerprint)
+if METRICS_ENABLED and isinstance(engine, PandasEngine):
+    load_stage['rows'] = len(engine.df)
+render_cache = load_render_cache()
+export_registry, export_path = load_export_route()
+export_source = load_export_source(file_path, data_fingerprint)
+exporter = (Exporter(export_registry, export_source, export_path)
+            if export_path is not None and export_source is not None else None)
+# Confere periodicamente se chegou um delta novo
+watch_source(file_path, data_fingerprint)
 
 # Injetar CSS para estilizar o menu de navegação na sidebar
 st.markdown("""
@@ -168,7 +337,7 @@ st.markdown("""
 st.sidebar.title("Fome Zero")
 
 # Menu de navegação principal
-pages_display = ["📊 Main Page", "🌍 Countries", "🏙️ Cities", "🍜 Cuisines"]
+pages_display = ["📊 Main Page", "🌍 Countries", "🏙️ Cities", "🍜 Cuisines", "📍 Nearby", "🔎 Search"]
 selected_page_display = st.sidebar.radio(
     "Navegação",
     pages_display,
@@ -182,304 +351,69 @@ page_id_map = {
     "📊 Main Page": "main_page",
     "🌍 Countries": "countries_page",
     "🏙️ Cities": "cities_page",
-    "🍜 Cuisines": "cuisines_page"
+    "🍜 Cuisines": "cuisines_page",
+    "📍 Nearby": "nearby_page",
+    "🔎 Search": "search_page"
 }
 selected_page_id = page_id_map[selected_page_display]
+rerun_metrics.page = selected_page_id
+
+# Contagens distintas exatas ou estimadas pelos sketches HyperLogLog
+approx_distinct = st.sidebar.toggle(
+    "Contagens aproximadas (HLL)",
+    value=DISTINCT_MODE == 'approx',
+    key="distinct_approx",
+    help="Estima restaurantes, cidades e culinárias distintos juntando sketches "
+         "HyperLogLog por país e por cidade. Erro padrão relativo de "
+         f"{standard_error(SKETCH_GROUPS[('country',)][0]):.2%} nos totais e por país e de "
+         f"{standard_error(SKETCH_GROUPS[('city', 'country')][0]):.2%} por cidade.")
+distinct_mode = 'exact'
+if approx_distinct:
+    with rerun_metrics.stage('load', 'sketches'):
+        engine = SketchEngine(engine, load_sketches(file_path, data_fingerprint))
+    distinct_mode = 'approx'
+if METRICS_ENABLED:
+    engine = InstrumentedEngine(engine, rerun_metrics)
+
+# Relatório de memória do modo compacto
+if COMPACT_MODE and QUERY_ENGINE == 'pandas':
+    df_memory = load_memory_report(file_path, data_fingerprint)
+    with st.sidebar.expander("Memória do dataset"):
+        total = df_memory.loc['total']
+        st.caption(f"Antes: {total['bytes_antes'] / 2**20:,.1f} MB · "
+                   f"Depois: {total['bytes_depois'] / 2**20:,.1f} MB")
+        st.dataframe(df_memory, use_container_width=True)
 
 # =====================================================================
 # LÓGICA DE EXIBIÇÃO DAS PÁGINAS
 # =====================================================================
 
-# --- PÁGINA 1: MAIN PAGE (VISÃO GERAL) ---
-if selected_page_id == "main_page":
-    st.title("🍽️ Fome Zero - Dashboard")
-    st.markdown(
-        "O Melhor lugar para encontrar seu mais novo restaurante favorito!")
-
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("## Filtros")
-    st.sidebar.markdown(
-        "Escolha o(s) País(es) que Deseja visualizar os Restaurantes")
-
-    # Filtro de país para a Main Page
-    unique_countries = sorted(df_raw['country'].unique().tolist())
-    selected_countries = st.sidebar.multiselect(
-        "País(es)",
-        unique_countries,
-        default=unique_countries
-    )
-
-    # Aplica o filtro de país ao DataFrame
-    if selected_countries:
-        df_filtered = df_raw[df_raw['country'].isin(selected_countries)]
-    else:
-        df_filtered = pd.DataFrame()  # DataFrame vazio se nada for selecionado
-
-    st.header("📊 Métricas Gerais")
-
-    # Exibe as métricas em colunas
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("Restaurantes",
-                  f"{df_filtered['restaurant_id'].nunique():.0f}")
-    with col2:
-        st.metric("Países", f"{df_filtered['country'].nunique()}")
-    with col3:
-        st.metric("Cidades", f"{df_filtered['city'].nunique()}")
-    with col4:
-        st.metric("Avaliações", f"{df_filtered['votes'].sum():,}")
-    with col5:
-        st.metric("Culinárias", f"{df_filtered['cuisines'].nunique()}")
-
-    st.markdown("---")
-
-    # Mapa de Restaurantes com Folium
-    st.header("📍 Mapa de Restaurantes")
-    df_map_data = df_filtered.dropna(subset=['latitude', 'longitude']).copy()
-
-    if not df_map_data.empty:
-        map_center = [df_map_data['latitude'].mean(
-        ), df_map_data['longitude'].mean()]
-        zomato_map = folium.Map(location=map_center, zoom_start=2)
-        marker_cluster = MarkerCluster().add_to(zomato_map)
-
-        # Adiciona marcadores ao cluster
-        for _, row in df_map_data.iterrows():
-            popup_html = f"""
-            <b>{row['restaurant_name']}</b><br>
-            Culinária: {row['cuisines']}<br>
-            Avaliação: {row['aggregate_rating']}/5.0 ({row['votes']:.0f} votos)<br>
-            Custo p/ dois: {row['currency']} {row['average_cost_for_two']:.2f}
-            """
-            folium.Marker(
-                location=[row['latitude'], row['longitude']],
-                popup=folium.Popup(popup_html, max_width=300),
-                icon=folium.Icon(color=get_rating_color(
-                    row['aggregate_rating']), icon='cutlery', prefix='fa')
-            ).add_to(marker_cluster)
-
-        # Renderiza o mapa no Streamlit
-        components.html(zomato_map._repr_html_(), height=500, scrolling=True)
-    else:
-        st.info("Não há dados para exibir no mapa com os filtros selecionados.")
-
-# --- PÁGINA 2: COUNTRIES (VISÃO PAÍSES) ---
-elif selected_page_id == "countries_page":
-    st.title("🌍 Visão por Países")
-
-    # Filtros específicos para esta página
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("## Filtros")
-    unique_countries = sorted(df_raw['country'].unique().tolist())
-    selected_countries = st.sidebar.multiselect(
-        "País(es)",
-        unique_countries,
-        default=unique_countries,
-        key="countries_filter"
-    )
-
-    if selected_countries:
-        df_filtered = df_raw[df_raw['country'].isin(selected_countries)]
-    else:
-        df_filtered = pd.DataFrame()
-
-    if not df_filtered.empty:
-        # Gráfico 1: Restaurantes por País
-        df_paises = df_filtered.groupby("country")["restaurant_id"].nunique().reset_index().rename(
-            columns={"restaurant_id": "quantidade"}).sort_values(by="quantidade", ascending=False)
-        grafico_paises = alt.Chart(df_paises).mark_bar().encode(
-            x=alt.X("country:N", title="País", sort="-y"),
-            y=alt.Y("quantidade:Q", title="Quantidade de Restaurantes"),
-            tooltip=["country", "quantidade"]
-        ).properties(title="Quantidade de Restaurantes por País")
-        st.altair_chart(grafico_paises, use_container_width=True)
-
-        st.markdown("---")
-
-        # Gráfico 2: Cidades por País
-        df_cidades_por_pais = df_filtered.groupby("country")["city"].nunique().reset_index(
-        ).rename(columns={"city": "quantidade"}).sort_values(by="quantidade", ascending=False)
-        grafico_cidades = alt.Chart(df_cidades_por_pais).mark_bar().encode(
-            x=alt.X("country:N", title="País", sort="-y"),
-            y=alt.Y("quantidade:Q", title="Quantidade de Cidades"),
-            tooltip=["country", "quantidade"]
-        ).properties(title="Quantidade de Cidades Registradas por País")
-        st.altair_chart(grafico_cidades, use_container_width=True)
-
-        st.markdown("---")
-
-        # Gráficos de Média
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("##### Média de Avaliações por País")
-            df_avg_votes = df_filtered.groupby('country')['votes'].mean().round(
-                2).sort_values(ascending=False).reset_index()
-            grafico_media_avaliacoes = alt.Chart(df_avg_votes).mark_bar().encode(
-                x=alt.X("country:N", title="País", sort='-y'),
-                y=alt.Y("votes:Q", title="Média de Avaliações"),
-                tooltip=["country", alt.Tooltip("votes:Q", format=".2f")]
-            )
-            st.altair_chart(grafico_media_avaliacoes, use_container_width=True)
-
-        with col2:
-            st.markdown("##### Média de Custo (Prato p/ 2) por País")
-            df_avg_cost = df_filtered.groupby('country')['average_cost_for_two'].mean(
-            ).round(2).sort_values(ascending=False).reset_index()
-            grafico_media_preco = alt.Chart(df_avg_cost).mark_bar(color='#ff7f0e').encode(
-                x=alt.X("country:N", title="País", sort='-y'),
-                y=alt.Y("average_cost_for_two:Q",
-                        title="Preço Médio (Prato para Dois)"),
-                tooltip=["country", alt.Tooltip(
-                    "average_cost_for_two:Q", format=".2f")]
-            )
-            st.altair_chart(grafico_media_preco, use_container_width=True)
-    else:
-        st.warning("Nenhum dado disponível para os filtros selecionados.")
-
-# --- PÁGINA 3: CITIES (VISÃO CIDADES) ---
-elif selected_page_id == "cities_page":
-    st.title("🏙️ Visão por Cidades")
-
-    # Filtros específicos para esta página
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("## Filtros")
-    unique_countries = sorted(df_raw['country'].unique().tolist())
-    selected_countries = st.sidebar.multiselect(
-        "País(es)",
-        unique_countries,
-        default=unique_countries,
-        key="cities_filter"
-    )
-
-    if selected_countries:
-        df_filtered = df_raw[df_raw['country'].isin(selected_countries)]
-    else:
-        df_filtered = pd.DataFrame()
-
-    if not df_filtered.empty:
-        # Gráfico 1: Top 10 Cidades com mais restaurantes
-        st.header("Top 10 Cidades com Mais Restaurantes")
-        df_top_cities = df_filtered.groupby(["city", "country"])["restaurant_id"].nunique().reset_index().rename(
-            columns={"restaurant_id": "quantidade"}).sort_values(by="quantidade", ascending=False).head(10)
-        grafico_cidades_restaurantes = alt.Chart(df_top_cities).mark_bar().encode(
-            x=alt.X("city:N", title="Cidade", sort='-y'),
-            y=alt.Y("quantidade:Q", title="Quantidade de Restaurantes"),
-            color=alt.Color("country:N", title="País"),
-            tooltip=["city", "country", "quantidade"]
-        )
-        st.altair_chart(grafico_cidades_restaurantes, use_container_width=True)
-
-        st.markdown("---")
-
-        # Gráficos de Avaliação por Cidade
-        st.header("Análise de Avaliação por Cidade")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("Top 7 Cidades (Avaliação > 4.0)")
-            df_acima_4 = df_filtered[df_filtered["aggregate_rating"] > 4.0].groupby(["city", "country"])["restaurant_id"].nunique(
-            ).reset_index().rename(columns={"restaurant_id": "quantidade"}).sort_values(by="quantidade", ascending=False).head(7)
-            grafico_acima_4 = alt.Chart(df_acima_4).mark_bar().encode(
-                x=alt.X("city:N", title="Cidade", sort='-y'),
-                y=alt.Y("quantidade:Q", title="Qtd. Restaurantes"),
-                color=alt.Color("country:N", title="País"),
-                tooltip=["city", "country", "quantidade"]
-            )
-            st.altair_chart(grafico_acima_4, use_container_width=True)
-
-        with col2:
-            st.subheader("Top 7 Cidades (Avaliação < 2.5)")
-            df_abaixo_2_5 = df_filtered[df_filtered["aggregate_rating"] < 2.5].groupby(["city", "country"])["restaurant_id"].nunique(
-            ).reset_index().rename(columns={"restaurant_id": "quantidade"}).sort_values(by="quantidade", ascending=False).head(7)
-            grafico_abaixo_2_5 = alt.Chart(df_abaixo_2_5).mark_bar(color='#d62728').encode(
-                x=alt.X("city:N", title="Cidade", sort='-y'),
-                y=alt.Y("quantidade:Q", title="Qtd. Restaurantes"),
-                color=alt.Color("country:N", title="País"),
-                tooltip=["city", "country", "quantidade"]
-            )
-            st.altair_chart(grafico_abaixo_2_5, use_container_width=True)
-
-        st.markdown("---")
-
-        # Gráfico 3: Cidades com mais tipos de culinária
-        st.header("Top 10 Cidades com Maior Diversidade Culinária")
-        df_cities_cuisine_count = df_filtered.groupby(["city", "country"])["cuisines"].nunique().reset_index(
-        ).rename(columns={"cuisines": "quantidade"}).sort_values(by="quantidade", ascending=False).head(10)
-        chart_cities_cuisine_count = alt.Chart(df_cities_cuisine_count).mark_bar().encode(
-            x=alt.X("city:N", title="Cidade", sort='-y'),
-            y=alt.Y("quantidade:Q", title="Tipos de Culinária Distintos"),
-            color=alt.Color("country:N", title="País"),
-            tooltip=["city", "country", "quantidade"]
-        )
-        st.altair_chart(chart_cities_cuisine_count, use_container_width=True)
-    else:
-        st.warning("Nenhum dado disponível para os filtros selecionados.")
-
-# --- PÁGINA 4: CUISINES (VISÃO CULINÁRIAS) ---
-elif selected_page_id == "cuisines_page":
-    st.title("🍜 Visão por Culinárias")
-
-    # Filtros na sidebar
-    with st.sidebar:
-        st.markdown("---")
-        st.markdown("## Filtros")
-        country_list = sorted(df_raw['country'].dropna().unique())
-        selected_countries = st.multiselect(
-            "Países", country_list, default=country_list)
-
-        qtd_restaurantes = st.slider(
-            "Qtd. de Restaurantes para exibir", 1, 20, 10)
-
-        cuisine_list = sorted(df_raw['cuisines'].dropna().unique())
-        selected_cuisines = st.multiselect(
-            "Tipos de Culinária", cuisine_list, default=cuisine_list)
-
-    # Aplica filtros
-    df_filtered = df_raw[
-        (df_raw["country"].isin(selected_countries)) &
-        (df_raw["cuisines"].isin(selected_cuisines))
-    ]
-
-    if not df_filtered.empty:
-        # Métricas: Melhores restaurantes por tipo de culinária principal
-        st.header(f"Top {qtd_restaurantes} Restaurantes Mais Bem Avaliados")
-        df_top_n_restaurantes = df_filtered.sort_values(
-            by="aggregate_rating", ascending=False).head(qtd_restaurantes)
-        st.dataframe(df_top_n_restaurantes[[
-            "restaurant_name", "country", "city", "cuisines",
-            "aggregate_rating", "average_cost_for_two", "votes"
-        ]], use_container_width=True)
-
-        st.markdown("---")
-
-        # Gráficos de melhores e piores culinárias
-        st.header("Análise da Avaliação Média por Culinária")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("##### Top 10 Melhores Culinárias")
-            df_melhores_cuisines = df_filtered.groupby("cuisines")["aggregate_rating"].mean().reset_index().rename(
-                columns={"aggregate_rating": "nota_media"}).sort_values(by="nota_media", ascending=False).head(10)
-            chart_melhores = alt.Chart(df_melhores_cuisines).mark_bar().encode(
-                y=alt.Y("cuisines:N", sort='-x', title="Tipo de Culinária"),
-                x=alt.X("nota_media:Q", scale=alt.Scale(
-                    domain=[0, 5]), title="Média da Avaliação"),
-                tooltip=[alt.Tooltip("cuisines"), alt.Tooltip(
-                    "nota_media", format=".2f")]
-            )
-            st.altair_chart(chart_melhores, use_container_width=True)
-
-        with col2:
-            st.markdown("##### Top 10 Piores Culinárias")
-            # Filtra culinárias com nota > 0 para não pegar 'unknown' ou erros
-            df_piores_cuisines = df_filtered[df_filtered['aggregate_rating'] > 0].groupby("cuisines")["aggregate_rating"].mean(
-            ).reset_index().rename(columns={"aggregate_rating": "nota_media"}).sort_values(by="nota_media", ascending=True).head(10)
-            chart_piores = alt.Chart(df_piores_cuisines).mark_bar(color='#d62728').encode(
-                y=alt.Y("cuisines:N", sort='x', title="Tipo de Culinária"),
-                x=alt.X("nota_media:Q", scale=alt.Scale(
-                    domain=[0, 5]), title="Média da Avaliação"),
-                tooltip=[alt.Tooltip("cuisines"), alt.Tooltip(
-                    "nota_media", format=".2f")]
-            )
-            st.altair_chart(chart_piores, use_container_width=True)
-    else:
-        st.warning("Nenhum dado disponível para os filtros selecionados.")
+# Cada página fica num módulo próprio (fome_zero/views), importado apenas
+# quando é aberta pela primeira vez; o modo das contagens distintas entra na
+# chave do cache de renderização junto com o motor. A grade espacial e o
+# índice de busca só são carregados quando as páginas Nearby e Search os pedem
+render_page(PageContext(selected_page_id, engine, rerun_metrics, render_cache,
+                        data_fingerprint, f"{QUERY_ENGINE}-{distinct_mode}",
+                        lambda: load_spatial_index(file_path, data_fingerprint),
+                        lambda: load_search(file_path, data_fingerprint), exporter))
+
+# =====================================================================
+# PAINEL DE DEBUG E EXPORTAÇÃO DAS MÉTRICAS
+# =====================================================================
+
+if METRICS_ENABLED:
+    rerun_record = rerun_metrics.finish()
+    load_metrics_registry().add(rerun_record)
+    with st.sidebar.expander("Debug: desempenho"):
+        cache_stats = render_cache.stats()
+        st.caption(f"Rerun: {rerun_record['seconds'] * 1000:,.1f} ms · "
+                   f"Cache de renderização: {cache_stats['entries']} itens, "
+                   f"{cache_stats['bytes'] / 2**20:,.1f} MB, "
+                   f"{cache_stats['hits']} acertos / {cache_stats['misses']} falhas")
+        df_stages = pd.DataFrame(rerun_record['stages'],
+                                 columns=['stage', 'name', 'seconds', 'rows', 'bytes'])
+        df_stages['ms'] = (df_stages.pop('seconds') * 1000).round(2)
+        df_stages[['rows', 'bytes']] = df_stages[['rows', 'bytes']].astype('Int64')
+        st.dataframe(df_stages, use_container_width=True, hide_index=True)
+        st.dataframe(df_stages.groupby('stage')[['ms', 'rows', 'bytes']].sum(),
+                     use_container_width=True)
@@ -0,0 +1,4 @@
+"""
+Camada de dados do dashboard Fome Zero: carregamento, limpeza e estruturas
+auxiliares usadas pelas páginas do `dash.teste.py`.
+"""
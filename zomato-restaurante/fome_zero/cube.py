@@ -0,0 +1,139 @@
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pandas as pd
+
+# Granularidade do cubo: cada linha é uma combinação país × cidade × culinária
+CUBE_KEYS = ['country', 'city', 'cuisines']
+
+# Medidas de contagem distinta e a coluna com os IDs que as originam. As
+# colunas de IDs só existem no cubo quando algum restaurant_id aparece em
+# mais de uma célula; caso contrário, somar as contagens já é exato.
+DISTINCT_IDS = {
+    'n_restaurants': 'restaurant_ids',
+    'n_above_4': 'ids_above_4',
+    'n_below_2_5': 'ids_below_2_5'
+}
+
+# =====================================================================
+# CONSTRUÇÃO DO CUBO
+# =====================================================================
+
+
+def build_cube(df):
+    """
+    Agrega o DataFrame limpo no grão país × cidade × culinária, com contagens
+    e somas de votos, notas e custos. Todos os gráficos das páginas são
+    calculados a partir dele, sem reagrupar os restaurantes.
+    """
+    rating = df['aggregate_rating']
+    rated = rating > 0
+    work = pd.DataFrame({
+        'country': df['country'],
+        'city': df['city'],
+        'cuisines': df['cuisines'],
+        'restaurant_id': df['restaurant_id'],
+        'id_above_4': df['restaurant_id'].where(rating > 4.0),
+        'id_below_2_5': df['restaurant_id'].where(rating < 2.5),
+        'votes': df['votes'].astype('int64'),
+        'rating': rating,
+        'cost': df['average_cost_for_two'].astype('int64'),
+        'rated': rated.astype('int64'),
+        'rating_rated': rating.where(rated, 0.0)
+    })
+
+    grouped = work.groupby(CUBE_KEYS, dropna=False, observed=True)
+    cube = grouped.agg(
+        n_rows=('restaurant_id', 'size'),
+        n_restaurants=('restaurant_id', 'nunique'),
+        n_above_4=('id_above_4', 'nunique'),
+        n_below_2_5=('id_below_2_5', 'nunique'),
+        votes_sum=('votes', 'sum'),
+        rating_sum=('rating', 'sum'),
+        cost_sum=('cost', 'sum'),
+        n_rated=('rated', 'sum'),
+        rating_sum_rated=('rating_rated', 'sum')
+    )
+
+    # A soma das contagens por célula só coincide com o total distinto quando
+    # nenhum restaurante aparece em duas células
+    if cube['n_restaurants'].sum() != df['restaurant_id'].nunique():
+        for column, ids_column in zip(['restaurant_id', 'id_above_4', 'id_below_2_5'],
+                                      DISTINCT_IDS.values()):
+            cube[ids_column] = grouped[column].unique().map(
+                lambda ids: ids[~pd.isna(ids)])
+
+    # Chaves como texto comum, mesmo se o dataset estiver no modo compacto
+    cube = cube.reset_index()
+    cube[CUBE_KEYS] = cube[CUBE_KEYS].astype(object)
+    return cube
+
+
+def update_cube(cube, df, changed):
+    """
+    Atualiza o cubo depois de uma ingestão incremental (ver
+    fome_zero.data.merge_delta): `df` é o dataset novo e `changed`, as chaves
+    (país, cidade, culinária) das linhas removidas e acrescentadas. Só essas
+    células são reagregadas; quando algum restaurant_id aparece em mais de
+    uma célula, o cubo é refeito por inteiro.
+    """
+    if any(column in cube.columns for column in DISTINCT_IDS.values()):
+        return build_cube(df)
+    affected = pd.MultiIndex.from_frame(changed[CUBE_KEYS].astype(object)).unique()
+    if affected.empty:
+        return cube
+
+    in_affected = pd.MultiIndex.from_frame(df[CUBE_KEYS].astype(object)).isin(affected)
+    cube_affected = build_cube(df[in_affected])
+    untouched = ~pd.MultiIndex.from_frame(cube[CUBE_KEYS]).isin(affected)
+    cube = pd.concat([cube[untouched], cube_affected], ignore_index=True)
+    cube = cube.sort_values(CUBE_KEYS, kind='stable', ignore_index=True)
+    if (any(column in cube.columns for column in DISTINCT_IDS.values())
+            or cube['n_restaurants'].sum() != df['restaurant_id'].nunique()):
+        return build_cube(df)
+    return cube
+
+
+# =====================================================================
+# CONSOLIDAÇÃO (ROLL-UP) DAS MEDIDAS
+# =====================================================================
+
+
+def _count_ids(arrays):
+    """
+    Conta os IDs distintos da união de uma coleção de arrays de IDs.
+    """
+    arrays = [a for a in arrays if len(a)]
+    return len(np.unique(np.concatenate(arrays))) if arrays else 0
+
+
+def rollup_distinct(cube, keys, measure='n_restaurants'):
+    """
+    Contagem distinta de restaurantes por grupo. Grupos sem nenhum restaurante
+    na medida são descartados, como ocorre ao filtrar antes do groupby.
+    """
+    ids_column = DISTINCT_IDS[measure]
+    if ids_column in cube.columns:
+        grouped = cube.groupby(keys)[ids_column].agg(_count_ids).astype('int64')
+    else:
+        grouped = cube.groupby(keys)[measure].sum()
+    return grouped[grouped > 0].rename(measure)
+
+
+def total_distinct(cube, measure='n_restaurants'):
+    """
+    Contagem distinta de restaurantes em todas as células informadas.
+    """
+    ids_column = DISTINCT_IDS[measure]
+    if ids_column in cube.columns:
+        return _count_ids(cube[ids_column].tolist())
+    return int(cube[measure].sum())
+
+
+def rollup_mean(cube, keys, sum_column, count_column='n_rows'):
+    """
+    Média por grupo a partir das somas e contagens do cubo. Grupos sem
+    nenhuma linha na contagem são descartados.
+    """
+    grouped = cube.groupby(keys)[[sum_column, count_column]].sum()
+    grouped = grouped[grouped[count_column] > 0]
+    return grouped[sum_column] / grouped[count_column]
@@ -0,0 +1,424 @@
+# --- Importação das Bibliotecas Necessárias ---
+import glob
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Versão do pipeline de limpeza. Incremente sempre que as etapas de
+# `preprocess_data` mudarem, para invalidar os snapshots já gravados.
+PIPELINE_VERSION = 3
+
+COUNTRIES = {
+    1: "India", 14: "Australia", 30: "Brazil", 37: "Canada",
+    94: "Indonesia", 148: "New Zeland", 162: "Philippines",
+    166: "Qatar", 184: "Singapure", 189: "South Africa",
+    191: "Sri Lanka", 208: "Turkey", 214: "United Arab Emirates",
+    215: "England", 216: "United States of America"
+}
+
+PRICE_TYPES = {1: 'cheap', 2: 'normal', 3: 'expensive'}
+
+# Colunas de texto com poucos valores distintos (viram 'category' no modo
+# compacto) e colunas de texto livre (podem virar strings Arrow)
+CATEGORY_COLUMNS = ['country', 'city', 'cuisines', 'currency', 'price_type',
+                    'rating_color', 'rating_color_name', 'rating_text']
+TEXT_COLUMNS = ['restaurant_name', 'address', 'locality', 'locality_verbose']
+
+# Extensões aceitas quando a origem é uma pasta ou um padrão glob de shards
+SHARD_EXTENSIONS = ('.csv', '.parquet')
+# Abaixo deste tamanho total, iniciar o pool custa mais do que limpar os
+# shards em sequência (cada processo importa o pandas de novo): ~0,9 s de
+# custo fixo contra ~70 MB/s de limpeza, o que dá ~130 MB com 2 núcleos
+# (ver benchmarks/bench_shards.py)
+PARALLEL_MIN_BYTES = 128 * 2**20
+
+# Colunas criadas pela limpeza (não existem no CSV)
+DERIVED_COLUMNS = ['country', 'price_type', 'rating_color_name']
+
+COLORS = {
+    "3F7E00": "darkgreen", "5BA829": "green", "9ACD32": "lightgreen",
+    "CDD614": "orange", "FFBA00": "red", "CBCBC8": "darkred",
+    "FF7800": "darkred"
+}
+
+# =====================================================================
+# FUNÇÕES AUXILIARES DE PRÉ-PROCESSAMENTO
+# =====================================================================
+
+
+@lru_cache(maxsize=None)
+def snake_case(name):
+    """
+    Converte um nome de coluna para snake_case.
+    Exemplo: 'Restaurant ID' -> 'restaurant_id'.
+    """
+    # Importado aqui: só é usado na limpeza, que roda quando o snapshot muda
+    import inflection
+    return inflection.underscore(inflection.titleize(name).replace(" ", ""))
+
+
+def rename_columns(dataframe):
+    """
+    Renomeia as colunas do DataFrame para o formato snake_case.
+    Exemplo: 'Restaurant ID' -> 'restaurant_id'.
+    """
+    df = dataframe.copy(deep=False)
+    df.columns = [snake_case(col) for col in df.columns]
+    return df
+
+
+def find_single_value_columns(df, sample_size=1000):
+    """
+    Retorna as colunas com um único valor não nulo (critério `nunique() == 1`).
+    Colunas que já têm dois valores distintos nas primeiras `sample_size`
+    linhas são descartadas sem varrer o restante.
+    """
+    single_val_cols = []
+    for col in df.columns:
+        if df[col].iloc[:sample_size].nunique() > 1:
+            continue
+        if df[col].nunique() == 1:
+            single_val_cols.append(col)
+    return single_val_cols
+
+
+def distinct_values(series, limit=2, sample_size=1000):
+    """
+    Até `limit` valores distintos não nulos da coluna. Como em
+    `find_single_value_columns`, as primeiras `sample_size` linhas são
+    olhadas antes e a coluna só é varrida se elas não bastarem.
+    """
+    values = series.iloc[:sample_size].dropna().unique()
+    if len(values) < limit:
+        values = series.dropna().unique()
+    return list(values[:limit])
+
+
+def create_price_type(price_range):
+    """
+    Cria a categoria de preço (string) com base no valor numérico de price_range.
+    Recebe a Series inteira; valores fora de PRICE_TYPES viram 'gourmet'.
+    """
+    return price_range.map(PRICE_TYPES).fillna('gourmet')
+
+
+def get_first_cuisine(cuisines):
+    """
+    Mantém apenas o primeiro tipo de culinária de cada restaurante. A limpeza
+    é feita uma vez por valor distinto e depois expandida para todas as linhas.
+    """
+    codes, uniques = pd.factorize(cuisines)
+    first = pd.Index(uniques).str.split(',', n=1).str[0].str.strip()
+    return pd.Series(first.take(codes), index=cuisines.index, name=cuisines.name)
+
+
+def drop_duplicate_rows(df):
+    """
+    Remove as linhas repetidas, com o mesmo resultado de `drop_duplicates()`.
+    Linhas iguais têm o mesmo restaurant_id, então só as de ID repetido
+    passam pela comparação de todas as colunas.
+    """
+    if 'restaurant_id' not in df.columns:
+        return df.drop_duplicates()
+    candidates = df['restaurant_id'].duplicated(keep=False).to_numpy()
+    duplicated = np.zeros(len(df), dtype=bool)
+    duplicated[candidates] = df[candidates].duplicated().to_numpy()
+    return df.take(np.flatnonzero(~duplicated))
+
+# =====================================================================
+# CARREGAMENTO E LIMPEZA PRINCIPAL DOS DADOS
+# =====================================================================
+
+
+def clean_rows(df, columns=None):
+    """
+    Etapas de limpeza linha a linha (1 a 7 de `preprocess_data`), sem o
+    filtro de outliers. Com `columns` (as colunas de um snapshot já gravado,
+    usado na ingestão de deltas), mantém exatamente essas colunas em vez de
+    detectar as de valor único no próprio lote.
+    """
+    # 1. Renomear colunas para o padrão snake_case
+    df = rename_columns(df)
+
+    # 2. Remover colunas com um único valor (não agregam informação)
+    if columns is None:
+        df.drop(columns=find_single_value_columns(df), inplace=True)
+    else:
+        df = df[[col for col in columns if col not in DERIVED_COLUMNS]].copy()
+    return clean_values(df)
+
+
+def clean_values(df):
+    """
+    Etapas de limpeza que dependem apenas das próprias linhas (3 a 7).
+    """
+    # 3. Tratar dados nulos em 'cuisines' e padronizar para o primeiro tipo
+    df['cuisines'] = get_first_cuisine(df['cuisines'].fillna('unknown'))
+
+    # 4. Remover registros duplicados
+    df = drop_duplicate_rows(df)
+
+    # 5. Mapear 'country_code' para o nome do país
+    df['country'] = df['country_code'].map(COUNTRIES)
+
+    # 6. Criar coluna 'price_type' com base na 'price_range'
+    df['price_type'] = create_price_type(df['price_range'])
+
+    # 7. Mapear código de cor para nome da cor
+    df['rating_color_name'] = df['rating_color'].map(COLORS)
+    return df
+
+
+def preprocess_data(df):
+    """
+    Aplica todas as etapas de limpeza e pré-processamento ao DataFrame bruto.
+    """
+    df = clean_rows(df)
+
+    # 8. Filtrar outliers de custo para não distorcer as médias
+    custo = df['average_cost_for_two']
+    limite = custo.mean() + 2 * custo.std()
+    df = df[custo <= limite].copy()
+
+    # 9. Resetar o índice do DataFrame final
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+def load_and_preprocess_data(file_path, workers=None):
+    """
+    Carrega o arquivo CSV (ou os shards de uma pasta ou padrão glob, ver
+    `load_clean_rows`) e aplica todas as etapas de limpeza e pré-processamento.
+    """
+    return split_cost_outliers(load_clean_rows(file_path, workers))[0]
+
+# =====================================================================
+# CARREGAMENTO EM SHARDS (PASTA OU PADRÃO GLOB)
+# =====================================================================
+
+
+def list_shards(source):
+    """
+    Arquivos de dados da origem, em ordem de nome: o próprio arquivo, os
+    .csv e .parquet de uma pasta (sem subpastas) ou os de um padrão glob.
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    elif any(char in source for char in '*?['):
+        paths = glob.glob(source)
+    else:
+        return [source]
+    shards = sorted(path for path in paths
+                    if os.path.isfile(path) and path.endswith(SHARD_EXTENSIONS))
+    if not shards:
+        raise FileNotFoundError(f"Nenhum arquivo .csv ou .parquet em '{source}'.")
+    return shards
+
+
+def read_table(path):
+    """
+    Lê um shard CSV ou Parquet.
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def clean_shard(path):
+    """
+    Lê um shard e aplica as etapas que dependem só das linhas dele (1 e 3 a
+    7); roda num processo do pool. A etapa 2 depende do dataset inteiro: o
+    shard devolve até dois valores distintos de cada coluna bruta para que
+    ela seja decidida na mesclagem.
+    """
+    df = rename_columns(read_table(path))
+    distinct = {col: distinct_values(df[col]) for col in df.columns}
+    return clean_values(df), distinct
+
+
+def merge_shards(results):
+    """
+    Junta os shards limpos, na ordem dos arquivos, e aplica as etapas globais:
+    remove as colunas com um único valor no conjunto inteiro (etapa 2) e as
+    linhas duplicadas entre shards (etapa 4). O resultado é o mesmo da
+    limpeza de um único arquivo com todas as linhas: a deduplicação roda
+    depois da remoção das colunas, então linhas que só diferem numa coluna
+    removida também são descartadas. A deduplicação de cada shard, feita com
+    todas as colunas, só remove linhas que esta também removeria.
+    """
+    frames, distincts = zip(*results)
+    df = pd.concat(frames, ignore_index=True)
+
+    values = {}
+    for distinct in distincts:
+        for col, col_values in distinct.items():
+            values.setdefault(col, set()).update(col_values)
+    df.drop(columns=[col for col, col_values in values.items() if len(col_values) == 1],
+            inplace=True)
+
+    df = drop_duplicate_rows(df)
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+def load_clean_rows(source, workers=None):
+    """
+    Carrega e limpa a origem (etapas 1 a 7, sem o filtro de outliers). Um
+    arquivo único segue o pipeline de sempre; com vários shards, cada um é
+    limpo num processo de um pool de `workers` processos e os resultados são
+    mesclados por `merge_shards`. Sem `workers`, usa um processo por núcleo
+    quando os shards somam ao menos PARALLEL_MIN_BYTES. Com um processo, os
+    shards são concatenados e limpos como um arquivo único.
+    """
+    shards = list_shards(source)
+    if len(shards) == 1:
+        return clean_rows(read_table(shards[0]))
+
+    if workers is None:
+        total_bytes = sum(os.path.getsize(path) for path in shards)
+        workers = (os.cpu_count() or 1) if total_bytes >= PARALLEL_MIN_BYTES else 1
+    workers = min(workers, len(shards))
+    if workers == 1:
+        # Em sequência, limpar shard a shard e mesclar só soma custo: os
+        # shards são concatenados e seguem o pipeline do arquivo único
+        return clean_rows(pd.concat([read_table(path) for path in shards], ignore_index=True))
+    # 'spawn': o servidor do Streamlit tem várias threads, e fork com threads
+    # ativas pode travar o processo filho
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        return merge_shards(list(pool.map(clean_shard, shards)))
+
+# =====================================================================
+# INGESTÃO INCREMENTAL (DELTAS)
+# =====================================================================
+
+
+def cost_stats(custo):
+    """
+    Estatísticas do custo de um conjunto de linhas: contagem, média e soma
+    dos quadrados dos desvios (M2). São combináveis entre lotes.
+    """
+    custo = custo.to_numpy(dtype='float64')
+    mean = float(custo.mean()) if len(custo) else 0.0
+    return {'n': len(custo), 'mean': mean, 'm2': float(((custo - mean) ** 2).sum())}
+
+
+def merge_cost_stats(a, b, sign=1):
+    """
+    Combina as estatísticas de dois lotes (algoritmo paralelo de Chan) ou,
+    com `sign=-1`, retira o lote `b` de `a`.
+    """
+    n = a['n'] + sign * b['n']
+    if n <= 0:
+        return {'n': 0, 'mean': 0.0, 'm2': 0.0}
+    if sign > 0:
+        delta = b['mean'] - a['mean']
+        mean = a['mean'] + delta * b['n'] / n
+        m2 = a['m2'] + b['m2'] + delta ** 2 * a['n'] * b['n'] / n
+    else:
+        mean = (a['n'] * a['mean'] - b['n'] * b['mean']) / n
+        delta = b['mean'] - mean
+        m2 = a['m2'] - b['m2'] - delta ** 2 * n * b['n'] / a['n']
+    return {'n': n, 'mean': mean, 'm2': max(m2, 0.0)}
+
+
+def cost_limit(stats):
+    """
+    Limite de outliers de custo (média + 2 desvios-padrão amostrais).
+    """
+    std = np.sqrt(stats['m2'] / (stats['n'] - 1)) if stats['n'] > 1 else np.nan
+    return stats['mean'] + 2 * std
+
+
+def split_cost_outliers(df, limit=None):
+    """
+    Separa as linhas dentro do limite de custo (etapas 8 e 9 de
+    `preprocess_data`) dos outliers, que ficam guardados para a ingestão
+    incremental: um lote novo muda o limite e pode readmiti-los.
+    """
+    custo = df['average_cost_for_two']
+    if limit is None:
+        limit = custo.mean() + 2 * custo.std()
+    inside = (custo <= limit).to_numpy()
+    return df[inside].reset_index(drop=True), df[~inside].reset_index(drop=True)
+
+
+def merge_delta(df, outliers, stats, delta):
+    """
+    Incorpora um lote novo (CSV bruto) ao dataset limpo sem reprocessá-lo:
+    1. limpa apenas as linhas do lote, com as mesmas colunas do dataset;
+    2. substitui pelo restaurant_id as linhas existentes (inclusive outliers)
+       pelas do lote, que vence quando o mesmo ID aparece nos dois;
+    3. atualiza as estatísticas de custo retirando as linhas substituídas e
+       somando as novas, e recalcula o limite de outliers;
+    4. reaplica o limite: linhas mantidas acima dele viram outliers e
+       outliers abaixo dele voltam, junto com as linhas novas, ao final.
+
+    Retorna o dataset, os outliers, as estatísticas e a máscara das linhas
+    antigas mantidas (na mesma ordem); as demais linhas foram acrescentadas
+    ao final e são as únicas que os derivados precisam processar.
+    """
+    new_rows = clean_rows(delta, columns=df.columns)
+    new_rows = new_rows.drop_duplicates('restaurant_id', keep='last')
+    new_rows.reset_index(drop=True, inplace=True)
+    ids = new_rows['restaurant_id']
+
+    replaced = df['restaurant_id'].isin(ids).to_numpy()
+    replaced_outliers = outliers['restaurant_id'].isin(ids).to_numpy()
+    removed = pd.concat([df['average_cost_for_two'][replaced],
+                         outliers['average_cost_for_two'][replaced_outliers]])
+    stats = merge_cost_stats(stats, cost_stats(removed), sign=-1)
+    stats = merge_cost_stats(stats, cost_stats(new_rows['average_cost_for_two']))
+    limit = cost_limit(stats)
+
+    keep = ~replaced & (df['average_cost_for_two'] <= limit).to_numpy()
+    candidates = pd.concat([outliers[~replaced_outliers], new_rows], ignore_index=True)
+    admitted, rejected = split_cost_outliers(candidates, limit)
+    df_new = pd.concat([df[keep], admitted], ignore_index=True)
+    outliers_new = pd.concat([df[~replaced & ~keep], rejected], ignore_index=True)
+    return df_new, outliers_new, stats, keep
+
+# =====================================================================
+# REPRESENTAÇÃO COMPACTA EM MEMÓRIA
+# =====================================================================
+
+
+def compact_dataframe(df, arrow_strings=False):
+    """
+    Reduz o uso de memória do DataFrame limpo sem alterar nenhum valor:
+    colunas de texto com poucos valores distintos viram 'category', inteiros
+    são reduzidos ao menor tipo que os comporta e, se `arrow_strings` for
+    verdadeiro, o texto livre passa a usar strings Arrow. Os floats (notas e
+    coordenadas) são mantidos em float64 para não alterar médias e o mapa.
+    """
+    df = df.copy()
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if arrow_strings:
+        for col in TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+
+def memory_report(df_before, df_after):
+    """
+    Compara o uso de memória (bytes, com deep=True) e o tipo de cada coluna
+    antes e depois da compactação.
+    """
+    report = pd.DataFrame({
+        'dtype_antes': df_before.dtypes.astype(str),
+        'bytes_antes': df_before.memory_usage(index=False, deep=True),
+        'dtype_depois': df_after.dtypes.astype(str),
+        'bytes_depois': df_after.memory_usage(index=False, deep=True)
+    })
+    report.loc['total'] = ['', report['bytes_antes'].sum(),
+                           '', report['bytes_depois'].sum()]
+    return report
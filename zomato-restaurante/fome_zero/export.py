@@ -0,0 +1,287 @@
+# --- Importação das Bibliotecas Necessárias ---
+import asyncio
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Formatos de exportação e o Content-Type de cada um
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+# Linhas por parte enviada (e por row group do Parquet)
+EXPORT_CHUNK_ROWS = 65536
+
+# Chave da seleção das páginas -> coluna filtrada e tipo dos valores
+SELECTION_COLUMNS = {
+    'countries': ('country', pa.string()),
+    'cuisines': ('cuisines', pa.string()),
+    'restaurant_ids': ('restaurant_id', pa.int64())
+}
+
+# Rota dos downloads, sob o server.baseUrlPath do Streamlit
+EXPORT_ROUTE = r'export/([0-9a-f]{32})\.(csv|parquet)'
+# Versão do Streamlit em que a montagem da rota foi conferida (a mesma fixada
+# no requirements.txt): ela depende de detalhes internos do servidor
+SUPPORTED_STREAMLIT = '1.47.'
+
+# =====================================================================
+# SELEÇÃO DAS LINHAS
+# =====================================================================
+
+
+def filter_selection(batch, selection):
+    """
+    Linhas do lote que pertencem à seleção, com o mesmo critério do filtro
+    compartilhado das páginas: países, culinárias e, nas páginas Nearby e
+    Search, os IDs dos restaurantes do resultado. Chaves ausentes ou None
+    não filtram.
+    """
+    mask = None
+    for key, (column, value_type) in SELECTION_COLUMNS.items():
+        values = selection.get(key)
+        if values is not None:
+            in_values = pc.is_in(batch.column(column), value_set=pa.array(list(values), value_type))
+            mask = in_values if mask is None else pc.and_(mask, in_values)
+    return batch if mask is None else batch.filter(mask)
+
+
+class ArrowFileSource:
+    """
+    Linhas do snapshot Arrow (motor pandas), lidas por memory-map lote a
+    lote: só a parte em preparo fica na memória, não a seleção inteira.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _batches(self, source, reader, selection, chunk_rows):
+        with source:
+            pending, n_pending = [], 0
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                for offset in range(0, batch.num_rows, chunk_rows):
+                    part = filter_selection(batch.slice(offset, chunk_rows), selection)
+                    pending.append(part)
+                    n_pending += part.num_rows
+                    # Junta os pedaços filtrados em partes de ~chunk_rows linhas
+                    if n_pending >= chunk_rows:
+                        yield from pa.Table.from_batches(pending).combine_chunks().to_batches()
+                        pending, n_pending = [], 0
+            if n_pending:
+                yield from pa.Table.from_batches(pending).combine_chunks().to_batches()
+
+    def record_batches(self, selection, chunk_rows=EXPORT_CHUNK_ROWS):
+        """
+        Leitor (pa.RecordBatchReader) das linhas da seleção, em ordem. O
+        arquivo é aberto já aqui (FileNotFoundError se a versão foi removida)
+        e fica mapeado até o último lote, mesmo que seja apagado no meio.
+        """
+        source = pa.memory_map(self.path, 'r')
+        reader = pa.ipc.open_file(source)
+        return pa.RecordBatchReader.from_batches(
+            reader.schema, self._batches(source, reader, selection, chunk_rows))
+
+# =====================================================================
+# GERAÇÃO DOS ARQUIVOS EM PARTES
+# =====================================================================
+
+
+class _ChunkSink:
+    """
+    Destino dos writers do pyarrow que guarda apenas os bytes ainda não
+    enviados ao navegador.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def _open_writer(sink, schema, fmt):
+    # Os writers só são importados quando alguém exporta
+    schema = schema.remove_metadata()
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(sink, schema)
+    import pyarrow.csv as pa_csv
+    return pa_csv.CSVWriter(sink, schema, write_options=pa_csv.WriteOptions(quoting_style='needed'))
+
+
+def export_chunks(reader, fmt):
+    """
+    Gera os bytes do arquivo exportado parte a parte: cada lote do leitor é
+    escrito (uma linha do CSV por restaurante, um row group no Parquet) e
+    enviado antes de ler o próximo. Uma seleção vazia gera só o cabeçalho.
+    """
+    sink = _ChunkSink()
+    writer = _open_writer(sink, reader.schema, fmt)
+    for batch in reader:
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+# =====================================================================
+# ROTA DE DOWNLOADS
+# =====================================================================
+
+
+class ExportRegistry:
+    """
+    Seleções exportáveis, por token, limitadas às `max_entries` registradas
+    mais recentemente. O token é derivado da chave da seleção com um segredo
+    do processo, então não dá para adivinhar o link de outra seleção.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.secret = secrets.token_bytes(16)
+        self.lock = threading.Lock()
+
+    def register(self, key, source, selection, file_stem):
+        token = hashlib.blake2b(key.encode('utf-8'), key=self.secret, digest_size=16).hexdigest()
+        with self.lock:
+            self.entries[token] = (source, selection, file_stem)
+            self.entries.move_to_end(token)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return token
+
+    def get(self, token):
+        with self.lock:
+            return self.entries.get(token)
+
+
+class Exporter:
+    """
+    Links de download de uma versão dos dados: registra a seleção da página
+    e devolve o caminho do arquivo na rota de downloads.
+    """
+
+    def __init__(self, registry, source, base_path):
+        self.registry = registry
+        self.source = source
+        self.base_path = base_path.rstrip('/')
+
+    def url(self, key, selection, file_stem, fmt):
+        token = self.registry.register(key, self.source, selection, file_stem)
+        return f"{self.base_path}/{token}.{fmt}"
+
+
+def find_streamlit_app():
+    """
+    Aplicação Tornado do servidor do Streamlit em execução. O Streamlit não
+    tem ponto de extensão para rotas próprias nem guarda a aplicação num
+    atributo público, então ela é procurada entre os objetos vivos do
+    processo; este é o único ponto do app que depende do servidor interno.
+    Sem servidor (bare mode, AppTest) retorna None. Com outra versão do
+    Streamlit ou sem exatamente uma aplicação, falha com RuntimeError em vez
+    de montar a rota no lugar errado.
+    """
+    import gc
+
+    import streamlit
+    import tornado.web
+    from streamlit.web.server import Server
+
+    objects = gc.get_objects()
+    # type() em vez de isinstance(), que leria o __class__ de proxies como
+    # st.experimental_user (e dispararia o aviso de depreciação)
+    if not any(type(obj) is Server for obj in objects):
+        return None
+    if not streamlit.__version__.startswith(SUPPORTED_STREAMLIT):
+        raise RuntimeError(
+            f"A rota de downloads foi conferida com o Streamlit {SUPPORTED_STREAMLIT}x, "
+            f"mas a versão instalada é a {streamlit.__version__}: instale a versão do "
+            "requirements.txt ou confira find_streamlit_app nesta versão.")
+    apps = [obj for obj in objects if issubclass(type(obj), tornado.web.Application)]
+    if len(apps) != 1:
+        raise RuntimeError(
+            f"Esperada uma aplicação Tornado no servidor do Streamlit, encontradas {len(apps)}.")
+    return apps[0]
+
+
+def mount_export_route(registry, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Serve as seleções registradas em <baseUrlPath>/export/<token>.csv (ou
+    .parquet) no próprio servidor do Streamlit (ver find_streamlit_app), o
+    mesmo endereço que o navegador já abre, e retorna o caminho base dos
+    links. Sem servidor (bare mode, AppTest) retorna None.
+
+    A origem é aberta antes dos cabeçalhos: token desconhecido responde 404
+    e versão dos dados já removida, 410. A resposta não tem Content-Length:
+    as partes são geradas numa thread e enviadas assim que prontas, então o
+    download começa na hora e a memória não cresce com a seleção.
+    """
+    import tornado.web
+    from streamlit import config
+    from streamlit.web.server.server_util import make_url_path_regex
+    from tornado.iostream import StreamClosedError
+
+    app = find_streamlit_app()
+    if app is None:
+        return None
+
+    class ExportHandler(tornado.web.RequestHandler):
+        async def get(self, token, fmt):
+            # O registro vem das settings: com o cache limpo, a rota já
+            # montada passa a usar o registro novo
+            entry = self.settings['fome_zero_export'].get(token)
+            if entry is None:
+                raise tornado.web.HTTPError(404)
+            source, selection, file_stem = entry
+            loop = asyncio.get_running_loop()
+            try:
+                reader = await loop.run_in_executor(None, source.record_batches, selection, chunk_rows)
+            except FileNotFoundError:
+                raise tornado.web.HTTPError(410)
+            self.set_header('Content-Type', EXPORT_FORMATS[fmt])
+            self.set_header('Content-Disposition', f'attachment; filename="{file_stem}.{fmt}"')
+
+            chunks = export_chunks(reader, fmt)
+            try:
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                while chunk is not None:
+                    self.write(chunk)
+                    await self.flush()
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+            except StreamClosedError:
+                pass  # Download cancelado no navegador
+            finally:
+                chunks.close()
+
+    base = config.get_option('server.baseUrlPath')
+    if 'fome_zero_export' not in app.settings:
+        # Antes da regra curinga dos arquivos estáticos do Streamlit
+        app.add_handlers(r'.*$', [(make_url_path_regex(base, EXPORT_ROUTE, trailing_slash='prohibited'),
+                                   ExportHandler)])
+    app.settings['fome_zero_export'] = registry
+    return '/' + '/'.join(filter(None, [base.strip('/'), 'export']))
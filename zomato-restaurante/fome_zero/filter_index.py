@@ -0,0 +1,66 @@
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pandas as pd
+
+# Colunas usadas pelos filtros da sidebar
+FILTER_COLUMNS = ['country', 'cuisines']
+
+# =====================================================================
+# CONSTRUÇÃO DO ÍNDICE DE BITMAPS
+# =====================================================================
+
+
+def build_filter_index(df, columns=FILTER_COLUMNS):
+    """
+    Monta, para cada valor das colunas de filtro, um bitmap (np.packbits) com
+    as linhas em que o valor aparece. Uma seleção vira OR/AND de bitmaps em
+    vez de uma varredura das strings a cada interação.
+    """
+    n_rows = len(df)
+    index = {'n_rows': n_rows}
+    for col in columns:
+        codes, uniques = pd.factorize(df[col])
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        bitmaps = {}
+        for code, value in enumerate(uniques):
+            mask = np.zeros(n_rows, dtype=bool)
+            mask[order[bounds[code]:bounds[code + 1]]] = True
+            bitmaps[value] = np.packbits(mask)
+        index[col] = bitmaps
+    return index
+
+
+def get_values(index, column):
+    """
+    Valores distintos (ordenados) de uma coluna indexada, para as opções dos filtros.
+    """
+    return sorted(index[column])
+
+# =====================================================================
+# APLICAÇÃO DOS FILTROS
+# =====================================================================
+
+
+def select_bitmap(index, column, values):
+    """
+    União (OR) dos bitmaps dos valores selecionados numa coluna.
+    """
+    bitmap = np.zeros((index['n_rows'] + 7) // 8, dtype=np.uint8)
+    bitmaps = index[column]
+    for value in values:
+        if value in bitmaps:
+            np.bitwise_or(bitmap, bitmaps[value], out=bitmap)
+    return bitmap
+
+
+def filter_rows(df, index, countries, cuisines=None):
+    """
+    Filtro compartilhado por todas as páginas: retorna as linhas de `df` dos
+    países selecionados e, se informadas, das culinárias selecionadas.
+    """
+    bitmap = select_bitmap(index, 'country', countries)
+    if cuisines is not None:
+        bitmap &= select_bitmap(index, 'cuisines', cuisines)
+    positions = np.flatnonzero(np.unpackbits(bitmap, count=index['n_rows']))
+    return df.take(positions)
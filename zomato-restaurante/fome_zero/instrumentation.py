@@ -0,0 +1,178 @@
+# --- Importação das Bibliotecas Necessárias ---
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Etapa registrada para cada método do motor de consultas
+ENGINE_STAGES = {
+    'countries': 'filter',
+    'cuisines': 'filter',
+    'rows': 'filter',
+    'top_restaurants': 'filter',
+    'top_per_group': 'filter',
+    'metrics': 'groupby',
+    'count_distinct': 'groupby',
+    'count_values': 'groupby',
+    'mean': 'groupby'
+}
+
+# =====================================================================
+# MEDIÇÃO DE UM RERUN
+# =====================================================================
+
+
+class RerunMetrics:
+    """
+    Registra as etapas de um rerun do script (carga, filtros, agrupamentos,
+    gráficos e mapa) com tempo, linhas processadas e bytes enviados ao
+    navegador. Desabilitado, apenas repassa a execução sem medir.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.page = None
+        self.stages = []
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, stage, name=None):
+        """
+        Mede o bloco como uma etapa. O dicionário entregue ao bloco pode
+        receber 'rows' e 'bytes'.
+        """
+        info = {'stage': stage, 'name': name or stage, 'rows': None, 'bytes': None}
+        if not self.enabled:
+            yield info
+            return
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            info['seconds'] = time.perf_counter() - start
+            self.stages.append(info)
+
+    def finish(self):
+        """
+        Encerra o rerun e retorna o registro completo.
+        """
+        return {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'page': self.page,
+            'seconds': time.perf_counter() - self.start,
+            'stages': self.stages
+        }
+
+
+class InstrumentedEngine:
+    """
+    Envolve um motor de consultas, registrando cada chamada como uma etapa
+    ('filter' ou 'groupby') com o número de linhas do resultado. Resultados
+    que não são tabelas (listas de valores e o dicionário de métricas) ficam
+    sem linhas.
+    """
+
+    def __init__(self, engine, recorder):
+        self.engine = engine
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        attr = getattr(self.engine, name)
+        if name not in ENGINE_STAGES:
+            return attr
+
+        def measured(*args, **kwargs):
+            with self.recorder.stage(ENGINE_STAGES[name], name) as info:
+                result = attr(*args, **kwargs)
+                # DataFrames e Series: linhas devolvidas pela consulta
+                if hasattr(result, 'shape'):
+                    info['rows'] = result.shape[0]
+            return result
+        return measured
+
+# =====================================================================
+# AGREGAÇÃO E EXPORTAÇÃO
+# =====================================================================
+
+
+class MetricsRegistry:
+    """
+    Acumula os registros de todos os reruns do processo e os exporta como
+    JSON lines (um rerun por linha) ou texto no formato do Prometheus.
+    """
+
+    def __init__(self, jsonl_path=None, prometheus_path=None):
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self.lock = threading.Lock()
+        self.reruns = {}
+        self.totals = {}
+
+    def add(self, record):
+        """
+        Incorpora o registro de um rerun e atualiza os arquivos de exportação.
+        """
+        page = record['page'] or 'unknown'
+        with self.lock:
+            self.reruns[page] = self.reruns.get(page, 0) + 1
+            for info in record['stages']:
+                key = (page, info['stage'])
+                total = self.totals.setdefault(key, {'seconds': 0.0, 'rows': 0, 'bytes': 0})
+                total['seconds'] += info['seconds']
+                total['rows'] += info['rows'] or 0
+                total['bytes'] += info['bytes'] or 0
+            if self.jsonl_path:
+                with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            if self.prometheus_path:
+                text = self._prometheus_text()
+                with open(self.prometheus_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+
+    def to_prometheus(self):
+        """
+        Texto no formato de exposição do Prometheus com os totais acumulados.
+        """
+        with self.lock:
+            return self._prometheus_text()
+
+    def _prometheus_text(self):
+        lines = ["# HELP fome_zero_reruns_total Reruns do script por página.",
+                 "# TYPE fome_zero_reruns_total counter"]
+        for page, count in sorted(self.reruns.items()):
+            lines.append(f'fome_zero_reruns_total{{page="{page}"}} {count}')
+        for field, help_text in [('seconds', 'Tempo acumulado por etapa (s).'),
+                                 ('rows', 'Linhas processadas por etapa.'),
+                                 ('bytes', 'Bytes enviados ao navegador por etapa.')]:
+            metric = f"fome_zero_stage_{field}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for (page, stage), total in sorted(self.totals.items()):
+                lines.append(f'{metric}{{page="{page}",stage="{stage}"}} {total[field]}')
+        return '\n'.join(lines) + '\n'
+
+
+def start_metrics_server(registry, port):
+    """
+    Expõe os totais do registro em http://localhost:<port>/metrics numa
+    thread em segundo plano.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,331 @@
+# --- Importação das Bibliotecas Necessárias ---
+import os
+
+import pyarrow as pa
+
+from fome_zero.cube import rollup_distinct, rollup_mean, total_distinct
+from fome_zero.data import COLORS, COUNTRIES, PRICE_TYPES, list_shards, snake_case
+from fome_zero.filter_index import filter_rows, get_values
+from fome_zero.export import EXPORT_CHUNK_ROWS, SELECTION_COLUMNS
+from fome_zero.ranking import top_positions, top_positions_per_group
+from fome_zero.snapshot import (get_snapshot_path, list_deltas, load_snapshot,
+                                remove_old_versions)
+
+# Somas do cubo usadas para calcular a média de cada coluna
+MEAN_SUMS = {
+    'votes': ('votes_sum', 'n_rows'),
+    'average_cost_for_two': ('cost_sum', 'n_rows'),
+    'aggregate_rating': ('rating_sum', 'n_rows')
+}
+
+# Contagens distintas disponíveis e a condição equivalente em SQL
+DISTINCT_MEASURES = {
+    'n_restaurants': 'TRUE',
+    'n_above_4': 'aggregate_rating > 4.0',
+    'n_below_2_5': 'aggregate_rating < 2.5'
+}
+
+# =====================================================================
+# MOTOR PANDAS (EM MEMÓRIA)
+# =====================================================================
+
+
+class PandasEngine:
+    """
+    Motor de consultas em memória: filtros pelos bitmaps e agregações pelo
+    cubo, exatamente como as páginas já calculavam.
+    """
+
+    def __init__(self, df, cube, raw_index, cube_index, rank_index):
+        self.df = df
+        self.cube = cube
+        self.raw_index = raw_index
+        self.cube_index = cube_index
+        self.rank_index = rank_index
+
+    def countries(self):
+        return get_values(self.raw_index, 'country')
+
+    def cuisines(self):
+        return get_values(self.raw_index, 'cuisines')
+
+    def _cube(self, countries, cuisines=None):
+        return filter_rows(self.cube, self.cube_index, countries, cuisines)
+
+    def rows(self, countries, cuisines=None, columns=None):
+        """
+        Restaurantes da seleção (todas as colunas ou apenas `columns`).
+        """
+        df = filter_rows(self.df, self.raw_index, countries, cuisines)
+        return df if columns is None else df[columns]
+
+    def metrics(self, countries):
+        """
+        Métricas gerais da Main Page.
+        """
+        cube = self._cube(countries)
+        return {
+            'restaurants': total_distinct(cube),
+            'countries': cube['country'].nunique(),
+            'cities': cube['city'].nunique(),
+            'votes': cube['votes_sum'].sum(),
+            'cuisines': cube['cuisines'].nunique()
+        }
+
+    def count_distinct(self, keys, countries, measure='n_restaurants'):
+        """
+        Restaurantes distintos por grupo (Series com o nome da medida).
+        """
+        return rollup_distinct(self._cube(countries), keys, measure)
+
+    def count_values(self, keys, column, countries):
+        """
+        Valores distintos de `column` (cidade, culinária) por grupo.
+        """
+        return self._cube(countries).groupby(keys)[column].nunique()
+
+    def mean(self, keys, column, countries, cuisines=None, rated_only=False):
+        """
+        Média de `column` por grupo. Com `rated_only`, considera apenas as
+        notas > 0 (válido só para 'aggregate_rating').
+        """
+        sum_column, count_column = MEAN_SUMS[column]
+        if rated_only:
+            sum_column, count_column = 'rating_sum_rated', 'n_rated'
+        cube = self._cube(countries, cuisines)
+        return rollup_mean(cube, keys, sum_column, count_column).rename(column)
+
+    def top_restaurants(self, countries, cuisines, n, columns):
+        """
+        Os `n` restaurantes mais bem avaliados da seleção (empates pelos
+        votos e pelo restaurant_id), lidos das listas de ranking.
+        """
+        positions = top_positions(self.rank_index, countries, cuisines, n)
+        return self.df.iloc[positions][columns]
+
+    def top_per_group(self, countries, cuisines, n, by, columns):
+        """
+        Os `n` restaurantes mais bem avaliados de cada país ou culinária
+        (`by`), agrupados pela chave em ordem alfabética.
+        """
+        positions = top_positions_per_group(self.rank_index, countries, cuisines, n, by)
+        return self.df.iloc[positions][columns]
+
+# =====================================================================
+# MOTOR DUCKDB (FORA DA MEMÓRIA, MULTI-CORE)
+# =====================================================================
+
+
+def _sql_values(mapping):
+    """
+    Converte um dicionário em uma lista VALUES do SQL.
+    """
+    def literal(value):
+        return str(value) if isinstance(value, int) else "'" + str(value).replace("'", "''") + "'"
+    return ", ".join(f"({literal(k)}, {literal(v)})" for k, v in mapping.items())
+
+
+def find_single_value_columns_sql(con, file_path, columns):
+    """
+    Etapa 2 de preprocess_data no DuckDB: as colunas brutas com um único
+    valor não nulo (count(DISTINCT) ignora os nulos, como o nunique()),
+    contadas numa só leitura do arquivo.
+    """
+    reader = 'read_parquet' if file_path.endswith('.parquet') else 'read_csv_auto'
+    counts = con.execute(
+        "SELECT " + ", ".join(f'count(DISTINCT "{col}")' for col in columns) +
+        f" FROM {reader}(?)", [file_path]).fetchone()
+    return [col for col, n_values in zip(columns, counts) if n_values == 1]
+
+
+def build_cleaning_sql(file_path, columns):
+    """
+    Reproduz em SQL o pipeline de fome_zero.data.preprocess_data sobre o
+    arquivo bruto (CSV ou Parquet), lido diretamente pelo DuckDB. `columns`
+    são as colunas brutas mantidas, já sem as de valor único (ver
+    `find_single_value_columns_sql`): como no pandas, elas saem antes da
+    deduplicação.
+    """
+    reader = 'read_parquet' if file_path.endswith('.parquet') else 'read_csv_auto'
+    source = file_path.replace("'", "''")
+    renamed = ",\n        ".join(f'"{col}" AS {snake_case(col)}' for col in columns)
+    price_cases = " ".join(f"WHEN {k} THEN '{v}'" for k, v in PRICE_TYPES.items())
+    return f"""
+    WITH renamed AS (
+        SELECT {renamed}
+        FROM {reader}('{source}')
+    ),
+    deduplicated AS (
+        SELECT DISTINCT * REPLACE (
+            trim(split_part(coalesce(cuisines, 'unknown'), ',', 1)) AS cuisines)
+        FROM renamed
+    ),
+    enriched AS (
+        SELECT d.*, countries.name AS country,
+               CASE price_range {price_cases} ELSE 'gourmet' END AS price_type,
+               colors.name AS rating_color_name
+        FROM deduplicated d
+        LEFT JOIN (VALUES {_sql_values(COUNTRIES)}) countries(code, name)
+            ON d.country_code = countries.code
+        LEFT JOIN (VALUES {_sql_values(COLORS)}) colors(code, name)
+            ON d.rating_color = colors.code
+    )
+    SELECT * FROM enriched
+    WHERE average_cost_for_two <= (
+        SELECT avg(average_cost_for_two) + 2 * stddev_samp(average_cost_for_two)
+        FROM enriched)
+    """
+
+
+class DuckDBEngine:
+    """
+    Motor de consultas DuckDB. Na primeira carga de cada versão do arquivo,
+    o pipeline de limpeza roda em SQL e o resultado é gravado numa base
+    DuckDB em disco; as consultas das páginas rodam sobre ela em paralelo e
+    sem precisar que o dataset caiba na memória. Com deltas ou shards, a
+    base parte do snapshot Arrow mesclado, que é montado no pandas.
+    """
+
+    def __init__(self, file_path, fingerprint):
+        try:
+            import duckdb
+        except ImportError as exc:
+            raise ImportError(
+                "O motor DuckDB requer o pacote 'duckdb' (pip install duckdb).") from exc
+
+        db_path = get_snapshot_path(file_path, fingerprint, '.duckdb')
+
+        if not os.path.exists(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            tmp_path = f"{db_path}.{os.getpid()}.tmp"
+            with duckdb.connect(tmp_path) as con:
+                if list_deltas(file_path) or list_shards(file_path) != [file_path]:
+                    # Com deltas ou shards, a base parte do snapshot já
+                    # mesclado (ingestão incremental e carga em paralelo)
+                    con.register('snapshot', load_snapshot(file_path, fingerprint))
+                    con.execute("CREATE TABLE restaurants AS SELECT * FROM snapshot")
+                else:
+                    reader = 'read_parquet' if file_path.endswith('.parquet') else 'read_csv_auto'
+                    columns = [row[0] for row in con.execute(
+                        f"DESCRIBE SELECT * FROM {reader}(?)", [file_path]).fetchall()]
+                    single_val_cols = find_single_value_columns_sql(con, file_path, columns)
+                    columns = [col for col in columns if col not in single_val_cols]
+                    con.execute("CREATE TABLE restaurants AS " +
+                                build_cleaning_sql(file_path, columns))
+            os.replace(tmp_path, db_path)
+            remove_old_versions(file_path, fingerprint, ('.duckdb',))
+
+        self.db_path = db_path
+        self.con = duckdb.connect(db_path, read_only=True)
+
+    def _query(self, sql, params=None):
+        # Um cursor por consulta: a conexão é compartilhada entre as sessões
+        return self.con.cursor().execute(sql, params or []).df()
+
+    @staticmethod
+    def _where(cuisines=None):
+        where = "list_contains($countries, country)"
+        if cuisines is not None:
+            where += " AND list_contains($cuisines, cuisines)"
+        return where
+
+    @staticmethod
+    def _params(countries, cuisines=None):
+        params = {'countries': list(countries)}
+        if cuisines is not None:
+            params['cuisines'] = list(cuisines)
+        return params
+
+    def _grouped(self, keys, select, countries, cuisines=None, having=None):
+        """
+        Executa um GROUP BY e devolve uma Series indexada pelas chaves, na
+        mesma ordem do groupby do pandas (chaves ordenadas, sem nulos).
+        """
+        keys = [keys] if isinstance(keys, str) else keys
+        key_list = ", ".join(keys)
+        not_null = " AND ".join(f"{k} IS NOT NULL" for k in keys)
+        sql = (f"SELECT {key_list}, {select} AS value FROM restaurants "
+               f"WHERE {self._where(cuisines)} AND {not_null} "
+               f"GROUP BY {key_list} "
+               + (f"HAVING {having} " if having else "") +
+               f"ORDER BY {key_list}")
+        result = self._query(sql, self._params(countries, cuisines))
+        return result.set_index(keys if len(keys) > 1 else keys[0])['value']
+
+    def countries(self):
+        return self._query("SELECT DISTINCT country FROM restaurants "
+                           "WHERE country IS NOT NULL ORDER BY country")['country'].tolist()
+
+    def cuisines(self):
+        return self._query("SELECT DISTINCT cuisines FROM restaurants "
+                           "WHERE cuisines IS NOT NULL ORDER BY cuisines")['cuisines'].tolist()
+
+    def rows(self, countries, cuisines=None, columns=None):
+        select = "*" if columns is None else ", ".join(columns)
+        return self._query(f"SELECT {select} FROM restaurants WHERE {self._where(cuisines)}",
+                           self._params(countries, cuisines))
+
+    def metrics(self, countries):
+        result = self._query(
+            "SELECT count(DISTINCT restaurant_id) AS restaurants, "
+            "count(DISTINCT country) AS countries, count(DISTINCT city) AS cities, "
+            "coalesce(sum(votes), 0) AS votes, count(DISTINCT cuisines) AS cuisines "
+            f"FROM restaurants WHERE {self._where()}", self._params(countries))
+        return {k: int(v) for k, v in result.iloc[0].items()}
+
+    def count_distinct(self, keys, countries, measure='n_restaurants'):
+        select = f"count(DISTINCT restaurant_id) FILTER (WHERE {DISTINCT_MEASURES[measure]})"
+        return self._grouped(keys, select, countries, having=f"{select} > 0").rename(measure)
+
+    def count_values(self, keys, column, countries):
+        return self._grouped(keys, f"count(DISTINCT {column})", countries).rename(column)
+
+    def mean(self, keys, column, countries, cuisines=None, rated_only=False):
+        select = f"avg({column})"
+        having = None
+        if rated_only:
+            select = f"avg({column}) FILTER (WHERE {column} > 0)"
+            having = f"count(*) FILTER (WHERE {column} > 0) > 0"
+        return self._grouped(keys, select, countries, cuisines, having).rename(column)
+
+    def top_restaurants(self, countries, cuisines, n, columns):
+        return self._query(
+            f"SELECT {', '.join(columns)} FROM restaurants "
+            f"WHERE {self._where(cuisines)} "
+            "ORDER BY aggregate_rating DESC, votes DESC, restaurant_id LIMIT $n",
+            {**self._params(countries, cuisines), 'n': n})
+
+    def top_per_group(self, countries, cuisines, n, by, columns):
+        return self._query(
+            f"SELECT {', '.join(columns)} FROM restaurants "
+            f"WHERE {self._where(cuisines)} AND {by} IS NOT NULL "
+            f"QUALIFY row_number() OVER (PARTITION BY {by} ORDER BY aggregate_rating DESC, "
+            "votes DESC, restaurant_id) <= $n "
+            f"ORDER BY {by}, aggregate_rating DESC, votes DESC, restaurant_id",
+            {**self._params(countries, cuisines), 'n': n})
+
+    def record_batches(self, selection, chunk_rows=EXPORT_CHUNK_ROWS):
+        """
+        Leitor (pa.RecordBatchReader) das linhas da seleção, lidas da base em
+        lotes de `chunk_rows` linhas, para a exportação (ver fome_zero.export).
+        FileNotFoundError se esta versão da base já foi substituída.
+        """
+        if not os.path.exists(self.db_path):
+            raise FileNotFoundError(self.db_path)
+        clauses, params = ["TRUE"], {}
+        for key, (column, _) in SELECTION_COLUMNS.items():
+            if selection.get(key) is not None:
+                clauses.append(f"list_contains(${key}, {column})")
+                params[key] = list(selection[key])
+        cursor = self.con.cursor()
+        reader = cursor.execute(f"SELECT * FROM restaurants WHERE {' AND '.join(clauses)}",
+                                params).fetch_record_batch(chunk_rows)
+
+        # O cursor fica aberto até o último lote ser lido
+        def batches():
+            try:
+                yield from reader
+            finally:
+                cursor.close()
+
+        return pa.RecordBatchReader.from_batches(reader.schema, batches())
@@ -0,0 +1,133 @@
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pandas as pd
+
+# Grupos das listas de ranking: cada par país × culinária tem a sua
+RANK_GROUPS = ['country', 'cuisines']
+
+# =====================================================================
+# SELEÇÃO PARCIAL SOBRE AGREGADOS
+# =====================================================================
+
+
+def top_n(series, n, ascending=False):
+    """
+    Os `n` maiores (ou, com `ascending`, menores) valores de uma Series, por
+    seleção parcial (np.partition): O(len + n log n), sem ordenar a Series
+    inteira. Empates são desfeitos pela ordem do índice (as chaves do
+    groupby, já ordenadas), então o resultado é determinístico.
+    """
+    key = series.to_numpy(dtype='float64')
+    key = np.where(np.isnan(key), np.inf, key if ascending else -key)
+    candidates = np.arange(len(key))
+    if n < len(key):
+        kth = np.partition(key, n - 1)[n - 1]
+        candidates = np.flatnonzero(key <= kth)
+    order = candidates[np.lexsort((candidates, key[candidates]))][:n]
+    return series.iloc[order]
+
+# =====================================================================
+# LISTAS DE RANKING PRÉ-CALCULADAS DOS RESTAURANTES
+# =====================================================================
+
+
+def build_rank_index(df):
+    """
+    Ordena os restaurantes uma única vez por nota (maior primeiro), votos
+    (mais votos primeiro) e restaurant_id, e guarda as posições agrupadas por
+    país × culinária, cada grupo numa faixa contígua já na ordem do ranking.
+    Um top N de qualquer seleção só lê as N primeiras posições de cada grupo
+    selecionado, sem ordenar as linhas filtradas.
+    """
+    order = np.lexsort((df['restaurant_id'].to_numpy(),
+                        -df['votes'].to_numpy(dtype='int64'),
+                        -df['aggregate_rating'].to_numpy(dtype='float64')))
+    rank = np.empty(len(df), dtype='int64')
+    rank[order] = np.arange(len(df))
+
+    # Código de cada grupo; valores nulos ficam com o código 0
+    labels, codes = {}, []
+    for column in RANK_GROUPS:
+        column_codes, uniques = pd.factorize(df[column])
+        labels[column] = pd.Index(np.asarray(uniques, dtype=object))
+        codes.append(column_codes + 1)
+    n_cuisines = len(labels['cuisines']) + 1
+    group = codes[0] * n_cuisines + codes[1]
+
+    members = np.lexsort((rank, group))
+    groups, starts = np.unique(group[members], return_index=True)
+    return {
+        'labels': labels,
+        'n_cuisines': n_cuisines,
+        'groups': groups,
+        'starts': starts,
+        'ends': np.append(starts[1:], len(members)),
+        'members': members,
+        'rank': rank
+    }
+
+
+def _selected_groups(index, countries, cuisines=None):
+    """
+    Grupos dos países (e, se informadas, das culinárias) selecionados, com o
+    mesmo critério do filtro compartilhado das páginas.
+    """
+    groups = index['groups']
+    country_codes = index['labels']['country'].get_indexer(list(countries)) + 1
+    mask = np.isin(groups // index['n_cuisines'], country_codes[country_codes > 0])
+    if cuisines is not None:
+        cuisine_codes = index['labels']['cuisines'].get_indexer(list(cuisines)) + 1
+        mask &= np.isin(groups % index['n_cuisines'], cuisine_codes[cuisine_codes > 0])
+    return np.flatnonzero(mask)
+
+
+def _group_heads(index, selected, n):
+    """
+    As até `n` primeiras posições (no ranking) de cada grupo selecionado e o
+    grupo de cada uma.
+    """
+    starts = index['starts'][selected]
+    lengths = np.minimum(index['ends'][selected] - starts, n)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    slots = np.arange(lengths.sum()) - offsets + np.repeat(starts, lengths)
+    return index['members'][slots], np.repeat(index['groups'][selected], lengths)
+
+
+def top_positions(index, countries, cuisines, n):
+    """
+    Posições dos `n` restaurantes mais bem avaliados da seleção, em ordem.
+    Os candidatos são as `n` primeiras posições de cada grupo selecionado,
+    então o custo depende de `n` e do número de grupos, não das linhas.
+    """
+    positions, _ = _group_heads(index, _selected_groups(index, countries, cuisines), n)
+    ranks = index['rank'][positions]
+    if len(ranks) > n:
+        keep = np.argpartition(ranks, n - 1)[:n]
+        positions, ranks = positions[keep], ranks[keep]
+    return positions[np.argsort(ranks)]
+
+
+def top_positions_per_group(index, countries, cuisines, n, by):
+    """
+    Posições dos `n` restaurantes mais bem avaliados de cada país
+    (`by='country'`) ou de cada culinária (`by='cuisines'`) da seleção,
+    agrupadas pela chave em ordem alfabética e, dentro dela, pelo ranking.
+    """
+    positions, groups = _group_heads(index, _selected_groups(index, countries, cuisines), n)
+    if by == 'country':
+        codes = groups // index['n_cuisines']
+    else:
+        codes = groups % index['n_cuisines']
+    codes = codes - 1
+    keep = codes >= 0
+    positions, codes = positions[keep], codes[keep]
+
+    # Ordem alfabética da chave, depois o ranking; N primeiros de cada chave
+    names = index['labels'][by]
+    alphabetical = np.empty(len(names), dtype='int64')
+    alphabetical[np.argsort(names.to_numpy(dtype=str), kind='stable')] = np.arange(len(names))
+    order = np.lexsort((index['rank'][positions], alphabetical[codes]))
+    positions, codes = positions[order], codes[order]
+    run_starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    position_in_run = np.arange(len(codes)) - np.repeat(run_starts, np.diff(np.r_[run_starts, len(codes)]))
+    return positions[position_in_run < n]
@@ -0,0 +1,170 @@
+# --- Importação das Bibliotecas Necessárias ---
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+# =====================================================================
+# CHAVES E TAMANHOS
+# =====================================================================
+
+
+def normalize_selection(selection):
+    """
+    Normaliza a seleção de filtros: listas viram tuplas ordenadas, para que
+    a mesma seleção em outra ordem gere a mesma chave.
+    """
+    return tuple(sorted(
+        (name, tuple(sorted(map(str, value))) if isinstance(value, (list, tuple, set)) else value)
+        for name, value in selection.items()))
+
+
+def make_key(page, name, selection, fingerprint):
+    """
+    Chave de um item renderizado: página, nome do elemento, seleção
+    normalizada e impressão digital do dataset.
+    """
+    raw = repr((page, name, normalize_selection(selection), fingerprint))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def spec_nbytes(spec):
+    """
+    Tamanho de uma especificação Vega-Lite: o JSON, com os datasets embutidos.
+    """
+    return len(json.dumps(spec).encode('utf-8'))
+
+
+def spec_rows(spec):
+    """
+    Linhas dos datasets embutidos numa especificação Vega-Lite.
+    """
+    return sum(len(rows) for rows in spec.get('datasets', {}).values())
+
+
+def value_nbytes(value):
+    """
+    Tamanho aproximado de um item do cache (HTML, pontos do mapa ou
+    especificação Vega-Lite).
+    """
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if hasattr(value, 'memory_usage'):
+        return int(value.memory_usage(deep=True).sum())
+    return spec_nbytes(value)
+
+# =====================================================================
+# CACHE LRU
+# =====================================================================
+
+
+class RenderCache:
+    """
+    Cache LRU de itens já renderizados (HTML e pontos do mapa e
+    especificações Vega-Lite), limitado em entradas e em bytes. Com
+    `spill_dir`, os itens removidos da memória são gravados em disco (até
+    `max_disk_bytes`) e recarregados quando pedidos de novo.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 2**20, spill_dir=None,
+                 max_disk_bytes=256 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def _spill_path(self, key):
+        return os.path.join(self.spill_dir, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        Retorna o item da chave (ou None), marcando-o como o mais recente.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+        value = self._read_spill(key)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Guarda um item, removendo os menos usados até respeitar os limites.
+        Itens maiores que o limite de bytes não são guardados.
+        """
+        nbytes = value_nbytes(value)
+        if nbytes > self.max_bytes or self.max_entries <= 0:
+            return
+        evicted = []
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key)[1]
+            self.entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+                old_key, (old_value, old_nbytes) = self.entries.popitem(last=False)
+                self.nbytes -= old_nbytes
+                evicted.append((old_key, old_value))
+        for old_key, old_value in evicted:
+            self._write_spill(old_key, old_value)
+
+    def _read_spill(self, key):
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _write_spill(self, key, value):
+        if not self.spill_dir:
+            return
+        path = self._spill_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        # Limite do disco: remove os arquivos mais antigos
+        files = []
+        for name in os.listdir(self.spill_dir):
+            if name.endswith('.pkl'):
+                try:
+                    stat = os.stat(os.path.join(self.spill_dir, name))
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.spill_dir, name))
+            except OSError:
+                pass
+            total -= size
+
+    def stats(self):
+        """
+        Entradas, bytes em memória, acertos e falhas.
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.nbytes,
+                    'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,200 @@
+# --- Importação das Bibliotecas Necessárias ---
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Campos indexados e o peso de cada um na relevância
+SEARCH_FIELDS = {
+    'restaurant_name': 3,
+    'locality_verbose': 2,
+    'city': 2,
+    'cuisines': 1
+}
+FIELD_WEIGHTS = np.array(list(SEARCH_FIELDS.values()), dtype='int8')
+# Maior peso de um termo (o dobro do maior campo, com a palavra completa)
+MAX_WEIGHT = 2 * int(FIELD_WEIGHTS.max())
+
+# Colunas exibidas nos resultados da busca
+SEARCH_RESULT_COLUMNS = ["restaurant_name", "locality_verbose", "city", "country", "cuisines",
+                         "aggregate_rating", "votes", "currency", "average_cost_for_two"]
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+MIN_PREFIX_LENGTH = 2
+MAX_QUERY_TERMS = 8
+
+# =====================================================================
+# NORMALIZAÇÃO DO TEXTO
+# =====================================================================
+
+
+def normalize_text(text):
+    """
+    Minúsculas e sem acentos: 'Café São Paulo' -> 'cafe sao paulo'.
+    """
+    decomposed = unicodedata.normalize('NFKD', str(text).lower())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    """
+    Separa o texto normalizado em termos alfanuméricos.
+    """
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+# =====================================================================
+# CONSTRUÇÃO DO ÍNDICE
+# =====================================================================
+
+
+def build_search_index(df):
+    """
+    Monta um índice invertido de termos: o vocabulário ordenado e, para cada
+    termo, a lista contígua das linhas e campos em que aparece. Uma busca
+    por prefixo vira duas buscas binárias no vocabulário e uma fatia das
+    listas, sem varrer o DataFrame. O texto de cada valor distinto é
+    normalizado uma única vez.
+    """
+    parts = []
+    for field, column in enumerate(SEARCH_FIELDS):
+        codes, uniques = pd.factorize(df[column])
+        terms = pd.Series(uniques, dtype=object).map(tokenize).explode().dropna()
+        value_terms = pd.DataFrame({'code': terms.index, 'term': terms.to_numpy()})
+        rows = pd.DataFrame({'code': codes, 'row': np.arange(len(df))})
+        part = rows.merge(value_terms, on='code')[['term', 'row']]
+        part['field'] = field
+        parts.append(part)
+
+    postings = pd.concat(parts, ignore_index=True).drop_duplicates()
+    postings = postings.sort_values(['term', 'row', 'field'], kind='stable')
+    vocab, starts = np.unique(postings['term'].to_numpy(dtype=str), return_index=True)
+
+    # Chave estática de desempate: nota (uma casa decimal) e votos
+    rating10 = np.rint(df['aggregate_rating'].to_numpy(dtype='float64') * 10).astype('int64')
+    votes = np.clip(df['votes'].to_numpy(dtype='int64'), 0, (1 << 40) - 1)
+    return {
+        'n_rows': len(df),
+        'vocab': vocab,
+        'offsets': np.append(starts, len(postings)).astype('int64'),
+        'rows': postings['row'].to_numpy(dtype='int64'),
+        'fields': postings['field'].to_numpy(dtype='int8'),
+        'rank_key': (rating10 << 40) | votes
+    }
+
+
+def update_search_index(index, df, keep):
+    """
+    Atualiza o índice depois de uma ingestão incremental (ver
+    fome_zero.data.merge_delta): `keep` marca as linhas antigas que seguem no
+    dataset, e as linhas de `df` depois delas são as acrescentadas. Os
+    postings das linhas antigas substituídas pelo delta são descartados; os
+    das linhas mantidas são renumerados e intercalados com os das linhas
+    novas, as únicas tokenizadas, sem reconstruir o índice.
+    """
+    n_kept = int(keep.sum())
+    added = build_search_index(df.iloc[n_kept:].reset_index(drop=True))
+    vocab = np.union1d(index['vocab'], added['vocab'])
+
+    # Postings antigos: só os das linhas mantidas, com as novas posições
+    old_terms = np.repeat(np.searchsorted(vocab, index['vocab']), np.diff(index['offsets']))
+    kept_postings = keep[index['rows']]
+    new_position = np.cumsum(keep) - 1
+    new_terms = np.repeat(np.searchsorted(vocab, added['vocab']), np.diff(added['offsets']))
+
+    # As duas listas já estão ordenadas por (termo, linha, campo) e as linhas
+    # novas vêm depois das antigas: a ordenação estável por termo as intercala
+    terms = np.concatenate([old_terms[kept_postings], new_terms])
+    order = np.argsort(terms, kind='stable')
+    counts = np.bincount(terms, minlength=len(vocab))
+    return {
+        'n_rows': len(df),
+        'vocab': vocab[counts > 0],
+        'offsets': np.append(0, np.cumsum(counts[counts > 0])).astype('int64'),
+        'rows': np.concatenate([new_position[index['rows'][kept_postings]],
+                                added['rows'] + n_kept])[order],
+        'fields': np.concatenate([index['fields'][kept_postings], added['fields']])[order],
+        'rank_key': np.concatenate([index['rank_key'][keep], added['rank_key']])
+    }
+
+
+def write_search_index(index, path):
+    """
+    Grava o índice em .npz sem compressão, de forma atômica.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, **{k: np.asarray(v) for k, v in index.items()})
+    os.replace(tmp_path, path)
+
+
+def read_search_index(path):
+    """
+    Lê um índice gravado por write_search_index.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        index = {k: data[k] for k in data.files}
+    index['n_rows'] = int(index['n_rows'])
+    return index
+
+# =====================================================================
+# BUSCA
+# =====================================================================
+
+
+def _term_scores(index, term):
+    """
+    Relevância de cada linha para um termo digitado (prefixo): o peso do
+    melhor campo em que ele aparece, dobrado quando o termo é uma palavra
+    completa. Retorna as linhas em que o termo aparece, em ordem crescente,
+    e a relevância de cada uma, calculadas só sobre os postings do termo.
+    """
+    vocab, offsets = index['vocab'], index['offsets']
+    lo = np.searchsorted(vocab, term, side='left')
+    hi = np.searchsorted(vocab, term + '\uffff', side='left')
+    if lo == hi:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+    start, end = offsets[lo], offsets[hi]
+    rows = index['rows'][start:end]
+    weights = FIELD_WEIGHTS[index['fields'][start:end]].astype('int64')
+    if vocab[lo] == term:
+        weights[:offsets[lo + 1] - start] *= 2
+
+    # Uma única ordenação por (linha, maior peso primeiro): o primeiro
+    # posting de cada linha traz o maior peso dela
+    key = np.sort((rows << 4) | (MAX_WEIGHT - weights))
+    rows = key >> 4
+    first = np.append(True, rows[1:] != rows[:-1])
+    return rows[first], MAX_WEIGHT - (key[first] & 15)
+
+
+def search(index, query, n=20):
+    """
+    Busca instantânea: as linhas em que todos os termos da consulta aparecem
+    (cada termo vale como prefixo, então a palavra sendo digitada já conta),
+    ordenadas por relevância, nota e votos.
+    Retorna as posições das linhas e a relevância de cada uma.
+    """
+    terms = [t for t in tokenize(query) if len(t) >= MIN_PREFIX_LENGTH][:MAX_QUERY_TERMS]
+    if not terms:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+
+    # Interseção das linhas de cada termo, somando as relevâncias
+    positions, total = _term_scores(index, terms[0])
+    for term in terms[1:]:
+        rows, scores = _term_scores(index, term)
+        positions, in_total, in_rows = np.intersect1d(positions, rows, assume_unique=True,
+                                                      return_indices=True)
+        total = total[in_total] + scores[in_rows]
+    if len(positions) == 0:
+        return positions, total
+
+    # Chave única (relevância, nota, votos): seleção parcial dos n melhores
+    # e ordenação apenas deles, com a posição como desempate final
+    key = (total << 50) | index['rank_key'][positions]
+    if len(positions) > n:
+        kth = np.partition(key, len(key) - n)[len(key) - n]
+        keep = key >= kth
+        positions, key, total = positions[keep], key[keep], total[keep]
+    order = np.lexsort((positions, -key))[:n]
+    return positions[order], total[order]
@@ -0,0 +1,340 @@
+# --- Importação das Bibliotecas Necessárias ---
+import glob
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from fome_zero.cube import CUBE_KEYS, build_cube, update_cube
+from fome_zero.data import (PIPELINE_VERSION, cost_stats, list_shards, load_clean_rows,
+                            merge_delta, split_cost_outliers)
+from fome_zero.search_index import (build_search_index, read_search_index,
+                                    update_search_index, write_search_index)
+
+# Os snapshots ficam numa pasta oculta ao lado do arquivo de origem (ou
+# dentro da pasta de shards)
+SNAPSHOT_DIR = '.snapshots'
+CHUNK_SIZE = 1 << 20
+
+# Lotes incrementais (deltas) de um arquivo: CSVs com as mesmas colunas em
+# <pasta do arquivo>/deltas/<nome do arquivo>/, aplicados em ordem de nome
+DELTA_DIR = 'deltas'
+FINGERPRINT_PATTERN = r'[0-9a-f]{16}'
+
+# Arquivos gravados para cada versão: o snapshot e os derivados ao lado dele
+SNAPSHOT_FILES = ('.arrow', '.outliers.arrow', '.cube.pkl', '.search.npz', '.state.json')
+
+# =====================================================================
+# IMPRESSÃO DIGITAL DO ARQUIVO DE ORIGEM
+# =====================================================================
+
+
+def source_location(source):
+    """
+    Pasta e nome-base usados nos snapshots e deltas da origem: a pasta e o
+    nome do arquivo; a própria pasta de shards e o nome dela; ou, num padrão
+    glob, a primeira pasta sem curingas e o padrão sem os curingas.
+    """
+    if os.path.isdir(source):
+        source = os.path.normpath(source)
+        return source, os.path.basename(source)
+    folder, name = os.path.split(source)
+    while any(char in folder for char in '*?['):
+        folder = os.path.dirname(folder)
+    stem = re.sub(r'[*?\[\]]', '_', os.path.splitext(name)[0])
+    return folder, stem
+
+
+@lru_cache(maxsize=32)
+def _content_hash(file_path, size, mtime_ns):
+    """
+    Calcula o hash do conteúdo do arquivo. O tamanho e o mtime entram apenas
+    como chave do cache, para que o arquivo só seja relido quando mudar.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_hash(file_path):
+    """
+    Hash do conteúdo do arquivo, recalculado apenas quando ele muda.
+    """
+    stat = os.stat(file_path)
+    return _content_hash(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+def base_fingerprint(file_path):
+    """
+    Impressão digital apenas da origem: hash do conteúdo, mtime e versão do
+    pipeline; com shards, também o nome de cada um (shard novo, removido ou
+    alterado gera outra impressão digital).
+    """
+    shards = list_shards(file_path)
+    if shards == [file_path]:
+        key = f"{file_hash(file_path)}:{os.stat(file_path).st_mtime_ns}:{PIPELINE_VERSION}"
+    else:
+        folder = source_location(file_path)[0]
+        key = ''.join(f"{os.path.relpath(path, folder)}:{file_hash(path)}:"
+                      f"{os.stat(path).st_mtime_ns}:" for path in shards)
+        key += str(PIPELINE_VERSION)
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def delta_folder(file_path):
+    """
+    Pasta dos lotes incrementais da origem.
+    """
+    folder, stem = source_location(file_path)
+    return os.path.join(folder, DELTA_DIR, stem)
+
+
+def list_deltas(file_path):
+    """
+    Lotes incrementais do arquivo, em ordem de nome, como pares (nome, hash).
+    Arquivos ainda sendo gravados devem ganhar a extensão .csv só no fim
+    (por exemplo, gravando como .csv.tmp e renomeando).
+    """
+    return [(os.path.basename(path), file_hash(path))
+            for path in sorted(glob.glob(os.path.join(delta_folder(file_path), '*.csv')))]
+
+
+def source_fingerprint(file_path):
+    """
+    Retorna a impressão digital do arquivo de origem: hash do conteúdo, mtime
+    e versão do pipeline, mais o nome e o hash de cada delta. Qualquer
+    mudança em um deles (inclusive um delta novo) gera um novo snapshot.
+    """
+    fingerprint = base_fingerprint(file_path)
+    deltas = list_deltas(file_path)
+    if not deltas:
+        return fingerprint
+    key = fingerprint + ''.join(f":{name}:{digest}" for name, digest in deltas)
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+# =====================================================================
+# LEITURA E GRAVAÇÃO DO SNAPSHOT
+# =====================================================================
+
+
+def get_snapshot_path(file_path, fingerprint, suffix='.arrow'):
+    """
+    Caminho do snapshot Arrow (Feather v2) para a impressão digital informada
+    ou, com `suffix`, de um dos arquivos gravados junto com ele.
+    """
+    folder, stem = source_location(file_path)
+    return os.path.join(folder, SNAPSHOT_DIR, f"{stem}-{fingerprint}{suffix}")
+
+
+def snapshot_versions(file_path, suffix='.arrow'):
+    """
+    Impressões digitais das versões gravadas da origem que têm o arquivo
+    `suffix`. Só conta nomes exatamente no formato <nome>-<impressão digital>,
+    para não confundir origens cujo nome começa igual.
+    """
+    folder = os.path.dirname(get_snapshot_path(file_path, '', suffix))
+    stem = source_location(file_path)[1]
+    pattern = re.compile(f"{re.escape(stem)}-({FINGERPRINT_PATTERN}){re.escape(suffix)}")
+    if not os.path.isdir(folder):
+        return []
+    return [match.group(1) for match in map(pattern.fullmatch, os.listdir(folder)) if match]
+
+
+def remove_old_versions(file_path, fingerprint, suffixes=SNAPSHOT_FILES):
+    """
+    Remove os arquivos `suffixes` das demais versões gravadas da origem.
+    """
+    for suffix in suffixes:
+        for old in snapshot_versions(file_path, suffix):
+            if old != fingerprint:
+                os.remove(get_snapshot_path(file_path, old, suffix))
+
+
+def get_search_index_path(file_path, fingerprint):
+    """
+    Caminho do índice de busca gravado junto com o snapshot.
+    """
+    return get_snapshot_path(file_path, fingerprint, '.search.npz')
+
+
+def write_snapshot(df, path):
+    """
+    Grava o DataFrame limpo como Arrow sem compressão (mapeável em memória),
+    de forma atômica.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(df, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, columns=None):
+    """
+    Lê o snapshot por memory-map, sem reprocessar o CSV. Com `columns`, só
+    essas colunas são convertidas para o DataFrame.
+    """
+    with pa.memory_map(path, 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas()
+
+
+def _write_atomic(path, write):
+    """
+    Grava um arquivo derivado via arquivo temporário e os.replace.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _write_json(data, path):
+    """
+    Grava o estado da versão (deltas aplicados e estatísticas de custo).
+    """
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+# =====================================================================
+# CONSTRUÇÃO (COMPLETA OU INCREMENTAL) DO SNAPSHOT
+# =====================================================================
+
+
+def _find_previous_state(file_path, base, deltas):
+    """
+    Procura a versão gravada mais recente do mesmo arquivo de origem cujos
+    deltas aplicados são um prefixo dos atuais. Retorna a impressão digital
+    e o estado dela, ou (None, None).
+    """
+    candidates = []
+    for fingerprint in snapshot_versions(file_path, '.state.json'):
+        try:
+            with open(get_snapshot_path(file_path, fingerprint, '.state.json')) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            continue
+        applied = [tuple(delta) for delta in state['deltas']]
+        if state['base'] == base and applied == deltas[:len(applied)]:
+            candidates.append((len(applied), fingerprint, state))
+    if not candidates:
+        return None, None
+    _, fingerprint, state = max(candidates, key=lambda candidate: candidate[0])
+    if not all(os.path.exists(get_snapshot_path(file_path, fingerprint, suffix))
+               for suffix in SNAPSHOT_FILES):
+        return None, None
+    return fingerprint, state
+
+
+def build_snapshot(file_path, fingerprint):
+    """
+    Monta e grava a versão atual do dataset: o snapshot, os outliers de custo,
+    o cubo, o índice de busca e o estado (deltas aplicados e estatísticas de
+    custo). Quando há uma versão anterior do mesmo arquivo de origem, parte
+    dela e processa apenas os deltas pendentes; caso contrário, limpa o
+    arquivo inteiro e aplica todos os deltas pela mesma rotina.
+    """
+    base = base_fingerprint(file_path)
+    deltas = list_deltas(file_path)
+    previous, state = _find_previous_state(file_path, base, deltas)
+    if previous is not None:
+        df = read_snapshot(get_snapshot_path(file_path, previous))
+        outliers = read_snapshot(get_snapshot_path(file_path, previous, '.outliers.arrow'))
+        cube = pd.read_pickle(get_snapshot_path(file_path, previous, '.cube.pkl'))
+        search_index = read_search_index(get_search_index_path(file_path, previous))
+        stats = state['cost_stats']
+        applied = len(state['deltas'])
+    else:
+        clean = load_clean_rows(file_path)
+        stats = cost_stats(clean['average_cost_for_two'])
+        df, outliers = split_cost_outliers(clean)
+        cube = build_cube(df)
+        search_index = build_search_index(df)
+        applied = 0
+
+    folder = delta_folder(file_path)
+    for name, _ in deltas[applied:]:
+        df_old = df
+        df, outliers, stats, keep = merge_delta(
+            df, outliers, stats, pd.read_csv(os.path.join(folder, name)))
+        changed = pd.concat([df_old[~keep][CUBE_KEYS], df.iloc[int(keep.sum()):][CUBE_KEYS]])
+        cube = update_cube(cube, df, changed)
+        search_index = update_search_index(search_index, df, keep)
+
+    try:
+        write_snapshot(df, get_snapshot_path(file_path, fingerprint))
+        _write_atomic(get_snapshot_path(file_path, fingerprint, '.outliers.arrow'),
+                      lambda path: feather.write_feather(outliers, path, compression='uncompressed'))
+        _write_atomic(get_snapshot_path(file_path, fingerprint, '.cube.pkl'),
+                      lambda path: cube.to_pickle(path))
+        write_search_index(search_index, get_search_index_path(file_path, fingerprint))
+        # O estado é gravado por último: marca a versão como completa
+        state = {'base': base, 'deltas': deltas, 'cost_stats': stats}
+        _write_atomic(get_snapshot_path(file_path, fingerprint, '.state.json'),
+                      lambda path: _write_json(state, path))
+        remove_old_versions(file_path, fingerprint)
+    except OSError:
+        # Pasta somente leitura: segue sem snapshot, apenas com o cache em memória
+        pass
+    return df
+
+
+def load_snapshot(file_path, fingerprint=None, columns=None):
+    """
+    Retorna o DataFrame limpo (ou apenas as colunas `columns`) a partir do
+    snapshot correspondente à impressão digital atual do arquivo,
+    reconstruindo-o quando o arquivo mudou.
+    """
+    if fingerprint is None:
+        fingerprint = source_fingerprint(file_path)
+    path = get_snapshot_path(file_path, fingerprint)
+    if os.path.exists(path):
+        return read_snapshot(path, columns)
+    df = build_snapshot(file_path, fingerprint)
+    return df if columns is None else df[columns]
+
+
+def load_snapshot_cube(file_path, fingerprint=None):
+    """
+    Retorna o cubo gravado com o snapshot atual, montando-o a partir do
+    snapshot quando ainda não existe.
+    """
+    if fingerprint is None:
+        fingerprint = source_fingerprint(file_path)
+    path = get_snapshot_path(file_path, fingerprint, '.cube.pkl')
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+
+    cube = build_cube(load_snapshot(file_path, fingerprint))
+    try:
+        _write_atomic(path, lambda tmp_path: cube.to_pickle(tmp_path))
+    except OSError:
+        pass
+    return cube
+
+
+def load_search_index(file_path, fingerprint=None):
+    """
+    Retorna o índice de busca gravado com o snapshot atual, montando-o a
+    partir do snapshot quando ainda não existe (por exemplo, snapshots
+    gravados antes do índice).
+    """
+    if fingerprint is None:
+        fingerprint = source_fingerprint(file_path)
+    path = get_search_index_path(file_path, fingerprint)
+    if os.path.exists(path):
+        return read_search_index(path)
+
+    index = build_search_index(load_snapshot(file_path, fingerprint))
+    try:
+        write_search_index(index, path)
+    except OSError:
+        pass
+    return index
@@ -0,0 +1,207 @@
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+
+# Colunas guardadas no índice: o suficiente para listar os resultados
+SPATIAL_COLUMNS = ["restaurant_id", "restaurant_name", "country", "city", "cuisines",
+                   "aggregate_rating", "votes", "currency", "average_cost_for_two",
+                   "latitude", "longitude"]
+
+# Lado da célula da grade, em graus (~5,5 km na latitude)
+CELL_DEGREES = 0.05
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180
+
+# =====================================================================
+# CONSTRUÇÃO DA GRADE ESPACIAL
+# =====================================================================
+
+
+def _cell_rows_cols(lat, lon, cell_degrees):
+    """
+    Linha e coluna da célula da grade de cada coordenada.
+    """
+    i = np.floor((np.asarray(lat, dtype='float64') + 90) / cell_degrees).astype('int64')
+    j = np.floor((np.asarray(lon, dtype='float64') + 180) / cell_degrees).astype('int64')
+    return i, j
+
+
+def build_spatial_index(df, cell_degrees=CELL_DEGREES):
+    """
+    Monta a grade espacial: os restaurantes com coordenadas são ordenados
+    pela chave da célula (linha × largura + coluna), então as células de uma
+    mesma linha da grade ficam contíguas e uma consulta lê só as faixas de
+    posições que cruzam a área, sem varrer o DataFrame.
+    """
+    frame = df.dropna(subset=['latitude', 'longitude'])[SPATIAL_COLUMNS]
+    width = int(np.ceil(360 / cell_degrees)) + 1
+    i, j = _cell_rows_cols(frame['latitude'], frame['longitude'], cell_degrees)
+    keys = i * width + j
+    order = np.argsort(keys, kind='stable')
+    frame = frame.take(order).reset_index(drop=True)
+    rating = frame['aggregate_rating'].to_numpy(dtype='float64')
+    by_rating = np.argsort(-rating, kind='stable')
+    return {
+        'cell_degrees': cell_degrees,
+        'width': width,
+        'keys': keys[order],
+        'frame': frame,
+        'lat': frame['latitude'].to_numpy(dtype='float64'),
+        'lon': frame['longitude'].to_numpy(dtype='float64'),
+        'rating': rating,
+        'votes': frame['votes'].to_numpy(dtype='int64'),
+        'cuisines': frame['cuisines'].to_numpy(dtype=object),
+        # Pré-filtros da busca dos mais próximos: posições por nota
+        # (decrescente, com a nota negativa em ordem crescente para a busca
+        # binária) e por culinária
+        'by_rating': by_rating,
+        'neg_rating_sorted': -rating[by_rating],
+        'cuisine_positions': frame.groupby('cuisines', observed=True).indices,
+        # Centro de referência de cada cidade para o seletor da página
+        'city_centers': frame.groupby('city', observed=True)[['latitude', 'longitude']].median()
+    }
+
+# =====================================================================
+# CONSULTAS
+# =====================================================================
+
+
+def haversine_km(lat, lon, lats, lons):
+    """
+    Distância (km) pela fórmula de haversine entre um ponto e vários pontos.
+    """
+    lat, lon, lats, lons = map(np.radians, (lat, lon, lats, lons))
+    a = (np.sin((lats - lat) / 2) ** 2 +
+         np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def query_bbox(index, south, west, north, east):
+    """
+    Posições (no frame do índice) dos restaurantes dentro do bounding box.
+    Com west > east, o retângulo cruza o antimeridiano.
+    """
+    if west > east:
+        return np.concatenate([query_bbox(index, south, west, north, 180),
+                               query_bbox(index, south, -180, north, east)])
+    south, north = max(south, -90), min(north, 90)
+    west, east = max(west, -180), min(east, 180)
+    (i0, i1), (j0, j1) = _cell_rows_cols([south, north], [west, east], index['cell_degrees'])
+
+    # Uma faixa contígua de posições por linha da grade
+    rows = np.arange(i0, i1 + 1) * index['width']
+    starts = np.searchsorted(index['keys'], rows + j0, side='left')
+    ends = np.searchsorted(index['keys'], rows + j1, side='right')
+    candidates = np.concatenate(
+        [np.arange(s, e) for s, e in zip(starts, ends) if e > s] or [np.empty(0, dtype='int64')])
+
+    # Filtro exato apenas sobre as células candidatas
+    lat, lon = index['lat'][candidates], index['lon'][candidates]
+    inside = (lat >= south) & (lat <= north) & (lon >= west) & (lon <= east)
+    return candidates[inside]
+
+
+def lon_half_span(lat, radius_km):
+    """
+    Meia largura, em graus de longitude, da calota esférica de raio
+    `radius_km` centrada na latitude `lat`: asin(sin(r/R) / cos(lat)). É 180
+    (todas as longitudes) quando a calota alcança um polo ou r >= πR/2.
+    """
+    angle = radius_km / EARTH_RADIUS_KM
+    cos_lat = np.cos(np.radians(lat))
+    if angle >= np.pi / 2 or np.sin(angle) >= cos_lat:
+        return 180.0
+    return float(np.degrees(np.arcsin(np.sin(angle) / cos_lat)))
+
+
+def _lon_range(lon, dlon):
+    """
+    Oeste e leste de uma faixa de ±`dlon` graus em torno de `lon`.
+    """
+    if dlon >= 180:
+        return -180, 180
+    return (lon - dlon + 180) % 360 - 180, (lon + dlon + 180) % 360 - 180
+
+
+def query_radius(index, lat, lon, radius_km):
+    """
+    Posições e distâncias dos restaurantes a até `radius_km` do ponto,
+    ordenadas da mais próxima para a mais distante.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    west, east = _lon_range(lon, lon_half_span(lat, radius_km))
+    candidates = query_bbox(index, lat - dlat, west, lat + dlat, east)
+    distances = haversine_km(lat, lon, index['lat'][candidates], index['lon'][candidates])
+    inside = distances <= radius_km
+    candidates, distances = candidates[inside], distances[inside]
+    order = np.argsort(distances, kind='stable')
+    return candidates[order], distances[order]
+
+
+def filter_positions(index, cuisine=None, min_rating=0.0):
+    """
+    Posições dos restaurantes com nota >= `min_rating` e, se informada, da
+    culinária `cuisine`, pelos pré-filtros do índice (sem varrer o frame).
+    """
+    n_rated = np.searchsorted(index['neg_rating_sorted'], -min_rating, side='right')
+    if cuisine is None:
+        return index['by_rating'][:n_rated]
+    positions = index['cuisine_positions'].get(cuisine, np.empty(0, dtype='int64'))
+    if n_rated < len(index['by_rating']):
+        positions = positions[index['rating'][positions] >= min_rating]
+    return positions
+
+
+def nearest(index, lat, lon, k, cuisine=None, min_rating=0.0):
+    """
+    Os `k` restaurantes mais próximos do ponto com nota >= `min_rating` e,
+    se informada, da culinária `cuisine`. O raio de busca começa numa célula
+    e dobra até conter `k` resultados: tudo dentro do raio já foi examinado,
+    então os `k` mais próximos encontrados são exatos. Quando o raio já
+    examina tantos restaurantes quanto os que passam pelos filtros (poucos,
+    ou longe do ponto), as distâncias são calculadas direto sobre estes,
+    sem crescer o raio até o mundo inteiro.
+    """
+    candidates = filter_positions(index, cuisine, min_rating)
+    radius_km = index['cell_degrees'] * KM_PER_DEGREE
+    while True:
+        if radius_km >= np.pi * EARTH_RADIUS_KM:
+            positions = candidates
+            break
+        positions, distances = query_radius(index, lat, lon, radius_km)
+        if len(positions) >= len(candidates):
+            positions = candidates
+            break
+        mask = index['rating'][positions] >= min_rating
+        if cuisine is not None:
+            mask &= index['cuisines'][positions] == cuisine
+        positions, distances = positions[mask], distances[mask]
+        if len(positions) >= k:
+            break
+        radius_km *= 2
+    if positions is candidates:
+        distances = haversine_km(lat, lon, index['lat'][positions], index['lon'][positions])
+    # Desempate determinístico: distância, nota (maior), votos (mais votos)
+    # e, por fim, a posição na grade
+    order = np.lexsort((positions, -index['votes'][positions],
+                        -index['rating'][positions], distances))[:k]
+    return positions[order], distances[order]
+
+
+def take_rows(index, positions, distances=None):
+    """
+    Linhas do índice nas posições informadas, com a distância em km.
+    """
+    rows = index['frame'].take(positions)
+    if distances is not None:
+        rows = rows.assign(distancia_km=np.round(distances, 2))
+    return rows.reset_index(drop=True)
+
+
+def bbox_around(lat, lon, width_km, height_km):
+    """
+    Bounding box (sul, oeste, norte, leste) centralizado no ponto.
+    """
+    dlat = height_km / 2 / KM_PER_DEGREE
+    west, east = _lon_range(lon, lon_half_span(lat, width_km / 2))
+    return lat - dlat, west, lat + dlat, east
+
@@ -0,0 +1,128 @@
+"""
+Páginas do dashboard. Cada módulo expõe render(ctx) e importa as próprias
+dependências pesadas (folium na Main Page, altair nas demais), que só são
+carregadas quando a página é aberta pela primeira vez no processo.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import importlib
+
+import streamlit as st
+
+from fome_zero.export import EXPORT_FORMATS
+from fome_zero.render_cache import make_key, spec_nbytes, spec_rows
+
+# Módulo de cada página, pelo ID interno usado na navegação
+PAGE_MODULES = {
+    'main_page': 'fome_zero.views.main_page',
+    'countries_page': 'fome_zero.views.countries_page',
+    'cities_page': 'fome_zero.views.cities_page',
+    'cuisines_page': 'fome_zero.views.cuisines_page',
+    'nearby_page': 'fome_zero.views.nearby_page',
+    'search_page': 'fome_zero.views.search_page'
+}
+
+
+class PageContext:
+    """
+    Estado do rerun compartilhado com as páginas: motor de consultas,
+    instrumentação, cache de renderização, grade espacial, índice de busca e
+    exportação. A grade espacial e o índice de busca só são carregados
+    quando uma página os pede.
+    """
+
+    def __init__(self, page_id, engine, metrics, render_cache, fingerprint, query_engine,
+                 load_spatial_index, load_search_index, exporter):
+        self.page_id = page_id
+        self.engine = engine
+        self.metrics = metrics
+        self.render_cache = render_cache
+        self.fingerprint = fingerprint
+        self.query_engine = query_engine
+        self.loaders = {'spatial_index': load_spatial_index, 'search_index': load_search_index}
+        self.loaded = {}
+        self.exporter = exporter
+
+    def _load(self, name):
+        """
+        Carrega (uma vez por rerun, registrando a etapa 'load') o recurso
+        `name`, montado só pelas páginas que o usam.
+        """
+        if name not in self.loaded:
+            with self.metrics.stage('load', name):
+                self.loaded[name] = self.loaders[name]()
+        return self.loaded[name]
+
+    @property
+    def spatial_index(self):
+        return self._load('spatial_index')
+
+    @property
+    def search_index(self):
+        return self._load('search_index')
+
+    def render_key(self, name, selection):
+        """
+        Chave do cache de renderização de um elemento da página atual.
+        """
+        return make_key(self.page_id, name, dict(selection, engine=self.query_engine),
+                        self.fingerprint)
+
+    def show_chart(self, name, selection, build_chart):
+        """
+        Renderiza um gráfico Altair. A especificação Vega-Lite pronta de cada
+        seleção fica no cache de renderização: `build_chart` (que consulta o
+        motor e monta o alt.Chart) só roda numa falta. A etapa 'chart' mede
+        a consulta, a montagem e a serialização, e registra as linhas e o
+        tamanho da especificação enviada ao navegador.
+        """
+        with self.metrics.stage('chart', name) as info:
+            key = self.render_key(name, selection)
+            spec = self.render_cache.get(key)
+            if spec is None:
+                spec = chart_spec(build_chart())
+                self.render_cache.put(key, spec)
+            else:
+                info['name'] = f"{name} (cache)"
+            st.vega_lite_chart(spec=spec, use_container_width=True)
+        if self.metrics.enabled:
+            info['rows'] = spec_rows(spec)
+            info['bytes'] = spec_nbytes(spec)
+
+    def show_export(self, selection):
+        """
+        Link de download, na sidebar, das linhas da seleção atual da página
+        em CSV ou Parquet. O arquivo é gerado em partes pela rota de
+        downloads só quando o link é aberto.
+        """
+        with st.sidebar:
+            st.markdown("---")
+            st.markdown("## Exportar")
+            if self.exporter is None:
+                st.caption("Exportação indisponível nesta execução.")
+                return
+            fmt = st.radio("Formato", list(EXPORT_FORMATS), horizontal=True, key="export_format",
+                           format_func=str.upper)
+            url = self.exporter.url(self.render_key('export', selection), selection,
+                                    f"fome_zero_{self.page_id}", fmt)
+            st.link_button("⬇️ Baixar seleção", url, use_container_width=True)
+
+
+def chart_spec(chart):
+    """
+    Especificação Vega-Lite de um gráfico Altair, com os dados embutidos
+    (chart.to_dict()). Como no st.altair_chart, o tema padrão do Altair é
+    trocado por 'none': a largura e a altura fixas dele não valem no
+    Streamlit.
+    """
+    import altair as alt
+    if alt.theme.active != 'default':
+        return chart.to_dict()
+    with alt.theme.enable('none'):
+        return chart.to_dict()
+
+
+def render_page(ctx):
+    """
+    Importa (na primeira vez) e renderiza o módulo da página do contexto.
+    """
+    importlib.import_module(PAGE_MODULES[ctx.page_id]).render(ctx)
@@ -0,0 +1,103 @@
+# --- Importação das Bibliotecas Necessárias ---
+# O altair só é importado quando a página é aberta pela primeira vez
+import altair as alt
+import streamlit as st
+
+from fome_zero.ranking import top_n
+
+# =====================================================================
+# PÁGINA 3: CITIES (VISÃO CIDADES)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Rankings de cidades por quantidade, avaliação e diversidade culinária.
+    """
+    engine = ctx.engine
+
+    st.title("🏙️ Visão por Cidades")
+
+    # Filtros específicos para esta página
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("## Filtros")
+    unique_countries = engine.countries()
+    selected_countries = st.sidebar.multiselect(
+        "País(es)",
+        unique_countries,
+        default=unique_countries,
+        key="cities_filter"
+    )
+
+    # Os gráficos são calculados pelo motor de consultas
+    chart_selection = {'countries': selected_countries}
+    ctx.show_export(chart_selection)
+    restaurantes_por_cidade = engine.count_distinct(["city", "country"], selected_countries)
+
+    if not restaurantes_por_cidade.empty:
+        # Cada gráfico é montado por uma função chamada só quando a
+        # especificação não está no cache de renderização
+        # Gráfico 1: Top 10 Cidades com mais restaurantes
+        st.header("Top 10 Cidades com Mais Restaurantes")
+
+        def grafico_cidades_restaurantes():
+            df_top_cities = top_n(restaurantes_por_cidade, 10).reset_index().rename(
+                columns={"n_restaurants": "quantidade"})
+            return alt.Chart(df_top_cities).mark_bar().encode(
+                x=alt.X("city:N", title="Cidade", sort='-y'),
+                y=alt.Y("quantidade:Q", title="Quantidade de Restaurantes"),
+                color=alt.Color("country:N", title="País"),
+                tooltip=["city", "country", "quantidade"]
+            )
+        ctx.show_chart('grafico_cidades_restaurantes', chart_selection, grafico_cidades_restaurantes)
+
+        st.markdown("---")
+
+        # Gráficos de Avaliação por Cidade
+        st.header("Análise de Avaliação por Cidade")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Top 7 Cidades (Avaliação > 4.0)")
+
+            def grafico_acima_4():
+                df_acima_4 = top_n(engine.count_distinct(["city", "country"], selected_countries, "n_above_4"), 7).reset_index(
+                ).rename(columns={"n_above_4": "quantidade"})
+                return alt.Chart(df_acima_4).mark_bar().encode(
+                    x=alt.X("city:N", title="Cidade", sort='-y'),
+                    y=alt.Y("quantidade:Q", title="Qtd. Restaurantes"),
+                    color=alt.Color("country:N", title="País"),
+                    tooltip=["city", "country", "quantidade"]
+                )
+            ctx.show_chart('grafico_acima_4', chart_selection, grafico_acima_4)
+
+        with col2:
+            st.subheader("Top 7 Cidades (Avaliação < 2.5)")
+
+            def grafico_abaixo_2_5():
+                df_abaixo_2_5 = top_n(engine.count_distinct(["city", "country"], selected_countries, "n_below_2_5"), 7).reset_index(
+                ).rename(columns={"n_below_2_5": "quantidade"})
+                return alt.Chart(df_abaixo_2_5).mark_bar(color='#d62728').encode(
+                    x=alt.X("city:N", title="Cidade", sort='-y'),
+                    y=alt.Y("quantidade:Q", title="Qtd. Restaurantes"),
+                    color=alt.Color("country:N", title="País"),
+                    tooltip=["city", "country", "quantidade"]
+                )
+            ctx.show_chart('grafico_abaixo_2_5', chart_selection, grafico_abaixo_2_5)
+
+        st.markdown("---")
+
+        # Gráfico 3: Cidades com mais tipos de culinária
+        st.header("Top 10 Cidades com Maior Diversidade Culinária")
+
+        def chart_cities_cuisine_count():
+            df_cities_cuisine_count = top_n(engine.count_values(["city", "country"], "cuisines", selected_countries), 10).reset_index(
+            ).rename(columns={"cuisines": "quantidade"})
+            return alt.Chart(df_cities_cuisine_count).mark_bar().encode(
+                x=alt.X("city:N", title="Cidade", sort='-y'),
+                y=alt.Y("quantidade:Q", title="Tipos de Culinária Distintos"),
+                color=alt.Color("country:N", title="País"),
+                tooltip=["city", "country", "quantidade"]
+            )
+        ctx.show_chart('chart_cities_cuisine_count', chart_selection, chart_cities_cuisine_count)
+    else:
+        st.warning("Nenhum dado disponível para os filtros selecionados.")
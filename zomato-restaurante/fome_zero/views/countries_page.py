@@ -0,0 +1,107 @@
+# --- Importação das Bibliotecas Necessárias ---
+# O altair só é importado quando a página é aberta pela primeira vez
+import altair as alt
+import streamlit as st
+
+# =====================================================================
+# PÁGINA 2: COUNTRIES (VISÃO PAÍSES)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Quantidade de restaurantes e cidades, avaliações e custo médios por país.
+    """
+    engine = ctx.engine
+
+    st.title("🌍 Visão por Países")
+
+    # Filtros específicos para esta página
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("## Filtros")
+    unique_countries = engine.countries()
+    selected_countries = st.sidebar.multiselect(
+        "País(es)",
+        unique_countries,
+        default=unique_countries,
+        key="countries_filter"
+    )
+    qtd_por_pais = st.sidebar.slider(
+        "Qtd. de Restaurantes por país", 1, 10, 3, key="countries_top_per_group")
+
+    # Os gráficos são calculados pelo motor de consultas
+    chart_selection = {'countries': selected_countries}
+    ctx.show_export(chart_selection)
+    restaurantes_por_pais = engine.count_distinct("country", selected_countries)
+
+    if not restaurantes_por_pais.empty:
+        # Cada gráfico é montado por uma função chamada só quando a
+        # especificação não está no cache de renderização
+        # Gráfico 1: Restaurantes por País
+        def grafico_paises():
+            df_paises = restaurantes_por_pais.reset_index().rename(
+                columns={"n_restaurants": "quantidade"}).sort_values(by="quantidade", ascending=False)
+            return alt.Chart(df_paises).mark_bar().encode(
+                x=alt.X("country:N", title="País", sort="-y"),
+                y=alt.Y("quantidade:Q", title="Quantidade de Restaurantes"),
+                tooltip=["country", "quantidade"]
+            ).properties(title="Quantidade de Restaurantes por País")
+        ctx.show_chart('grafico_paises', chart_selection, grafico_paises)
+
+        st.markdown("---")
+
+        # Gráfico 2: Cidades por País
+        def grafico_cidades():
+            df_cidades_por_pais = engine.count_values("country", "city", selected_countries).reset_index(
+            ).rename(columns={"city": "quantidade"}).sort_values(by="quantidade", ascending=False)
+            return alt.Chart(df_cidades_por_pais).mark_bar().encode(
+                x=alt.X("country:N", title="País", sort="-y"),
+                y=alt.Y("quantidade:Q", title="Quantidade de Cidades"),
+                tooltip=["country", "quantidade"]
+            ).properties(title="Quantidade de Cidades Registradas por País")
+        ctx.show_chart('grafico_cidades', chart_selection, grafico_cidades)
+
+        st.markdown("---")
+
+        # Gráficos de Média
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("##### Média de Avaliações por País")
+
+            def grafico_media_avaliacoes():
+                df_avg_votes = engine.mean('country', 'votes', selected_countries).round(
+                    2).sort_values(ascending=False).reset_index()
+                return alt.Chart(df_avg_votes).mark_bar().encode(
+                    x=alt.X("country:N", title="País", sort='-y'),
+                    y=alt.Y("votes:Q", title="Média de Avaliações"),
+                    tooltip=["country", alt.Tooltip("votes:Q", format=".2f")]
+                )
+            ctx.show_chart('grafico_media_avaliacoes', chart_selection, grafico_media_avaliacoes)
+
+        with col2:
+            st.markdown("##### Média de Custo (Prato p/ 2) por País")
+
+            def grafico_media_preco():
+                df_avg_cost = engine.mean('country', 'average_cost_for_two', selected_countries).round(
+                    2).sort_values(ascending=False).reset_index()
+                return alt.Chart(df_avg_cost).mark_bar(color='#ff7f0e').encode(
+                    x=alt.X("country:N", title="País", sort='-y'),
+                    y=alt.Y("average_cost_for_two:Q",
+                            title="Preço Médio (Prato para Dois)"),
+                    tooltip=["country", alt.Tooltip(
+                        "average_cost_for_two:Q", format=".2f")]
+                )
+            ctx.show_chart('grafico_media_preco', chart_selection, grafico_media_preco)
+
+        st.markdown("---")
+
+        # Tabela: melhores restaurantes de cada país selecionado
+        st.header(f"Top {qtd_por_pais} Restaurantes de Cada País")
+        df_top_por_pais = engine.top_per_group(
+            selected_countries, None, qtd_por_pais, "country", [
+                "country", "restaurant_name", "city", "cuisines",
+                "aggregate_rating", "votes"
+            ])
+        st.dataframe(df_top_por_pais, use_container_width=True, hide_index=True)
+    else:
+        st.warning("Nenhum dado disponível para os filtros selecionados.")
@@ -0,0 +1,103 @@
+# --- Importação das Bibliotecas Necessárias ---
+# O altair só é importado quando a página é aberta pela primeira vez
+import altair as alt
+import streamlit as st
+
+from fome_zero.ranking import top_n
+
+# =====================================================================
+# PÁGINA 4: CUISINES (VISÃO CULINÁRIAS)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Restaurantes mais bem avaliados e notas médias por culinária.
+    """
+    engine = ctx.engine
+
+    st.title("🍜 Visão por Culinárias")
+
+    # Filtros na sidebar
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("## Filtros")
+        country_list = engine.countries()
+        selected_countries = st.multiselect(
+            "Países", country_list, default=country_list)
+
+        qtd_restaurantes = st.slider(
+            "Qtd. de Restaurantes para exibir", 1, 20, 10)
+
+        qtd_por_culinaria = st.slider(
+            "Qtd. de Restaurantes por culinária", 1, 10, 3, key="cuisines_top_per_group")
+
+        cuisine_list = engine.cuisines()
+        selected_cuisines = st.multiselect(
+            "Tipos de Culinária", cuisine_list, default=cuisine_list)
+
+    # Aplica filtros
+    chart_selection = {'countries': selected_countries, 'cuisines': selected_cuisines}
+    ctx.show_export(chart_selection)
+    df_top_n_restaurantes = engine.top_restaurants(
+        selected_countries, selected_cuisines, qtd_restaurantes, [
+            "restaurant_name", "country", "city", "cuisines",
+            "aggregate_rating", "average_cost_for_two", "votes"
+        ])
+
+    if not df_top_n_restaurantes.empty:
+        # Métricas: Melhores restaurantes por tipo de culinária principal
+        st.header(f"Top {qtd_restaurantes} Restaurantes Mais Bem Avaliados")
+        st.dataframe(df_top_n_restaurantes, use_container_width=True)
+
+        st.markdown("---")
+
+        # Gráficos de melhores e piores culinárias
+        st.header("Análise da Avaliação Média por Culinária")
+        col1, col2 = st.columns(2)
+
+        # Cada gráfico é montado por uma função chamada só quando a
+        # especificação não está no cache de renderização
+        with col1:
+            st.markdown("##### Top 10 Melhores Culinárias")
+
+            def chart_melhores():
+                df_melhores_cuisines = top_n(engine.mean("cuisines", "aggregate_rating", selected_countries, selected_cuisines),
+                                             10).rename("nota_media").reset_index()
+                return alt.Chart(df_melhores_cuisines).mark_bar().encode(
+                    y=alt.Y("cuisines:N", sort='-x', title="Tipo de Culinária"),
+                    x=alt.X("nota_media:Q", scale=alt.Scale(
+                        domain=[0, 5]), title="Média da Avaliação"),
+                    tooltip=[alt.Tooltip("cuisines"), alt.Tooltip(
+                        "nota_media", format=".2f")]
+                )
+            ctx.show_chart('chart_melhores', chart_selection, chart_melhores)
+
+        with col2:
+            st.markdown("##### Top 10 Piores Culinárias")
+
+            def chart_piores():
+                # Considera apenas notas > 0 para não pegar 'unknown' ou erros
+                df_piores_cuisines = top_n(engine.mean("cuisines", "aggregate_rating", selected_countries, selected_cuisines,
+                                                       rated_only=True), 10, ascending=True).rename("nota_media").reset_index()
+                return alt.Chart(df_piores_cuisines).mark_bar(color='#d62728').encode(
+                    y=alt.Y("cuisines:N", sort='x', title="Tipo de Culinária"),
+                    x=alt.X("nota_media:Q", scale=alt.Scale(
+                        domain=[0, 5]), title="Média da Avaliação"),
+                    tooltip=[alt.Tooltip("cuisines"), alt.Tooltip(
+                        "nota_media", format=".2f")]
+                )
+            ctx.show_chart('chart_piores', chart_selection, chart_piores)
+
+        st.markdown("---")
+
+        # Tabela: melhores restaurantes de cada culinária selecionada
+        st.header(f"Top {qtd_por_culinaria} Restaurantes de Cada Culinária")
+        df_top_por_culinaria = engine.top_per_group(
+            selected_countries, selected_cuisines, qtd_por_culinaria, "cuisines", [
+                "cuisines", "restaurant_name", "country", "city",
+                "aggregate_rating", "votes"
+            ])
+        st.dataframe(df_top_por_culinaria, use_container_width=True, hide_index=True)
+    else:
+        st.warning("Nenhum dado disponível para os filtros selecionados.")
@@ -0,0 +1,319 @@
+# --- Importação das Bibliotecas Necessárias ---
+# O folium só é importado quando a página é aberta pela primeira vez
+import folium
+from folium.plugins import MarkerCluster
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+# =====================================================================
+# FUNÇÕES AUXILIARES DE LÓGICA
+# =====================================================================
+
+
+def get_rating_color(rating):
+    """
+    Retorna uma cor com base na nota de avaliação para usar nos marcadores do mapa Folium.
+    """
+    if rating >= 4.5:
+        return 'green'
+    elif rating >= 3.5:
+        return 'lightgreen'
+    elif rating >= 2.5:
+        return 'orange'
+    else:
+        return 'red'
+
+# =====================================================================
+# FUNÇÕES DO MAPA (NÍVEL DE DETALHE)
+# =====================================================================
+
+
+# Teto de pontos desenhados nos modos leves do mapa. Cada ponto vira um
+# CircleMarker com tooltip curto (~1 KB de HTML/JS), então o mapa enviado
+# ao navegador fica abaixo de MAP_PAYLOAD_CEILING_BYTES mesmo com todos os
+# países selecionados.
+MAP_MAX_POINTS = 1000
+MAP_PAYLOAD_CEILING_BYTES = 1_500_000
+MAP_WIDTH_PX = 1200
+MAP_HEIGHT_PX = 500
+
+# Colunas que o mapa e a tabela de detalhes usam
+MAP_COLUMNS = ["restaurant_id", "restaurant_name", "city", "cuisines",
+               "aggregate_rating", "votes", "currency", "average_cost_for_two",
+               "latitude", "longitude"]
+
+MAP_MODES = ["Clusters (nível de detalhe)",
+             "Amostra limitada", "Todos os marcadores"]
+
+
+def get_viewport_bounds(center, zoom, width_px=MAP_WIDTH_PX, height_px=MAP_HEIGHT_PX):
+    """
+    Aproxima o bounding box (sul, oeste, norte, leste) visível num mapa
+    centralizado em `center` com o nível de zoom informado. É um viewport
+    simulado: o components.html não devolve ao Python o zoom nem os limites
+    do mapa, então arrastar ou dar zoom no próprio mapa não muda os pontos
+    enviados; só os controles da barra lateral mudam.
+    """
+    lat, lon = center
+    deg_per_px = 360 / (256 * 2 ** zoom)
+    half_lon = width_px * deg_per_px / 2
+    half_lat = height_px * deg_per_px / 2 * np.cos(np.radians(lat))
+    return (max(lat - half_lat, -90), max(lon - half_lon, -180),
+            min(lat + half_lat, 90), min(lon + half_lon, 180))
+
+
+def filter_viewport(df, bounds):
+    """
+    Mantém apenas os restaurantes dentro do bounding box informado.
+    """
+    south, west, north, east = bounds
+    mask = (df['latitude'].between(south, north) &
+            df['longitude'].between(west, east))
+    return df[mask]
+
+
+def get_cell_size(df, zoom, max_points=MAP_MAX_POINTS):
+    """
+    Define o tamanho (em graus) da célula da grade de clusters: ~32 px no zoom
+    atual, dobrando até que o número de células caiba em `max_points`.
+    """
+    cell_size = 360 / 2 ** (zoom + 3)
+    while True:
+        cells = pd.DataFrame({
+            'i': np.floor(df['latitude'].to_numpy() / cell_size),
+            'j': np.floor(df['longitude'].to_numpy() / cell_size)
+        })
+        if len(cells.drop_duplicates()) <= max_points:
+            return cell_size
+        cell_size *= 2
+
+
+def assign_cells(df, cell_size):
+    """
+    Retorna a chave da célula da grade ("i:j") de cada restaurante.
+    """
+    i = np.floor(df['latitude'].to_numpy() / cell_size).astype('int64')
+    j = np.floor(df['longitude'].to_numpy() / cell_size).astype('int64')
+    return pd.Series(i.astype(str), index=df.index).str.cat(j.astype(str), sep=':')
+
+
+def build_map_clusters(df, cell_size):
+    """
+    Agrega os restaurantes na grade e retorna um centróide por célula com
+    quantidade, nota média e cidade de referência, indexado pela célula.
+    """
+    clusters = df.assign(cell=assign_cells(df, cell_size)).groupby('cell').agg(
+        latitude=('latitude', 'mean'),
+        longitude=('longitude', 'mean'),
+        quantidade=('restaurant_id', 'count'),
+        aggregate_rating=('aggregate_rating', 'mean'),
+        city=('city', 'first')
+    )
+    clusters['label'] = (clusters['city'].astype(str) + " · " +
+                         clusters['quantidade'].astype(str) + " restaurantes")
+    return clusters.sort_values(by='quantidade', ascending=False)
+
+
+def sample_map_points(df, max_points=MAP_MAX_POINTS):
+    """
+    Retorna uma amostra determinística de no máximo `max_points` restaurantes.
+    """
+    if len(df) > max_points:
+        df = df.sample(n=max_points, random_state=42)
+    df = df.assign(quantidade=1)
+    df['label'] = (df['restaurant_name'].astype(str) + " (" +
+                   df['city'].astype(str) + ")")
+    return df
+
+
+def build_map_points(df, map_mode, center, zoom):
+    """
+    Pontos dos modos leves do mapa dentro do viewport: a amostra de
+    restaurantes ou os centróides da grade de clusters.
+    """
+    df_view = filter_viewport(df, get_viewport_bounds(center, zoom))
+    if map_mode == "Amostra limitada":
+        return sample_map_points(df_view)
+    return build_map_clusters(df_view, get_cell_size(df_view, zoom))
+
+
+def build_lod_map(points, center, zoom):
+    """
+    Desenha os pontos (centróides ou amostra) como CircleMarkers leves, sem
+    popup: os detalhes são carregados sob demanda abaixo do mapa.
+    """
+    zomato_map = folium.Map(location=center, zoom_start=zoom)
+    for row in points.itertuples(index=False):
+        folium.CircleMarker(
+            location=[row.latitude, row.longitude],
+            radius=4 + 2 * np.log2(row.quantidade),
+            color=get_rating_color(row.aggregate_rating),
+            fill=True,
+            fill_opacity=0.7,
+            tooltip=f"{row.label} · nota {row.aggregate_rating:.1f}"
+        ).add_to(zomato_map)
+    return zomato_map
+
+
+def build_full_map(df_map_data, center, zoom):
+    """
+    Modo completo: um folium.Marker com popup HTML por restaurante.
+    """
+    zomato_map = folium.Map(location=center, zoom_start=zoom)
+    marker_cluster = MarkerCluster().add_to(zomato_map)
+
+    # Adiciona marcadores ao cluster
+    for _, row in df_map_data.iterrows():
+        popup_html = f"""
+        <b>{row['restaurant_name']}</b><br>
+        Culinária: {row['cuisines']}<br>
+        Avaliação: {row['aggregate_rating']}/5.0 ({row['votes']:.0f} votos)<br>
+        Custo p/ dois: {row['currency']} {row['average_cost_for_two']:.2f}
+        """
+        folium.Marker(
+            location=[row['latitude'], row['longitude']],
+            popup=folium.Popup(popup_html, max_width=300),
+            icon=folium.Icon(color=get_rating_color(
+                row['aggregate_rating']), icon='cutlery', prefix='fa')
+        ).add_to(marker_cluster)
+    return zomato_map
+
+# =====================================================================
+# PÁGINA 1: MAIN PAGE (VISÃO GERAL)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Métricas gerais e mapa de restaurantes.
+    """
+    engine = ctx.engine
+
+    st.title("🍽️ Fome Zero - Dashboard")
+    st.markdown(
+        "O Melhor lugar para encontrar seu mais novo restaurante favorito!")
+
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("## Filtros")
+    st.sidebar.markdown(
+        "Escolha o(s) País(es) que Deseja visualizar os Restaurantes")
+
+    # Filtro de país para a Main Page
+    unique_countries = engine.countries()
+    selected_countries = st.sidebar.multiselect(
+        "País(es)",
+        unique_countries,
+        default=unique_countries
+    )
+
+    ctx.show_export({'countries': selected_countries})
+
+    # Aplica o filtro de país
+    df_filtered = engine.rows(selected_countries, columns=MAP_COLUMNS)
+    metrics = engine.metrics(selected_countries)
+
+    st.header("📊 Métricas Gerais")
+
+    # Exibe as métricas em colunas
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Restaurantes", f"{metrics['restaurants']:.0f}")
+    with col2:
+        st.metric("Países", f"{metrics['countries']}")
+    with col3:
+        st.metric("Cidades", f"{metrics['cities']}")
+    with col4:
+        st.metric("Avaliações", f"{metrics['votes']:,}")
+    with col5:
+        st.metric("Culinárias", f"{metrics['cuisines']}")
+
+    st.markdown("---")
+
+    # Mapa de Restaurantes com Folium
+    st.header("📍 Mapa de Restaurantes")
+    df_map_data = df_filtered.dropna(subset=['latitude', 'longitude']).copy()
+
+    if not df_map_data.empty:
+        # Controles do mapa: modo, zoom e centro definem o nível de detalhe
+        # e o bounding box enviados ao navegador (viewport simulado, ver
+        # get_viewport_bounds)
+        st.sidebar.markdown("## Mapa")
+        map_mode = st.sidebar.radio(
+            "Modo do mapa", MAP_MODES, index=0, key="map_mode")
+        map_zoom = st.sidebar.slider(
+            "Zoom do mapa", 1, 12, 2, key="map_zoom",
+            help="Define a área e o nível de detalhe carregados. O zoom e o "
+                 "arrasto feitos no próprio mapa não recarregam os pontos.")
+        map_city = st.sidebar.selectbox(
+            "Centralizar em",
+            ["Todos"] + sorted(df_map_data['city'].unique().tolist()),
+            key="map_city")
+
+        df_center = df_map_data if map_city == "Todos" else df_map_data[
+            df_map_data['city'] == map_city]
+        map_center = [df_center['latitude'].mean(),
+                      df_center['longitude'].mean()]
+
+        with ctx.metrics.stage('map', map_mode) as map_stage:
+            # HTML já gerado para a mesma seleção vem do cache de renderização
+            map_selection = {'countries': selected_countries, 'mode': map_mode,
+                             'zoom': map_zoom, 'city': map_city}
+            map_key = ctx.render_key('map', map_selection)
+            map_html = ctx.render_cache.get(map_key)
+            if map_mode == "Todos os marcadores":
+                if map_html is None:
+                    zomato_map = build_full_map(df_map_data, map_center, map_zoom)
+                map_stage['rows'] = len(df_map_data)
+            else:
+                # Os pontos também ficam no cache: num acerto, a amostra e o
+                # agrupamento em clusters não rodam de novo
+                points_key = ctx.render_key('map_points', map_selection)
+                map_points = ctx.render_cache.get(points_key)
+                if map_points is None:
+                    map_points = build_map_points(df_map_data, map_mode, map_center, map_zoom)
+                    ctx.render_cache.put(points_key, map_points)
+                if map_html is None:
+                    zomato_map = build_lod_map(map_points, map_center, map_zoom)
+                map_stage['rows'] = len(map_points)
+
+            if map_html is None:
+                map_html = zomato_map._repr_html_()
+                ctx.render_cache.put(map_key, map_html)
+            else:
+                map_stage['name'] = f"{map_mode} (cache)"
+
+            # Renderiza o mapa no Streamlit
+            components.html(map_html, height=MAP_HEIGHT_PX, scrolling=True)
+
+            payload_bytes = len(map_html.encode('utf-8'))
+            map_stage['bytes'] = payload_bytes
+        st.caption(f"Payload do mapa: {payload_bytes / 1024:,.0f} KB")
+        if payload_bytes > MAP_PAYLOAD_CEILING_BYTES:
+            st.warning(
+                "O mapa ultrapassou o teto de payload. Use o modo de clusters ou amostra.")
+
+        # Detalhes carregados sob demanda (apenas nos modos leves). As opções
+        # são os índices dos pontos (restaurante ou célula da grade), únicos
+        # mesmo quando dois pontos têm o mesmo rótulo
+        if map_mode != "Todos os marcadores" and not map_points.empty:
+            point_labels = map_points['label']
+            selected_point = st.selectbox(
+                "Ver detalhes de", [None] + point_labels.index.tolist(),
+                format_func=lambda x: "—" if x is None else point_labels[x],
+                key="map_details")
+            if selected_point is not None:
+                if map_mode == "Amostra limitada":
+                    df_details = map_points.loc[[selected_point]]
+                else:
+                    df_view = filter_viewport(
+                        df_map_data, get_viewport_bounds(map_center, map_zoom))
+                    cell_size = get_cell_size(df_view, map_zoom)
+                    df_details = df_view[assign_cells(df_view, cell_size) == selected_point]
+                st.dataframe(df_details[[
+                    "restaurant_name", "city", "cuisines", "aggregate_rating",
+                    "votes", "currency", "average_cost_for_two"
+                ]], use_container_width=True)
+    else:
+        st.info("Não há dados para exibir no mapa com os filtros selecionados.")
@@ -0,0 +1,123 @@
+# --- Importação das Bibliotecas Necessárias ---
+import time
+
+# O folium só é importado quando a página é aberta pela primeira vez
+import folium
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+
+from fome_zero.spatial_index import (bbox_around, haversine_km, nearest, query_bbox,
+                                     query_radius, take_rows)
+from fome_zero.views.main_page import MAP_HEIGHT_PX, build_lod_map, sample_map_points
+
+QUERY_MODES = ["Raio", "Retângulo"]
+RESULT_COLUMNS = ["restaurant_name", "city", "cuisines", "aggregate_rating", "votes",
+                  "currency", "average_cost_for_two", "distancia_km"]
+
+# =====================================================================
+# PÁGINA 5: NEARBY (RESTAURANTES PERTO DAQUI)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Restaurantes num raio ou retângulo em torno de um ponto e os mais
+    próximos bem avaliados de uma culinária, consultados pela grade espacial.
+    """
+    index = ctx.spatial_index
+    st.title("📍 Restaurantes Perto Daqui")
+
+    # Ponto de referência e área da consulta
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("## Ponto de Referência")
+        centers = index['city_centers']
+        city = st.selectbox("Cidade", centers.index.tolist(), key="nearby_city")
+        center_lat = st.number_input(
+            "Latitude", -90.0, 90.0, float(centers.loc[city, 'latitude']), format="%.5f")
+        center_lon = st.number_input(
+            "Longitude", -180.0, 180.0, float(centers.loc[city, 'longitude']), format="%.5f")
+
+        st.markdown("## Área")
+        query_mode = st.radio("Consulta", QUERY_MODES, key="nearby_mode", horizontal=True)
+        if query_mode == "Raio":
+            radius_km = st.slider("Raio (km)", 0.5, 50.0, 5.0, 0.5, key="nearby_radius")
+            extent_km = 2 * radius_km
+        else:
+            width_km = st.slider("Largura (km)", 1.0, 100.0, 10.0, 1.0, key="nearby_width")
+            height_km = st.slider("Altura (km)", 1.0, 100.0, 10.0, 1.0, key="nearby_height")
+            extent_km = max(width_km, height_km)
+
+        st.markdown("## Mais Próximos Bem Avaliados")
+        cuisine = st.selectbox(
+            "Culinária", ["Todas"] + ctx.engine.cuisines(), key="nearby_cuisine")
+        min_rating = st.slider("Nota mínima", 0.0, 5.0, 4.0, 0.1, key="nearby_min_rating")
+        qtd_nearest = st.slider("Qtd. de restaurantes", 1, 30, 10, key="nearby_k")
+
+    # Consultas pela grade espacial
+    start = time.perf_counter()
+    with ctx.metrics.stage('spatial', query_mode) as info:
+        if query_mode == "Raio":
+            positions, distances = query_radius(index, center_lat, center_lon, radius_km)
+        else:
+            bounds = bbox_around(center_lat, center_lon, width_km, height_km)
+            positions = query_bbox(index, *bounds)
+            distances = haversine_km(center_lat, center_lon,
+                                     index['lat'][positions], index['lon'][positions])
+            order = np.argsort(distances, kind='stable')
+            positions, distances = positions[order], distances[order]
+        info['rows'] = len(positions)
+    area_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ctx.metrics.stage('spatial', 'nearest') as info:
+        nearest_positions, nearest_distances = nearest(
+            index, center_lat, center_lon, qtd_nearest,
+            cuisine=None if cuisine == "Todas" else cuisine, min_rating=min_rating)
+        info['rows'] = len(nearest_positions)
+    nearest_ms = (time.perf_counter() - start) * 1000
+
+    df_area = take_rows(index, positions, distances)
+    df_nearest = take_rows(index, nearest_positions, nearest_distances)
+
+    # Exporta os restaurantes da área consultada
+    ctx.show_export({'restaurant_ids': df_area['restaurant_id'].tolist()})
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Restaurantes na área", f"{len(df_area)}")
+        st.caption(f"Consulta na grade: {area_ms:.2f} ms")
+    with col2:
+        st.metric("Mais próximo bem avaliado",
+                  f"{df_nearest['distancia_km'].iloc[0]:.2f} km" if not df_nearest.empty else "—")
+        st.caption(f"Busca dos mais próximos: {nearest_ms:.2f} ms")
+
+    # Mapa da área: o ponto, o contorno da consulta e os restaurantes
+    with ctx.metrics.stage('map', f"nearby {query_mode}") as info:
+        points = sample_map_points(df_area)
+        # Zoom em que a área ocupa ~MAP_HEIGHT_PX pixels de altura
+        zoom = int(np.clip(np.log2(40075 * MAP_HEIGHT_PX / 256 / extent_km), 2, 16))
+        zomato_map = build_lod_map(points, [center_lat, center_lon], zoom)
+        folium.Marker([center_lat, center_lon], tooltip="Ponto de referência").add_to(zomato_map)
+        if query_mode == "Raio":
+            folium.Circle([center_lat, center_lon], radius=radius_km * 1000,
+                          color='#1f77b4', fill=False).add_to(zomato_map)
+        else:
+            south, west, north, east = bounds
+            folium.Rectangle([[south, west], [north, east]],
+                             color='#1f77b4', fill=False).add_to(zomato_map)
+        map_html = zomato_map._repr_html_()
+        components.html(map_html, height=MAP_HEIGHT_PX, scrolling=True)
+        info['rows'] = len(points)
+        info['bytes'] = len(map_html.encode('utf-8'))
+
+    st.header(f"Top {qtd_nearest} Mais Próximos com Nota ≥ {min_rating:.1f}"
+              + ("" if cuisine == "Todas" else f" ({cuisine})"))
+    st.dataframe(df_nearest[RESULT_COLUMNS], use_container_width=True, hide_index=True)
+
+    st.header("Restaurantes na Área")
+    if df_area.empty:
+        st.info("Nenhum restaurante na área selecionada.")
+    else:
+        st.dataframe(df_area[RESULT_COLUMNS], use_container_width=True, hide_index=True)
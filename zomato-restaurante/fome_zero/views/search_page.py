@@ -0,0 +1,50 @@
+# --- Importação das Bibliotecas Necessárias ---
+import time
+
+import streamlit as st
+
+from fome_zero.search_index import MIN_PREFIX_LENGTH, search
+
+MAX_RESULTS = 50
+
+# =====================================================================
+# PÁGINA 6: SEARCH (BUSCA INSTANTÂNEA)
+# =====================================================================
+
+
+def render(ctx):
+    """
+    Busca por nome do restaurante, localidade, cidade e culinária no índice
+    invertido montado junto com o snapshot. Cada termo vale como prefixo.
+    """
+    index, df_results = ctx.search_index
+    st.title("🔎 Busca de Restaurantes")
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("## Busca")
+        qtd_results = st.slider("Qtd. de resultados", 5, MAX_RESULTS, 20, key="search_n")
+
+    query = st.text_input(
+        "Buscar", key="search_query", placeholder="Ex.: pizza new delhi, café são paulo",
+        help="Nome, localidade, cidade ou culinária. Cada palavra vale como prefixo.")
+    if len(query.strip()) < MIN_PREFIX_LENGTH:
+        st.info(f"Digite ao menos {MIN_PREFIX_LENGTH} letras para buscar.")
+        return
+
+    start = time.perf_counter()
+    with ctx.metrics.stage('search', 'query') as info:
+        positions, scores = search(index, query, qtd_results)
+        info['rows'] = len(positions)
+    search_ms = (time.perf_counter() - start) * 1000
+
+    st.caption(f"{len(positions)} resultado(s) em {search_ms:.2f} ms")
+    if len(positions) == 0:
+        st.info("Nenhum restaurante encontrado.")
+        return
+
+    df_page = df_results.take(positions).assign(relevancia=scores).reset_index(drop=True)
+    st.dataframe(df_page.drop(columns="restaurant_id"), use_container_width=True, hide_index=True)
+
+    # Exporta os restaurantes encontrados
+    ctx.show_export({'restaurant_ids': df_page['restaurant_id'].tolist()})
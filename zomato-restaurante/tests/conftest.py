@@ -0,0 +1,56 @@
+"""
+Fixtures compartilhadas pelos testes: o zomato.csv do repositório, limpo
+pelo mesmo pipeline do dashboard, serve de referência para conferir cada
+caminho rápido contra a expressão equivalente do pandas.
+
+Uso (a partir da pasta zomato-restaurante):
+    python -m pytest -q tests
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_CSV = os.path.join(APP_DIR, 'database', 'zomato.csv')
+
+sys.path.insert(0, APP_DIR)
+
+from fome_zero.data import preprocess_data  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def raw_df():
+    """
+    O zomato.csv bruto, como lido pelo dashboard.
+    """
+    return pd.read_csv(DATA_CSV)
+
+
+@pytest.fixture(scope='session')
+def df(raw_df):
+    """
+    O dataset limpo (etapas 1 a 9 de `preprocess_data`).
+    """
+    return preprocess_data(raw_df)
+
+
+@pytest.fixture(scope='session')
+def selections(df):
+    """
+    Seleções de países e culinárias como as da sidebar: todas, algumas,
+    uma só, nenhuma e valores que não existem no dataset.
+    """
+    countries = sorted(df['country'].unique())
+    cuisines = df['cuisines'].value_counts().index.tolist()
+    return [
+        (countries, None),
+        (countries[:3], None),
+        (['Brazil'], None),
+        ([], None),
+        (countries, cuisines[:5]),
+        (['India', 'Turkey', 'Atlantis'], ['Italian', 'Pizza', 'Inexistente']),
+        (['Brazil'], []),
+    ]
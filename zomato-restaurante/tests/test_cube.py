@@ -0,0 +1,66 @@
+"""
+Roll-ups do cubo de agregados (fome_zero.cube) contra o groupby sobre as
+linhas, e a atualização incremental contra o cubo montado do zero.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pandas as pd
+import pytest
+
+from fome_zero.cube import CUBE_KEYS, build_cube, rollup_distinct, rollup_mean, total_distinct, update_cube
+
+KEYS = [['country'], ['country', 'city'], ['cuisines'], ['country', 'cuisines']]
+
+
+def _assert_series_equal(result, expected):
+    pd.testing.assert_series_equal(result, expected, check_names=False, check_dtype=False,
+                                   check_index_type=False)
+
+
+@pytest.mark.parametrize('keys', KEYS)
+def test_rollup_distinct_matches_groupby(df, keys):
+    cube = build_cube(df)
+    ids = df['restaurant_id']
+    for measure, rows in [('n_restaurants', df),
+                          ('n_above_4', df[df['aggregate_rating'] > 4.0]),
+                          ('n_below_2_5', df[df['aggregate_rating'] < 2.5])]:
+        expected = rows.groupby(keys)['restaurant_id'].nunique()
+        _assert_series_equal(rollup_distinct(cube, keys, measure), expected)
+    assert total_distinct(cube) == ids.nunique()
+
+
+@pytest.mark.parametrize('keys', KEYS)
+def test_rollup_mean_matches_groupby(df, keys):
+    cube = build_cube(df)
+    grouped = df.groupby(keys)
+    _assert_series_equal(rollup_mean(cube, keys, 'rating_sum'), grouped['aggregate_rating'].mean())
+    _assert_series_equal(rollup_mean(cube, keys, 'cost_sum'), grouped['average_cost_for_two'].mean())
+    _assert_series_equal(cube.groupby(keys)['votes_sum'].sum(), grouped['votes'].sum())
+
+    # Média só dos restaurantes avaliados (nota > 0)
+    rated = df[df['aggregate_rating'] > 0].groupby(keys)['aggregate_rating'].mean()
+    _assert_series_equal(rollup_mean(cube, keys, 'rating_sum_rated', 'n_rated'), rated)
+
+
+def test_rollup_distinct_with_shared_ids(df):
+    # Um restaurant_id em duas células obriga o cubo a guardar os IDs
+    shared = df.copy()
+    shared.loc[shared.index[:50], 'restaurant_id'] = shared['restaurant_id'].iloc[-1]
+    cube = build_cube(shared)
+    expected = shared.groupby('country')['restaurant_id'].nunique()
+    _assert_series_equal(rollup_distinct(cube, ['country']), expected)
+    assert total_distinct(cube) == shared['restaurant_id'].nunique()
+
+
+def test_update_cube_matches_rebuild(df):
+    # Troca a nota de algumas linhas e acrescenta outras, como um delta
+    rng = np.random.default_rng(0)
+    keep = np.ones(len(df), dtype=bool)
+    keep[rng.choice(len(df), 200, replace=False)] = False
+    updated = df[~keep].assign(aggregate_rating=rng.uniform(0, 5, (~keep).sum()).round(1))
+    added = df.sample(100, random_state=0).assign(
+        restaurant_id=df['restaurant_id'].max() + 1 + np.arange(100))
+    new_df = pd.concat([df[keep], updated, added], ignore_index=True)
+
+    changed = pd.concat([df[~keep][CUBE_KEYS], new_df.iloc[int(keep.sum()):][CUBE_KEYS]])
+    pd.testing.assert_frame_equal(update_cube(build_cube(df), new_df, changed), build_cube(new_df))
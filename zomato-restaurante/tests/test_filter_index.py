@@ -0,0 +1,23 @@
+"""
+Filtros por bitmaps (fome_zero.filter_index) contra as máscaras booleanas
+do pandas.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import pandas as pd
+
+from fome_zero.filter_index import build_filter_index, filter_rows, get_values
+
+
+def test_filter_rows_matches_boolean_mask(df, selections):
+    index = build_filter_index(df)
+    for countries, cuisines in selections:
+        mask = df['country'].isin(countries)
+        if cuisines is not None:
+            mask &= df['cuisines'].isin(cuisines)
+        pd.testing.assert_frame_equal(filter_rows(df, index, countries, cuisines), df[mask])
+
+
+def test_get_values_matches_unique(df):
+    index = build_filter_index(df)
+    assert get_values(index, 'country') == sorted(df['country'].unique())
+    assert get_values(index, 'cuisines') == sorted(df['cuisines'].unique())
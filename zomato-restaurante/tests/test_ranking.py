@@ -0,0 +1,50 @@
+"""
+Listas de ranking pré-calculadas e seleção parcial (fome_zero.ranking)
+contra sort_values().head().
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pandas as pd
+import pytest
+
+from fome_zero.filter_index import build_filter_index, filter_rows
+from fome_zero.ranking import build_rank_index, top_n, top_positions, top_positions_per_group
+
+# Ordem do ranking: nota e votos (maiores primeiro), restaurant_id como desempate
+RANK_ORDER = ['aggregate_rating', 'votes', 'restaurant_id']
+RANK_ASCENDING = [False, False, True]
+
+
+@pytest.mark.parametrize('n', [1, 10, 50])
+def test_top_positions_matches_sort_values(df, selections, n):
+    index = build_rank_index(df)
+    filter_index = build_filter_index(df)
+    for countries, cuisines in selections:
+        rows = filter_rows(df, filter_index, countries, cuisines)
+        expected = rows.sort_values(RANK_ORDER, ascending=RANK_ASCENDING).head(n)
+        positions = top_positions(index, countries, cuisines, n)
+        assert df['restaurant_id'].iloc[positions].tolist() == expected['restaurant_id'].tolist()
+
+
+@pytest.mark.parametrize('by', ['country', 'cuisines'])
+@pytest.mark.parametrize('n', [1, 10])
+def test_top_positions_per_group_matches_sort_values(df, selections, by, n):
+    index = build_rank_index(df)
+    filter_index = build_filter_index(df)
+    for countries, cuisines in selections:
+        rows = filter_rows(df, filter_index, countries, cuisines)
+        rows = rows.sort_values([by] + RANK_ORDER, ascending=[True] + RANK_ASCENDING)
+        expected = rows.groupby(by, sort=False).head(n)
+        positions = top_positions_per_group(index, countries, cuisines, n, by)
+        assert df['restaurant_id'].iloc[positions].tolist() == expected['restaurant_id'].tolist()
+
+
+@pytest.mark.parametrize('ascending', [False, True])
+@pytest.mark.parametrize('n', [1, 5, 10, 1000])
+def test_top_n_matches_sort_values(df, ascending, n):
+    # Séries agregadas como as das páginas, com empates e um valor nulo
+    for series in [df.groupby('country')['restaurant_id'].nunique(),
+                   df.groupby('cuisines')['aggregate_rating'].mean().round(1),
+                   pd.Series([3.0, np.nan, 3.0, 1.0, 5.0, 3.0], index=list('abcdef'))]:
+        expected = series.sort_values(ascending=ascending, kind='stable').head(n)
+        pd.testing.assert_series_equal(top_n(series, n, ascending), expected)
@@ -0,0 +1,65 @@
+"""
+Contagens distintas aproximadas (fome_zero.sketch) contra o nunique()
+exato: cada estimativa fica dentro de três erros padrão do valor real.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import numpy as np
+import pytest
+
+from fome_zero.sketch import (SKETCH_GROUPS, build_registers, build_sketches, estimate, hash_values,
+                              standard_error)
+
+# Erros padrão de tolerância; contagens pequenas saem da contagem linear e
+# podem errar por uma unidade mesmo abaixo do erro relativo
+TOLERANCE = 3
+SLACK = 1
+
+
+def _assert_within_bounds(estimates, exact, precision):
+    bound = TOLERANCE * standard_error(precision) * exact + SLACK
+    assert np.all(np.abs(estimates - exact) <= bound), (estimates, exact)
+
+
+@pytest.mark.parametrize('keys', list(SKETCH_GROUPS))
+def test_group_estimates_within_error(df, keys):
+    precision, columns = SKETCH_GROUPS[keys]
+    sketch = build_sketches(df)[keys]
+    grouped = df.groupby(list(keys))
+    for column in columns:
+        if column == 'id_above_4':
+            exact = df[df['aggregate_rating'] > 4.0].groupby(list(keys))['restaurant_id'].nunique()
+        elif column == 'id_below_2_5':
+            exact = df[df['aggregate_rating'] < 2.5].groupby(list(keys))['restaurant_id'].nunique()
+        else:
+            exact = grouped[column].nunique()
+        exact = exact.reindex(sketch['groups'], fill_value=0).to_numpy()
+        _assert_within_bounds(estimate(sketch['registers'][column]), exact, precision)
+
+
+def test_union_of_countries_within_error(df):
+    precision, columns = SKETCH_GROUPS[('country',)]
+    sketch = build_sketches(df)[('country',)]
+    countries = sketch['groups']
+    for selected in [countries, countries[:3], countries[::2]]:
+        mask = np.asarray(countries.isin(selected))
+        rows = df[df['country'].isin(selected)]
+        for column in columns:
+            union = sketch['registers'][column][mask].max(axis=0)
+            _assert_within_bounds(estimate(union)[0], rows[column].nunique(), precision)
+
+
+@pytest.mark.parametrize('precision', [10, 14])
+@pytest.mark.parametrize('scale', [1, 20, 100])
+def test_large_counts_within_error(df, precision, scale):
+    # IDs do dataset replicados com deslocamento (como nos benchmarks): acima
+    # de ~2,5 * 2**precision valores a estimativa sai da contagem linear
+    ids = df['restaurant_id'].to_numpy(dtype='int64')
+    ids = (ids[None, :] + (int(ids.max()) + 1) * np.arange(scale)[:, None]).ravel()
+    hashes, _ = hash_values(ids)
+    registers = build_registers(np.zeros(len(ids), dtype='int64'), 1, hashes, precision)
+    _assert_within_bounds(estimate(registers)[0], len(np.unique(ids)), precision)
+
+
+def test_votes_are_exact(df):
+    votes = build_sketches(df)['votes']
+    assert votes.to_dict() == df.groupby('country')['votes'].sum().to_dict()
@@ -0,0 +1,60 @@
+"""
+Snapshot Arrow e derivados gravados em disco (fome_zero.snapshot): a
+leitura devolve exatamente o que o pipeline de limpeza gerou.
+"""
+# --- Importação das Bibliotecas Necessárias ---
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from conftest import DATA_CSV
+from fome_zero.cube import build_cube
+from fome_zero.search_index import build_search_index, read_search_index, write_search_index
+from fome_zero.snapshot import (SNAPSHOT_DIR, load_search_index, load_snapshot, load_snapshot_cube,
+                                read_snapshot, source_fingerprint, write_snapshot)
+
+
+def _assert_index_equal(index, expected):
+    assert index.keys() == expected.keys()
+    for key in expected:
+        assert np.array_equal(index[key], expected[key]), key
+
+
+def test_write_read_snapshot_round_trip(df, tmp_path):
+    path = str(tmp_path / 'zomato.arrow')
+    write_snapshot(df, path)
+    pd.testing.assert_frame_equal(read_snapshot(path), df)
+    columns = ['restaurant_id', 'country', 'aggregate_rating']
+    pd.testing.assert_frame_equal(read_snapshot(path, columns), df[columns])
+
+
+def test_search_index_round_trip(df, tmp_path):
+    index = build_search_index(df)
+    path = str(tmp_path / 'zomato.search.npz')
+    write_search_index(index, path)
+    _assert_index_equal(read_search_index(path), index)
+
+
+def test_load_snapshot_matches_pipeline(df, tmp_path):
+    csv_path = str(tmp_path / 'zomato.csv')
+    shutil.copy(DATA_CSV, csv_path)
+    fingerprint = source_fingerprint(csv_path)
+
+    # Primeira carga monta e grava o snapshot; a segunda só o lê
+    for _ in range(2):
+        pd.testing.assert_frame_equal(load_snapshot(csv_path, fingerprint), df)
+        pd.testing.assert_frame_equal(load_snapshot_cube(csv_path, fingerprint), build_cube(df))
+        _assert_index_equal(load_search_index(csv_path, fingerprint), build_search_index(df))
+    assert any(name.endswith('.arrow') for name in os.listdir(tmp_path / SNAPSHOT_DIR))
+
+
+def test_fingerprint_changes_with_source(tmp_path):
+    csv_path = str(tmp_path / 'zomato.csv')
+    shutil.copy(DATA_CSV, csv_path)
+    before = source_fingerprint(csv_path)
+    assert source_fingerprint(csv_path) == before
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write('\n')
+    assert source_fingerprint(csv_path) != before